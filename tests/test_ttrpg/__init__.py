@@ -0,0 +1 @@
+"""Tests for TTRPG utilities."""
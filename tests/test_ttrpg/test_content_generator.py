@@ -0,0 +1,72 @@
+"""Tests for ttrpg.content_generator module."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ttrpg.content_generator import (
+    LOCATION_FEATURES,
+    generate_dungeon,
+    generate_tavern,
+    generate_village,
+    weighted_sample,
+)
+
+
+def test_weighted_sample_returns_distinct_items():
+    """Test weighted sampling picks k distinct items."""
+    items = [("a", 1.0), ("b", 2.0), ("c", 3.0), ("d", 4.0)]
+
+    picked = weighted_sample(items, 3, random.Random(1))
+
+    assert len(picked) == 3
+    assert len(set(picked)) == 3
+
+
+def test_weighted_sample_skips_zero_weight():
+    """Test items with non-positive weight are never picked."""
+    items = [("never", 0.0), ("always", 1.0)]
+
+    for seed in range(20):
+        assert weighted_sample(items, 2, random.Random(seed)) == ["always"]
+
+
+def test_weighted_sample_favours_heavy_items():
+    """Test heavier items are picked more often."""
+    rng = random.Random(42)
+    items = [("rare", 0.1), ("common", 10.0)]
+
+    firsts = [weighted_sample(items, 1, rng)[0] for _ in range(200)]
+
+    assert firsts.count("common") > firsts.count("rare")
+
+
+def test_generate_tavern_is_reproducible():
+    """Test seeded taverns draw known features."""
+    first = generate_tavern(seed=7)
+    second = generate_tavern(seed=7)
+
+    assert first == second
+    assert set(first["features"]) <= set(LOCATION_FEATURES["tavern"])
+
+
+@pytest.mark.parametrize(
+    "generate, kind",
+    [(generate_tavern, "tavern"), (generate_dungeon, "dungeon"), (generate_village, "village")],
+)
+def test_location_features_are_distinct_known_features(generate, kind):
+    """Test each location draws three distinct features of its own kind."""
+    for seed in range(20):
+        features = generate(seed=seed)["features"]
+
+        assert len(features) == len(set(features)) == 3
+        assert set(features) <= set(LOCATION_FEATURES[kind])
+
+
+def test_tavern_features_follow_their_weights():
+    """Test a tavern's common features turn up more often than its rare ones."""
+    drawn = [feature for seed in range(300) for feature in generate_tavern(seed=seed)["features"]]
+
+    assert drawn.count("Has a roaring fireplace") > drawn.count("There's a secret room")
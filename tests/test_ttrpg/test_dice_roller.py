@@ -0,0 +1,72 @@
+"""Tests for ttrpg.dice_roller module."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ttrpg.dice_roller import (
+    NUMPY_MIN_DICE,
+    DiceRollerError,
+    parse_dice_notation,
+    roll_dice,
+)
+
+
+def test_parse_dice_notation():
+    """Test parsing of standard notation."""
+    assert parse_dice_notation("3d6+2") == (3, 6, 2, "")
+    assert parse_dice_notation("d20") == (1, 20, 0, "")
+    assert parse_dice_notation("4d6k3") == (4, 6, 0, "k3")
+
+
+def test_parse_dice_notation_invalid():
+    """Test invalid notation raises."""
+    with pytest.raises(DiceRollerError):
+        parse_dice_notation("three dice")
+
+
+def test_roll_dice_keep_highest():
+    """Test keep-highest keeps the largest dice and totals them."""
+    result = roll_dice(4, 6, modifier=1, keep_mode="kh3", seed=3)
+
+    assert len(result["kept_rolls"]) == 3
+    assert len(result["dropped_rolls"]) == 1
+    assert min(result["kept_rolls"]) >= max(result["dropped_rolls"])
+    assert result["total"] == sum(result["kept_rolls"]) + 1
+
+
+@pytest.mark.parametrize("num_dice", [3, NUMPY_MIN_DICE * 2])
+def test_roll_dice_totals_and_reproducibility(num_dice: int):
+    """Test totals match kept dice for small and large pools."""
+    result = roll_dice(num_dice, 8, modifier=-2, keep_mode="kl2", seed=11)
+
+    assert all(1 <= r <= 8 for r in result["rolls"])
+    assert result["total"] == sum(result["kept_rolls"]) - 2
+    assert all(isinstance(r, int) for r in result["rolls"])
+    assert roll_dice(num_dice, 8, modifier=-2, keep_mode="kl2", seed=11) == result
+
+
+def test_seeded_pool_ignores_size_and_numpy():
+    """Test a seeded pool rolls the same dice whatever its size or numpy setting."""
+    small = roll_dice(NUMPY_MIN_DICE - 1, 6, seed=5)["rolls"]
+
+    assert roll_dice(NUMPY_MIN_DICE, 6, seed=5)["rolls"][:-1] == small
+    assert roll_dice(NUMPY_MIN_DICE, 6, seed=5, allow_numpy=False)["rolls"][:-1] == small
+
+
+def test_import_does_not_load_numpy():
+    """Test numpy stays off the CLI startup path until a big pool is rolled."""
+    code = "import sys, ttrpg.dice_roller; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    ).stdout
+
+    assert out.strip() == "False"
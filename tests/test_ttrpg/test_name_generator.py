@@ -0,0 +1,127 @@
+"""Tests for ttrpg.name_generator module."""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ttrpg import name_generator
+from ttrpg.name_generator import (
+    NUMPY_MIN_NAMES,
+    SURNAME_PATTERNS,
+    generate_character_name,
+    generate_character_names,
+    generate_item_names,
+    generate_markov_name,
+    generate_place_names,
+)
+
+
+def test_generate_character_name_with_surname():
+    """Test single names get a known surname appended."""
+    name = generate_character_name("dwarf", "male", surname=True, seed=1)
+
+    first, last = name.split(" ")
+    assert first
+    assert last in SURNAME_PATTERNS
+
+
+def test_generate_character_names_batch():
+    """Test batch generation returns the requested number of names."""
+    names = generate_character_names("elf", num=50, seed=3)
+
+    assert len(names) == 50
+    assert all(isinstance(name, str) and name for name in names)
+
+
+def test_generate_character_names_reproducible():
+    """Test seeded batches are reproducible."""
+    first = generate_character_names("human", "female", num=10, surname=True, seed=9)
+    second = generate_character_names("human", "female", num=10, surname=True, seed=9)
+
+    assert first == second
+    assert all(name.split(" ")[1] in SURNAME_PATTERNS for name in first)
+
+
+def test_generate_markov_name():
+    """Test Markov names are reproducible and respect the length cap."""
+    names = [generate_markov_name("orc", seed=seed, max_length=8) for seed in range(20)]
+
+    assert names == [generate_markov_name("orc", seed=seed, max_length=8) for seed in range(20)]
+    assert all(0 < len(name) <= 8 and name[0].isupper() for name in names)
+
+
+@pytest.mark.parametrize("order", [1, 3])
+def test_generate_markov_name_order(order):
+    """Test Markov names with a chain order other than the default."""
+    name = generate_markov_name("elf", "female", seed=7, order=order)
+
+    assert name
+    assert name == generate_markov_name("elf", "female", seed=7, order=order)
+
+
+def test_batch_generators_draw_from_given_rng():
+    """Test an explicit Random matches seed= and leaves global state alone."""
+    random.seed(0)
+    state = random.getstate()
+
+    for func in (generate_place_names, generate_item_names):
+        assert func(num=8, rng=random.Random(5)) == func(num=8, seed=5)
+    assert generate_character_names("orc", num=8, rng=random.Random(5)) == (
+        generate_character_names("orc", num=8, seed=5)
+    )
+
+    assert random.getstate() == state
+
+
+def test_small_batches_draw_whole_names_from_table():
+    """Test table-drawn names come from the flattened pattern table."""
+    from ttrpg.name_generator import NAME_PATTERNS, _name_table
+
+    pattern = NAME_PATTERNS["halfling"]
+    population, cum_weights = _name_table("halfling")
+
+    # Every first/last pair carries 0.3 (no middle) + 0.7 (some middle)
+    assert abs(cum_weights[-1] - len(pattern["first"]) * len(pattern["last"])) < 1e-9
+    names = generate_character_names("halfling", num=30, seed=2)
+    assert set(names) <= set(population)
+
+
+@pytest.mark.parametrize("module", ["ttrpg.name_generator", "ttrpg.content_generator"])
+def test_import_does_not_load_numpy(module: str):
+    """Test numpy stays off the startup path until a large batch needs it."""
+    code = f"import sys, {module}; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    ).stdout
+
+    assert out.strip() == "False"
+
+
+def test_seeded_batch_ignores_numpy(monkeypatch):
+    """Test a big seeded batch draws the same names with or without numpy."""
+    big = generate_character_names("elf", num=NUMPY_MIN_NAMES, surname=True, seed=4)
+
+    assert big == generate_character_names(
+        "elf", num=NUMPY_MIN_NAMES, surname=True, seed=4, allow_numpy=False
+    )
+    monkeypatch.setattr(name_generator, "load_numpy", lambda: None)
+    assert big == generate_character_names("elf", num=NUMPY_MIN_NAMES, surname=True, seed=4)
+
+
+def test_unseeded_big_batch_follows_random_seed():
+    """Test the numpy path still draws from the seeded ``random`` module."""
+    random.seed(6)
+    first = generate_character_names("dwarf", num=NUMPY_MIN_NAMES, surname=True)
+    random.seed(6)
+
+    assert generate_character_names("dwarf", num=NUMPY_MIN_NAMES, surname=True) == first
+    assert all(len(name.split(" ")) == 2 for name in first)
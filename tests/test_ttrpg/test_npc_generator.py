@@ -0,0 +1,179 @@
+"""Tests for ttrpg.npc_generator module."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ttrpg.npc_generator import (
+    PARALLEL_MIN_NPCS,
+    NPCGeneratorError,
+    combat_stats,
+    generate_ability_score_batch,
+    generate_ability_scores,
+    generate_npc,
+    generate_npc_batch,
+    generate_npc_from_scores,
+    get_ability_modifier,
+    npcs_from_batch,
+    parse_arguments,
+)
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [(1, -5), (3, -4), (8, -1), (10, 0), (11, 0), (15, 2), (18, 4), (30, 10), (31, 10), (-2, -6)],
+)
+def test_get_ability_modifier(score: int, expected: int):
+    """Test modifiers follow the 5e table."""
+    assert get_ability_modifier(score) == expected
+
+
+def test_generate_ability_scores_standard_range():
+    """Test 4d6-drop-lowest scores stay within 3-18."""
+    for _ in range(50):
+        scores = generate_ability_scores("standard")
+        assert list(scores) == ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
+        assert all(3 <= score <= 18 for score in scores.values())
+
+
+def test_generate_ability_scores_array():
+    """Test the standard array is shuffled, not rolled."""
+    scores = generate_ability_scores("array")
+
+    assert sorted(scores.values()) == [8, 10, 12, 13, 14, 15]
+
+
+def test_generate_npc_is_reproducible():
+    """Test seeded NPCs are identical and internally consistent."""
+    npc = generate_npc(race="dwarf", char_class="Fighter", level=5, seed=21)
+
+    assert npc == generate_npc(race="dwarf", char_class="Fighter", level=5, seed=21)
+    assert npc.proficiency_bonus == 3
+    assert npc.hit_dice == "5d10"
+    assert npc.ability_modifiers["DEX"] == get_ability_modifier(npc.ability_scores["DEX"])
+
+
+def test_npc_to_dict_uses_json_keys():
+    """Test the NPC serializes with the original ``class`` key and has no __dict__."""
+    npc = generate_npc(race="elf", char_class="Wizard", seed=3)
+    data = npc.to_dict()
+
+    assert data["class"] == "Wizard"
+    assert "char_class" not in data
+    assert data["name"] == npc.name
+    assert not hasattr(npc, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "level,hit_die,con_mod,dex_mod,expected",
+    [
+        (1, 10, 2, 1, (2, 12, 11)),
+        (5, 8, 0, 3, (3, 28, 13)),
+        (3, 6, -5, -1, (2, 1, 9)),
+    ],
+)
+def test_combat_stats(level, hit_die, con_mod, dex_mod, expected):
+    """Test proficiency, hit points and armor class formulas."""
+    assert combat_stats(level, hit_die, con_mod, dex_mod) == expected
+
+
+def test_generate_ability_score_batch_matches_single_rolls():
+    """Test a batched roll equals the same number of per-NPC rolls."""
+    np = pytest.importorskip("numpy")
+
+    batch = generate_ability_score_batch(5, np.random.default_rng(8))
+    rng = np.random.default_rng(8)
+
+    assert batch == [generate_ability_scores(rng=rng) for _ in range(5)]
+
+
+def test_generate_npc_from_scores_keeps_given_scores():
+    """Test pre-rolled scores are used as-is."""
+    scores = {"STR": 18, "DEX": 14, "CON": 12, "INT": 8, "WIS": 10, "CHA": 3}
+    npc = generate_npc_from_scores(scores, race="orc", char_class="Barbarian")
+
+    assert npc.ability_scores == scores
+    assert npc.ability_modifiers["CHA"] == -4
+
+
+def test_generate_npc_batch_matches_combat_stats():
+    """Test batched NPCs carry the same derived stats as single NPCs."""
+    np = pytest.importorskip("numpy")
+
+    batch = generate_npc_batch(200, level=7, rng=np.random.default_rng(4))
+    npcs = list(npcs_from_batch(batch, level=7))
+
+    assert len(npcs) == 200
+    for npc in npcs:
+        hit_die = int(npc.hit_dice.split("d")[1])
+        mods = npc.ability_modifiers
+        assert (npc.proficiency_bonus, npc.hit_points, npc.armor_class) == combat_stats(
+            7, hit_die, mods["CON"], mods["DEX"]
+        )
+        assert npc.name
+
+
+def test_generate_npc_batch_fixed_race_and_array_method():
+    """Test fixed race/class columns and standard-array scores."""
+    np = pytest.importorskip("numpy")
+
+    batch = generate_npc_batch(
+        20, race="Dwarf", char_class="Cleric", method="array", rng=np.random.default_rng(1)
+    )
+
+    for npc in npcs_from_batch(batch):
+        assert (npc.race, npc.char_class) == ("Dwarf", "Cleric")
+        assert sorted(npc.ability_scores.values()) == [8, 10, 12, 13, 14, 15]
+
+    with pytest.raises(NPCGeneratorError):
+        generate_npc_batch(2, race="gnome")
+
+
+def test_large_unseeded_run_uses_numpy_batches(monkeypatch: pytest.MonkeyPatch):
+    """Test big unseeded runs stay on the batch path instead of starting a pool."""
+    pytest.importorskip("numpy")
+    import concurrent.futures
+
+    from ttrpg import npc_generator
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(npc_generator.os, "cpu_count", lambda: 8)
+    args = parse_arguments(["--num", str(PARALLEL_MIN_NPCS)])
+
+    npcs = list(npc_generator._stream_npcs(args))
+
+    assert len(npcs) == PARALLEL_MIN_NPCS
+
+
+def test_seeded_run_ignores_numpy(monkeypatch: pytest.MonkeyPatch):
+    """Test a seeded CLI run writes the same NPCs with or without numpy."""
+    from ttrpg import npc_generator
+
+    args = parse_arguments(["--num", "5", "--seed", "13"])
+    with_numpy = list(npc_generator._stream_npcs(args))
+
+    monkeypatch.setattr(npc_generator, "load_numpy", lambda: None)
+    monkeypatch.setattr(npc_generator, "_np_rng", None)
+
+    assert list(npc_generator._stream_npcs(args)) == with_numpy
+
+
+def test_import_does_not_load_numpy():
+    """Test numpy stays off the CLI startup path until NPCs are rolled."""
+    code = "import sys, ttrpg.npc_generator; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    ).stdout
+
+    assert out.strip() == "False"
@@ -0,0 +1,247 @@
+"""Tests for ttrpg.random_table module."""
+
+from __future__ import annotations
+
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ttrpg import random_table
+from ttrpg.random_table import (
+    DENSE_MAX_SIDES,
+    NUMPY_MIN_ROLLS,
+    RandomTableError,
+    compile_roll_fn,
+    create_example_table,
+    load_table_from_csv,
+    load_table_from_json,
+    prepared_table,
+    roll_on_table,
+    roll_on_table_batch,
+)
+
+
+def test_load_table_parses_ranges_once(tmp_path: Path):
+    """Test JSON tables are prepared on load and stay serializable."""
+    path = tmp_path / "d20.json"
+    path.write_text(create_example_table("d20"), encoding="utf-8")
+
+    table = load_table_from_json(str(path))
+    prepared = prepared_table(table)
+
+    assert prepared_table(prepared) is prepared
+    assert prepared.num_sides == 20
+    assert (prepared.lower[0], prepared.upper[0]) == (1, 5)
+    assert (prepared.lower[-1], prepared.upper[-1]) == (20, 20)
+    assert json.loads(json.dumps(table)) == json.loads(create_example_table("d20"))
+
+
+def test_load_table_rejects_bad_range(tmp_path: Path):
+    """Test malformed ranges fail at load time."""
+    path = tmp_path / "bad.csv"
+    path.write_text("range,result\nx-2,broken\n", encoding="utf-8")
+
+    with pytest.raises(RandomTableError):
+        load_table_from_csv(str(path), "d6")
+
+
+def test_roll_on_unprepared_table():
+    """Test tables built in code can be rolled on directly."""
+    table = json.loads(create_example_table("d100"))
+
+    result = roll_on_table(table, seed=4)
+
+    assert 1 <= result["roll"] <= 100
+    assert result["result"] in {entry["result"] for entry in table["entries"]}
+
+
+def test_roll_finds_unordered_ranges_and_reports_gaps():
+    """Test the range lookup handles any entry order and uncovered rolls."""
+    table = {
+        "dice": "d10",
+        "entries": [
+            {"range": "6-10", "result": "high"},
+            {"range": "1-3", "result": "low"},
+        ],
+    }
+
+    seen = {}
+    for seed in range(100):
+        try:
+            result = roll_on_table(table, seed=seed)
+        except RandomTableError:
+            continue
+        seen[result["roll"]] = result["result"]
+
+    assert seen == {
+        1: "low",
+        2: "low",
+        3: "low",
+        6: "high",
+        7: "high",
+        8: "high",
+        9: "high",
+        10: "high",
+    }
+
+
+def test_overlapping_ranges_are_rejected():
+    """Test ambiguous tables fail instead of silently picking one entry."""
+    table = {
+        "dice": "d6",
+        "entries": [{"range": "1-3", "result": "a"}, {"range": "3-6", "result": "b"}],
+    }
+
+    with pytest.raises(RandomTableError, match="Overlapping"):
+        roll_on_table(table)
+
+
+@pytest.mark.parametrize("num", [5, NUMPY_MIN_ROLLS * 4])
+def test_roll_on_table_batch_matches_ranges(num: int):
+    """Test batched rolls map each roll to its range and follow ``random.seed``."""
+    table = json.loads(create_example_table("d20"))
+
+    random.seed(12)
+    results = roll_on_table_batch(table, num)
+    random.seed(12)
+
+    assert results == roll_on_table_batch(table, num)
+    assert len(results) == num
+    prepared = prepared_table(table)
+    for result in results:
+        idx = next(
+            i
+            for i, (low, high) in enumerate(zip(prepared.lower, prepared.upper))
+            if low <= result["roll"] <= high
+        )
+        assert result["result"] == prepared.results[idx]
+
+
+def test_roll_on_table_batch_weighted_skips_zero_weights():
+    """Test weighted batches never pick zero-weight entries."""
+    table = {
+        "dice": "weighted",
+        "entries": [{"weight": 0, "result": "never"}, {"weight": 3, "result": "often"}],
+    }
+
+    results = roll_on_table_batch(table, NUMPY_MIN_ROLLS * 4)
+
+    assert {result["result"] for result in results} == {"often"}
+
+
+@pytest.mark.parametrize("dice", ["d20", "weighted"])
+def test_seeded_batch_ignores_size_and_numpy(monkeypatch, dice: str):
+    """Test a seeded batch rolls the same whatever its size and without numpy."""
+    table = json.loads(create_example_table(dice))
+    small = roll_on_table_batch(table, NUMPY_MIN_ROLLS - 1, seed=9)
+
+    assert roll_on_table_batch(table, NUMPY_MIN_ROLLS, seed=9)[:-1] == small
+    monkeypatch.setattr(random_table, "load_numpy", lambda: None)
+    assert roll_on_table_batch(table, NUMPY_MIN_ROLLS, seed=9)[:-1] == small
+
+
+def test_import_does_not_load_numpy():
+    """Test numpy stays off the CLI startup path until a big batch is rolled."""
+    code = "import sys, ttrpg.random_table; print('numpy' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    ).stdout
+
+    assert out.strip() == "False"
+
+
+def test_weighted_roll_matches_random_choices():
+    """Test the precomputed CDF draws exactly what random.choices would."""
+    table = json.loads(create_example_table("weighted"))
+    weights = [entry["weight"] for entry in table["entries"]]
+    results = [entry["result"] for entry in table["entries"]]
+
+    drawn = [roll_on_table(table, seed=seed)["result"] for seed in range(50)]
+    expected = []
+    for seed in range(50):
+        random.seed(seed)
+        expected.append(random.choices(results, weights=weights)[0])
+
+    assert prepared_table(table).cdf == (50, 80, 95, 99, 100)
+    assert drawn == expected
+
+
+def test_weighted_table_needs_positive_total():
+    """Test all-zero weights are rejected."""
+    with pytest.raises(RandomTableError):
+        roll_on_table({"dice": "weighted", "entries": [{"weight": 0, "result": "x"}]})
+
+
+def test_seeded_roll_leaves_global_random_alone():
+    """Test a seed drives a private generator instead of reseeding ``random``."""
+    table = json.loads(create_example_table("d100"))
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    first = roll_on_table(table, seed=1)
+    assert random.random() == expected
+    assert roll_on_table(table, rng=random.Random(1)) == first
+
+
+@pytest.mark.parametrize("dice", ["d10", f"d{DENSE_MAX_SIDES * 2}"])
+def test_compile_roll_fn_maps_every_roll(dice: str):
+    """Test both the dense and the bisect lookups agree with the ranges."""
+    sides = int(dice[1:])
+    table = {
+        "dice": dice,
+        "entries": [
+            {"range": f"{sides // 2 + 1}-{sides}", "result": "high"},
+            {"range": f"1-{sides // 2 - 1}", "result": "low"},
+        ],
+    }
+    prepared = prepared_table(table)
+
+    lookup = compile_roll_fn(prepared)
+
+    assert prepared.results[lookup(1)] == "low"
+    assert lookup(sides // 2) == -1
+    assert prepared.results[lookup(sides)] == "high"
+
+
+def test_rolling_leaves_table_serializable():
+    """Test rolling adds nothing to the caller's dict."""
+    table = json.loads(create_example_table("d20"))
+    original = json.loads(json.dumps(table))
+
+    roll_on_table(table, seed=1)
+    roll_on_table_batch(table, NUMPY_MIN_ROLLS * 2)
+
+    assert json.loads(json.dumps(table)) == original
+
+
+def test_edits_to_a_table_dict_take_effect():
+    """Test rolling re-reads a dict edited in place since the last roll."""
+    table = {"dice": "d4", "entries": [{"range": "1-4", "result": "A"}]}
+    assert roll_on_table(table, seed=1)["result"] == "A"
+
+    table["entries"][0]["result"] = "B"
+    assert roll_on_table(table, seed=1)["result"] == "B"
+
+    table["dice"] = "d8"
+    table["entries"].append({"range": "5-8", "result": "C"})
+    rolls = [roll_on_table(table, seed=seed) for seed in range(50)]
+    assert {result["result"] for result in rolls} == {"B", "C"}
+    assert max(result["roll"] for result in rolls) > 4
+
+
+def test_prepared_table_rolls_like_its_dict():
+    """Test a held PreparedTable rolls exactly like the dict it came from."""
+    table = json.loads(create_example_table("d100"))
+    prepared = prepared_table(table)
+
+    assert roll_on_table(prepared, seed=3) == roll_on_table(table, seed=3)
+    assert roll_on_table_batch(prepared, 10, seed=3) == roll_on_table_batch(table, 10, seed=3)
@@ -0,0 +1 @@
+"""Tests for the type-fixer tool."""
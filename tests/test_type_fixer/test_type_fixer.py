@@ -0,0 +1,185 @@
+"""Tests for type-fixer/type_fixer.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = Path(__file__).resolve().parents[2] / "type-fixer" / "type_fixer.py"
+_spec = importlib.util.spec_from_file_location("type_fixer", _MODULE_PATH)
+assert _spec is not None and _spec.loader is not None
+type_fixer = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault("type_fixer", type_fixer)
+_spec.loader.exec_module(type_fixer)
+
+FixerConfig = type_fixer.FixerConfig
+PythonFileFixer = type_fixer.PythonFileFixer
+
+
+def _make_fixer(path: Path, **kwargs) -> PythonFileFixer:
+    return PythonFileFixer(FixerConfig(input_path=path, output_path=None, dry_run=True, **kwargs))
+
+
+def test_discover_skips_hidden_and_pycache(tmp_path: Path):
+    """Test hidden and __pycache__ directories are pruned from the walk."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "__pycache__" / "cached.py").write_text("")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "lib.py").write_text("")
+
+    fixer = _make_fixer(tmp_path)
+
+    assert fixer._files == (tmp_path / "pkg" / "mod.py",)
+
+
+def test_discover_survives_symlink_loop(tmp_path: Path):
+    """Test a symlinked directory pointing back up the tree is walked only once."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "mod.py").write_text("x = 1\n")
+    try:
+        (pkg / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported here")
+
+    fixer = _make_fixer(tmp_path)
+
+    assert fixer._files == (pkg / "mod.py",)
+
+
+def _missing_modules(fixer: PythonFileFixer) -> list[str]:
+    return [detail.module for detail in fixer._check_import_errors()]
+
+
+def test_import_cache_reuses_unchanged_files(tmp_path: Path):
+    """Test a file whose content is unchanged is not parsed again."""
+    source = tmp_path / "mod.py"
+    source.write_text("import json\n")
+    cache = tmp_path / "cache.json"
+    fixer = _make_fixer(source, import_cache_path=cache)
+    assert _missing_modules(fixer) == []
+    fixer._save_import_cache()
+
+    # Plant a module in the cached entry; only a cache hit can report it
+    data = json.loads(cache.read_text(encoding="utf-8"))
+    data["files"][str(source)][1] = ["cached_only_module_xyz"]
+    cache.write_text(json.dumps(data), encoding="utf-8")
+
+    assert _missing_modules(_make_fixer(source, import_cache_path=cache)) == [
+        "cached_only_module_xyz"
+    ]
+
+
+def test_import_cache_rescans_changed_files(tmp_path: Path):
+    """Test editing a file invalidates its cached imports."""
+    source = tmp_path / "mod.py"
+    source.write_text("import json\n")
+    cache = tmp_path / "cache.json"
+    fixer = _make_fixer(source, import_cache_path=cache)
+    assert _missing_modules(fixer) == []
+    fixer._save_import_cache()
+
+    source.write_text("import json\nimport not_installed_module_xyz\n")
+
+    assert _missing_modules(_make_fixer(source, import_cache_path=cache)) == [
+        "not_installed_module_xyz"
+    ]
+
+
+def test_import_cache_ignores_corrupt_file(tmp_path: Path):
+    """Test an unreadable cache is treated as empty."""
+    source = tmp_path / "mod.py"
+    source.write_text("import not_installed_module_xyz\n")
+    cache = tmp_path / "cache.json"
+    cache.write_text("{not json", encoding="utf-8")
+
+    assert _missing_modules(_make_fixer(source, import_cache_path=cache)) == [
+        "not_installed_module_xyz"
+    ]
+
+
+_FIXTURE_MODULE = """\
+import os
+from missing_top_level_xyz import helper
+
+try:
+    import missing_optional_xyz
+except ImportError:
+    missing_optional_xyz = None
+
+if os.name == "nt":
+    import missing_windows_only_xyz
+
+
+def lazy():
+    import missing_in_function_xyz
+
+
+class Plugin:
+    from missing_in_class_xyz import hook
+"""
+
+
+def test_module_scope_scan_matches_baseline_at_import_time(tmp_path: Path):
+    """Test the default scan keeps every import-time module the full walk finds."""
+    source = tmp_path / "mod.py"
+    source.write_text(_FIXTURE_MODULE)
+
+    module_scope = _missing_modules(_make_fixer(source))
+    baseline = _missing_modules(_make_fixer(source, nested_imports=True))
+
+    assert module_scope == [
+        "missing_in_class_xyz",
+        "missing_optional_xyz",
+        "missing_top_level_xyz",
+        "missing_windows_only_xyz",
+    ]
+    assert baseline == sorted([*module_scope, "missing_in_function_xyz"])
+
+
+def test_dry_run_finishes_black_before_other_tools(tmp_path: Path):
+    """Test black's stdout/stderr redirection never overlaps ruff or mypy."""
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n")
+    fixer = _make_fixer(source)
+    black_done = threading.Event()
+    started_after_black = []
+
+    def make_step(name: str):
+        def step():
+            if name == "black":
+                black_done.set()
+            else:
+                started_after_black.append(black_done.is_set())
+            return type_fixer.CommandResult(name, (name,), 0, "", "")
+
+        return step
+
+    fixer._format_with_black = make_step("black")
+    fixer._lint_with_ruff = make_step("ruff")
+    fixer._type_check_with_mypy = make_step("mypy")
+
+    results = fixer._run_tools()
+
+    assert [result.name for result in results] == ["black", "ruff", "mypy"]
+    assert started_after_black == [True, True]
+
+
+def test_black_usage_error_becomes_failed_result(tmp_path: Path):
+    """Test a click usage error from black is reported instead of escaping."""
+    pytest.importorskip("black")
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n")
+    fixer = _make_fixer(source)
+
+    result = fixer._run_black_in_process(["black", "--no-such-flag", str(source)])
+
+    assert result.return_code == 2
+    assert "no-such-flag" in result.stderr
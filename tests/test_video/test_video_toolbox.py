@@ -0,0 +1,58 @@
+"""Tests for video.video_toolbox module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from video.video_toolbox import (
+    VideoProcessingError,
+    count_frame_files,
+    parse_timecode,
+    resolve_time_range,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "seconds"),
+    [
+        ("5", 5.0),
+        (" 7.5 ", 7.5),
+        (".5", 0.5),
+        ("1:30", 90.0),
+        ("01:02:03.25", 3723.25),
+        ("1e2", 100.0),
+    ],
+)
+def test_parse_timecode(text: str, seconds: float):
+    """Test plain seconds and [[HH:]MM:]SS time codes."""
+    assert parse_timecode(text) == seconds
+
+
+@pytest.mark.parametrize("text", ["1:2:3:4", "a:b", "1:", "x"])
+def test_parse_timecode_rejects_invalid(text: str):
+    """Test malformed time codes raise VideoProcessingError."""
+    with pytest.raises(VideoProcessingError):
+        parse_timecode(text)
+
+
+def test_resolve_time_range_rejects_negative_start():
+    """Test negative values still reach the range validation."""
+    with pytest.raises(VideoProcessingError, match="non-negative"):
+        resolve_time_range("-5", None, None)
+
+
+def test_count_frame_files_matches_numbered_pattern(tmp_path: Path):
+    """Test only files named like ffmpeg's %05d pattern are counted."""
+    for name in [
+        "frame00001.png",
+        "frame00002.png",
+        "frame0003.png",
+        "frame00004.jpg",
+        "xframe00005.png",
+    ]:
+        (tmp_path / name).touch()
+    (tmp_path / "frame00006.png").mkdir()
+
+    assert count_frame_files(tmp_path, "frame", "png") == 2
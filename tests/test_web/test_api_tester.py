@@ -0,0 +1,54 @@
+"""Tests for web.api_tester module."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+
+from web import api_tester
+from web.api_tester import make_request
+
+
+class _FakeSession:
+    """Session stand-in that answers every request with ``response``."""
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+
+    def request(self, method, url, **kwargs):
+        return self.response
+
+
+def _response(body: bytes, content_type: str) -> requests.Response:
+    """Build a 200 response carrying ``body`` as ``content_type``."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_make_request_returns_latin1_html_as_text(monkeypatch, use_orjson):
+    """Test a body that is neither JSON nor UTF-8 comes back as text."""
+    if not use_orjson:
+        monkeypatch.setattr(api_tester, "orjson", None)
+    body = "<html><body>Café</body></html>".encode("latin-1")
+    session = _FakeSession(_response(body, "text/html; charset=ISO-8859-1"))
+
+    result = make_request("GET", "https://example.com", session=session)
+
+    assert result["success"] is True
+    assert result["body"] == "<html><body>Café</body></html>"
+    assert "json" not in result
+
+
+def test_make_request_parses_json_body():
+    """Test a JSON body is parsed and kept as text."""
+    session = _FakeSession(_response(b'{"ok": true}', "application/json"))
+
+    result = make_request("GET", "https://example.com", session=session)
+
+    assert result["json"] == {"ok": True}
+    assert result["body"] == '{"ok": true}'
@@ -0,0 +1,64 @@
+"""Tests for web.google_search module."""
+
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from web import google_search
+
+
+class _FakeOpener:
+    """Stand-in for ``subprocess.Popen`` exiting with ``returncode``."""
+
+    launched: list = []
+    returncode = 0
+
+    def __init__(self, args, **kwargs):
+        self.launched.append(args[0])
+
+    def wait(self, timeout=None):
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired("xdg-open", timeout)
+        return self.returncode
+
+
+@pytest.fixture
+def linux(monkeypatch):
+    """Pretend to run on Linux with a fake opener and a recording browser."""
+    browser: list = []
+    monkeypatch.setattr(google_search.sys, "platform", "linux")
+    monkeypatch.setattr(google_search.subprocess, "Popen", _FakeOpener)
+    monkeypatch.setattr(_FakeOpener, "launched", [])
+    monkeypatch.setattr(google_search.webbrowser, "open", lambda url: browser.append(url) or False)
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    return browser
+
+
+@pytest.mark.parametrize("returncode", [0, None])
+def test_open_url_with_display(linux, monkeypatch, returncode):
+    """Test that xdg-open is trusted when it succeeds or keeps running."""
+    monkeypatch.setenv("DISPLAY", ":0")
+    monkeypatch.setattr(_FakeOpener, "returncode", returncode)
+
+    assert google_search.open_url("https://example.com") is True
+    assert _FakeOpener.launched == ["xdg-open"]
+    assert linux == []
+
+
+def test_open_url_falls_back_when_xdg_open_fails(linux, monkeypatch):
+    """Test that a failing xdg-open falls back to webbrowser."""
+    monkeypatch.setenv("DISPLAY", ":0")
+    monkeypatch.setattr(_FakeOpener, "returncode", 3)
+
+    assert google_search.open_url("https://example.com") is False
+    assert linux == ["https://example.com"]
+
+
+def test_open_url_headless_skips_xdg_open(linux):
+    """Test that a session without a display goes straight to webbrowser."""
+    assert google_search.open_url("https://example.com") is False
+    assert _FakeOpener.launched == []
+    assert linux == ["https://example.com"]
@@ -0,0 +1,96 @@
+"""Tests for web.link_preview module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from web import link_preview
+from web.link_preview import LinkPreview, extract_meta, render_card, scan_head_regex
+
+
+def test_render_card_pastes_small_image(tmp_path: Path):
+    """Test an image smaller than the card is still decoded and pasted."""
+    source = tmp_path / "small.png"
+    Image.new("RGB", (40, 40), color=(200, 10, 10)).save(source)
+    out = tmp_path / "card.png"
+    meta = LinkPreview(url="https://example.com", image="https://example.com/small.png")
+
+    render_card(meta, out, timeout=5, image_path=source)
+
+    with Image.open(out) as card:
+        assert card.getpixel((400, 200)) == (200, 10, 10)
+
+
+def test_scan_head_regex_reads_swapped_attributes():
+    """Test content may come before property."""
+    html = (
+        '<html><head><meta content="Swapped" property="og:title">'
+        '<meta content="A page" name="description"></head><body></body></html>'
+    )
+
+    tags = scan_head_regex(html)
+
+    assert tags is not None
+    _, _, _, description, og, _ = tags
+    assert og == {"og:title": "Swapped"}
+    assert description == "A page"
+
+
+def test_scan_head_regex_reads_single_quoted_attributes():
+    """Test single-quoted values, including ones holding a double quote."""
+    html = (
+        "<head><meta property='og:image' content='/cover.png'>"
+        "<meta name='twitter:title' content='Say \"hi\"'>"
+        "<link rel='canonical' href='/canonical'></head>"
+    )
+
+    tags = scan_head_regex(html)
+
+    assert tags is not None
+    canonical, _, _, _, og, tw = tags
+    assert canonical == "/canonical"
+    assert og == {"og:image": "/cover.png"}
+    assert tw == {"twitter:title": 'Say "hi"'}
+
+
+def test_scan_head_regex_reads_uppercase_tags():
+    """Test tag and attribute names match case-insensitively."""
+    html = (
+        '<HTML><HEAD><TITLE>Shout</TITLE><META PROPERTY="og:title" CONTENT="Loud">'
+        '<LINK REL="icon" HREF="/favicon.ico"></HEAD></HTML>'
+    )
+
+    tags = scan_head_regex(html)
+
+    assert tags is not None
+    _, icon, title, _, og, _ = tags
+    assert (icon, title) == ("/favicon.ico", "Shout")
+    assert og == {"og:title": "Loud"}
+
+
+@pytest.mark.parametrize(
+    ("html", "title"),
+    [
+        # No </head>: the regexes give up rather than scan the whole document
+        (
+            '<html><head><title>Open</title><meta property="og:title" content="Unterminated">',
+            "Unterminated",
+        ),
+        # Meta tags only inside a comment: nothing left for the regexes to read
+        (
+            '<head><!-- <meta property="og:title" content="Hidden"> --><title>Open</title></head>',
+            "Open",
+        ),
+    ],
+)
+def test_extract_meta_falls_back_to_soup(html: str, title: str, monkeypatch: pytest.MonkeyPatch):
+    """Test markup the regexes decline is still parsed by BeautifulSoup."""
+    monkeypatch.setattr(link_preview, "LexborHTMLParser", None)
+    assert scan_head_regex(html) is None
+
+    meta = extract_meta("https://example.com/page", html)
+
+    assert meta.title == title
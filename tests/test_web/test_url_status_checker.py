@@ -0,0 +1,89 @@
+"""Tests for web.url_status_checker module."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+from web.url_status_checker import _request_status, check_url
+
+
+class _FakeResponse:
+    """requests-style response with a status code and nothing to download."""
+
+    def __init__(self, status_code: int, url: str):
+        self.status_code = status_code
+        self.url = url
+        self.elapsed = datetime.timedelta(milliseconds=5)
+        self.content = b"<"
+
+    def close(self):
+        pass
+
+
+class _FakeSession:
+    """requests-style session that refuses HEAD and answers GET with ``get_status``."""
+
+    def __init__(self, get_status: int):
+        self.get_status = get_status
+        self.get_headers = []
+
+    def head(self, url, **kwargs):
+        return _FakeResponse(405, url)
+
+    def get(self, url, headers=None, **kwargs):
+        self.get_headers.append(headers)
+        return _FakeResponse(self.get_status, url)
+
+
+def test_range_probe_206_is_reported_as_200():
+    """Test the GET fallback's partial-content answer reads as a plain 200."""
+    session = _FakeSession(206)
+
+    result = check_url("https://example.com/page", 5, session=session)
+
+    assert session.get_headers[0]["Range"] == "bytes=0-0"
+    assert (result.status, result.ok, result.method) == (200, True, "GET")
+
+
+def test_get_fallback_keeps_other_statuses():
+    """Test statuses other than the probe's 206 pass through unchanged."""
+    result = check_url("https://example.com/missing", 5, session=_FakeSession(404))
+
+    assert (result.status, result.ok) == (404, False)
+
+
+class _FakeAsyncResponse:
+    """aiohttp-style response for ``_request_status``."""
+
+    def __init__(self, status: int, url: str):
+        self.status = status
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return b"<"
+
+
+class _FakeAsyncSession:
+    """aiohttp-style session answering every request with ``status``."""
+
+    def __init__(self, status: int):
+        self.status = status
+
+    def request(self, method, url, **kwargs):
+        return _FakeAsyncResponse(self.status, url)
+
+
+def test_async_range_probe_206_is_reported_as_200():
+    """Test the aiohttp path reports the probe's 206 as 200 as well."""
+    status, final_url = asyncio.run(
+        _request_status(_FakeAsyncSession(206), "GET", "https://example.com/page")
+    )
+
+    assert (status, final_url) == (200, "https://example.com/page")
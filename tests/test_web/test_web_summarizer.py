@@ -0,0 +1,150 @@
+"""Tests for web.web_summarizer module."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Iterator
+
+import pytest
+
+from web import web_summarizer
+
+
+class _FakeResponse:
+    """Streamed response serving ``body`` in ``CHUNK``-sized pieces."""
+
+    encoding = "utf-8"
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.bytes_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            self.bytes_read = start + chunk_size
+            yield self.body[start : start + chunk_size]
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Answer the summarizer's page fetch with a fake streamed response."""
+
+    def install(body: bytes) -> _FakeResponse:
+        response = _FakeResponse(body)
+        monkeypatch.setattr(web_summarizer._SESSION, "get", lambda url, **kwargs: response)
+        return response
+
+    return install
+
+
+@pytest.fixture
+def blocked_preload(monkeypatch) -> Iterator[threading.Event]:
+    """Make the model preload record its start and then block until released."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def preload(*args):
+        started.set()
+        release.wait()
+
+    monkeypatch.setattr(web_summarizer, "_preload_summarizer", preload)
+    yield started
+    release.set()
+
+
+def test_preload_overlaps_the_download(monkeypatch, capsys, blocked_preload):
+    """Test the model starts loading before the fetch and a short page skips it."""
+    preload_started_first = []
+
+    def fetch(url, max_chars):
+        preload_started_first.append(blocked_preload.wait(timeout=5))
+        return "Short page."
+
+    monkeypatch.setattr(web_summarizer, "fetch_text", fetch)
+    monkeypatch.setattr(sys, "argv", ["web_summarizer.py", "https://example.com"])
+
+    assert web_summarizer.main() == 0
+    assert preload_started_first == [True]
+    assert capsys.readouterr().out.strip() == "Short page."
+
+
+def _page(head_bytes: int, paragraphs: int) -> bytes:
+    """HTML with ``head_bytes`` of inline script before ``paragraphs`` paragraphs."""
+    script = "<script>" + "x" * head_bytes + "</script>"
+    body = "".join(f"<p>Paragraph {i} of the article.</p>" for i in range(paragraphs))
+    return f"<html><head>{script}</head><body>{body}</body></html>".encode()
+
+
+def test_fetch_text_reads_past_a_large_head(serve):
+    """Test text behind more head than the first byte estimate is still found."""
+    max_chars = 200
+    head = 4 * max(web_summarizer.FETCH_MIN_BYTES, max_chars * web_summarizer.FETCH_BYTES_PER_CHAR)
+    response = serve(_page(head, 50_000))
+
+    text = web_summarizer.fetch_text("https://example.com", max_chars)
+
+    assert len(text) == max_chars
+    assert text.startswith("Paragraph 0 of the article.\nParagraph 1")
+    assert response.bytes_read < len(response.body) // 2
+
+
+def test_fetch_text_returns_short_pages_whole(serve):
+    """Test a page with less text than max_chars is read to the end."""
+    serve(_page(100_000, 3))
+
+    text = web_summarizer.fetch_text("https://example.com", 5000)
+
+    assert text.splitlines() == [f"Paragraph {i} of the article." for i in range(3)]
+
+
+class _FakeORTModel:
+    """Stand-in for optimum's ORTModelForSeq2SeqLM recording its loads."""
+
+    loads: list = []
+
+    @classmethod
+    def from_pretrained(cls, source, export=False, provider=None):
+        cls.loads.append((str(source), export))
+        return cls()
+
+    def save_pretrained(self, path):
+        path.mkdir(parents=True)
+        (path / "config.json").write_text("{}")
+
+
+@pytest.fixture
+def fake_onnx(monkeypatch, tmp_path):
+    """Install fake optimum/transformers modules and a temporary cache dir."""
+    optimum = type(sys)("optimum.onnxruntime")
+    optimum.ORTModelForSeq2SeqLM = _FakeORTModel
+    transformers = type(sys)("transformers")
+    transformers.AutoTokenizer = type(
+        "AutoTokenizer", (), {"from_pretrained": staticmethod(lambda name: name)}
+    )
+    transformers.pipeline = lambda task, model, tokenizer: (task, model, tokenizer)
+    monkeypatch.setitem(sys.modules, "optimum", type(sys)("optimum"))
+    monkeypatch.setitem(sys.modules, "optimum.onnxruntime", optimum)
+    monkeypatch.setitem(sys.modules, "transformers", transformers)
+    monkeypatch.setattr(web_summarizer, "ONNX_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(_FakeORTModel, "loads", [])
+    return tmp_path
+
+
+def test_onnx_export_is_cached(fake_onnx):
+    """Test that only the first ONNX run exports the model."""
+    web_summarizer._onnx_summarizer("org/model")
+    web_summarizer._onnx_summarizer("org/model")
+
+    export_dir = fake_onnx / "org--model"
+    assert _FakeORTModel.loads == [("org/model", True), (str(export_dir), False)]
+    assert [p.name for p in fake_onnx.iterdir()] == ["org--model"]
@@ -0,0 +1,16 @@
+"""Tool stand-in that lists the file descriptors its process holds."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Sequence
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the target of every open descriptor, one per line."""
+    for fd in Path("/proc/self/fd").iterdir():
+        try:
+            print(fd.readlink())
+        except OSError:
+            continue
+    return 0
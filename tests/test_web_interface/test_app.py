@@ -0,0 +1,175 @@
+"""Tests for web_interface/app.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flask")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web_interface"))
+
+import app as web_app  # noqa: E402
+
+needs_forkserver = pytest.mark.skipif(
+    web_app._FORKSERVER_CONTEXT is None, reason="fork server start method unavailable"
+)
+
+
+def _read_events(body: str) -> list[tuple[str, object]]:
+    """Split a server-sent event stream into (event name, decoded data) pairs."""
+    events = []
+    for block in body.split("\n\n"):
+        if not block:
+            continue
+        name = "message"
+        for line in block.split("\n"):
+            field, _, value = line.partition(": ")
+            if field == "event":
+                name = value
+            elif field == "data":
+                events.append((name, json.loads(value)))
+    return events
+
+
+@pytest.fixture
+def client():
+    return web_app.app.test_client()
+
+
+@pytest.fixture
+def no_subprocess(monkeypatch: pytest.MonkeyPatch):
+    """Fail the test if a tool is run with ``python -m`` instead of being forked."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("tool ran as a subprocess")
+
+    monkeypatch.setattr(web_app.subprocess, "run", fail)
+    monkeypatch.setattr(web_app.subprocess, "Popen", fail)
+
+
+@needs_forkserver
+def test_execute_runs_forked_tool(client, no_subprocess):
+    """Test forked tools return their output through the JSON execute path."""
+    response = client.post(
+        "/api/execute",
+        json={"module": "ttrpg.name_generator", "args": "character --num 3"},
+    )
+
+    payload = response.get_json()
+    assert response.status_code == 200
+    assert payload["success"] is True
+    assert payload["exit_code"] == 0
+    assert len(payload["output"].splitlines()) == 3
+
+
+@needs_forkserver
+def test_execute_forked_tool_reports_usage_errors(client, no_subprocess):
+    """Test argparse errors in a forked tool come back as its exit code and stderr."""
+    response = client.post("/api/execute", json={"module": "ttrpg.name_generator", "args": "bogus"})
+
+    payload = response.get_json()
+    assert payload["success"] is False
+    assert payload["exit_code"] == 2
+    assert "invalid choice" in payload["error"]
+
+
+@needs_forkserver
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="needs /proc")
+def test_forked_child_does_not_inherit_server_sockets():
+    """Test a child only sees the fork server's descriptors, not this process's sockets."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        server.set_inheritable(True)
+        target = f"socket:[{os.fstat(server.fileno()).st_ino}]"
+
+        result = web_app.run_forked("tests.test_web_interface.fd_probe", [])
+
+    assert result is not None
+    exit_code, output, _ = result
+    assert exit_code == 0
+    assert target not in output.splitlines()
+
+
+@needs_forkserver
+def test_execute_streams_forked_tool_output(client, no_subprocess):
+    """Test event-stream clients get each output line, then the exit event."""
+    response = client.post(
+        "/api/execute",
+        json={"module": "ttrpg.name_generator", "args": "character --num 3"},
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert response.mimetype == "text/event-stream"
+    events = _read_events(response.get_data(as_text=True))
+    lines = [data for name, data in events if name == "message"]
+    assert len(lines) == 3
+    assert all(isinstance(line, str) and line for line in lines)
+    assert events[-1] == ("exit", {"success": True, "exit_code": 0})
+
+
+@pytest.mark.skipif(shutil.which("python") is None, reason="tools run as `python -m`")
+def test_execute_streams_subprocess_tool_output(client):
+    """Test tools outside FORKED_MODULES stream through the subprocess path."""
+    response = client.post(
+        "/api/execute",
+        json={"module": "ttrpg.dice_roller", "args": "bogus"},
+        headers={"Accept": "text/event-stream"},
+    )
+
+    events = _read_events(response.get_data(as_text=True))
+    assert any("bogus" in data for name, data in events if name == "message")
+    assert events[-1] == ("exit", {"success": False, "exit_code": 1})
+
+
+def test_first_index_load_runs_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test concurrent first requests build and save the index only once."""
+    index_file = tmp_path / "tool_index.json"
+    builds = []
+
+    class SlowIndexer:
+        def __init__(self, root_dir: str) -> None:
+            pass
+
+        def index_all_tools(self) -> None:
+            builds.append(1)
+            time.sleep(0.2)
+
+        def save_index(self) -> None:
+            tool = {"name": "demo", "category": "ttrpg", "file_path": "ttrpg/demo.py"}
+            index_file.write_text(json.dumps([tool]), encoding="utf-8")
+
+    monkeypatch.setattr(web_app, "ToolIndexer", SlowIndexer)
+    monkeypatch.setattr(web_app, "INDEX_FILE", index_file)
+    for name in (
+        "tools_data",
+        "_tools_by_key",
+        "_tools_by_category",
+        "_search_index",
+        "_category_counts",
+        "_stats",
+        "_index_version",
+    ):
+        monkeypatch.setattr(web_app, name, getattr(web_app, name))
+    monkeypatch.setattr(web_app, "tools_data", None)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(web_app.get_tools_data())) for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert builds == [1]
+    assert [len(tools) for tools in results] == [1, 1]
@@ -0,0 +1,111 @@
+"""Tests for the incremental cache of web_interface/tool_indexer.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web_interface"))
+
+import tool_indexer  # noqa: E402
+
+
+def _write_tool(path: Path, docstring: str) -> None:
+    """Write a minimal tool module with ``docstring``."""
+    path.write_text(f'"""{docstring}"""\n\n\ndef main():\n    pass\n', encoding="utf-8")
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    """Project root with two text tools and an index saved from them."""
+    category = tmp_path / "text_nlp"
+    category.mkdir()
+    _write_tool(category / "alpha.py", "Alpha tool.")
+    _write_tool(category / "beta.py", "Beta tool.")
+    indexer = tool_indexer.ToolIndexer(str(tmp_path))
+    indexer.index_all_tools()
+    indexer.save_index()
+    return tmp_path
+
+
+def _reindex(root: Path) -> tuple[tool_indexer.ToolIndexer, list[str]]:
+    """Re-index ``root`` and return the indexer and the names it parsed."""
+    indexer = tool_indexer.ToolIndexer(str(root))
+    parsed = []
+    extract = indexer.extract_tool_info
+
+    def spy(file_path, category):
+        parsed.append(file_path.stem)
+        return extract(file_path, category)
+
+    indexer.extract_tool_info = spy  # type: ignore[method-assign]
+    indexer.index_all_tools()
+    return indexer, parsed
+
+
+def _descriptions(indexer: tool_indexer.ToolIndexer) -> dict[str, str]:
+    """Map each indexed tool name to its description."""
+    return {tool["name"]: tool["description"] for tool in indexer.tools}
+
+
+def test_unchanged_files_reuse_cached_records(root: Path):
+    """Test files whose signature matches the sidecar are not parsed again."""
+    indexer, parsed = _reindex(root)
+
+    assert parsed == []
+    assert _descriptions(indexer) == {"alpha": "Alpha tool.", "beta": "Beta tool."}
+
+
+def test_modified_file_is_reindexed(root: Path):
+    """Test a file whose signature changed is parsed again, alone."""
+    alpha = root / "text_nlp" / "alpha.py"
+    _write_tool(alpha, "Alpha tool, rewritten.")
+    stat = alpha.stat()
+    os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    indexer, parsed = _reindex(root)
+
+    assert parsed == ["alpha"]
+    assert _descriptions(indexer) == {"alpha": "Alpha tool, rewritten.", "beta": "Beta tool."}
+
+
+def test_deleted_file_is_dropped(root: Path):
+    """Test a deleted file leaves the index and the saved sidecar."""
+    (root / "text_nlp" / "beta.py").unlink()
+
+    indexer, parsed = _reindex(root)
+    index_path = indexer.save_index()
+
+    assert parsed == []
+    assert _descriptions(indexer) == {"alpha": "Alpha tool."}
+    meta = json.loads(indexer.meta_path(index_path).read_text(encoding="utf-8"))
+    assert list(meta["files"]) == [str(Path("text_nlp") / "alpha.py")]
+
+
+@pytest.mark.parametrize(
+    "sidecar", ["{not json", json.dumps({"version": -1, "files": {}})], ids=["corrupt", "stale"]
+)
+def test_unusable_sidecar_reindexes_everything(root: Path, sidecar: str):
+    """Test a corrupt or outdated sidecar falls back to a full re-index."""
+    indexer = tool_indexer.ToolIndexer(str(root))
+    indexer.meta_path(indexer.index_path()).write_text(sidecar, encoding="utf-8")
+
+    indexer, parsed = _reindex(root)
+
+    assert sorted(parsed) == ["alpha", "beta"]
+    assert _descriptions(indexer) == {"alpha": "Alpha tool.", "beta": "Beta tool."}
+
+
+def test_private_helper_modules_are_not_tools(root: Path):
+    """Test underscore modules in a category are left out of the index."""
+    _write_tool(root / "text_nlp" / "_helpers.py", "Shared helpers.")
+    (root / "text_nlp" / "__init__.py").write_text("", encoding="utf-8")
+
+    indexer, parsed = _reindex(root)
+
+    assert parsed == []
+    assert sorted(_descriptions(indexer)) == ["alpha", "beta"]
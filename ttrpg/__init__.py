@@ -1,7 +1,7 @@
-"""TTRPG (Tabletop Role-Playing Game) design and utilities.
-
-Tools for game masters and designers including dice rolling,
-procedural content generation, random tables, and stat blocks.
-"""
-
-__version__ = "0.1.0"
+"""TTRPG (Tabletop Role-Playing Game) design and utilities.
+
+Tools for game masters and designers including dice rolling,
+procedural content generation, random tables, and stat blocks.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,52 @@
+"""Helpers shared by the TTRPG tools: lazy optional imports and JSON output."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+
+@functools.lru_cache(maxsize=None)
+def load_numpy() -> Any:
+    """Import ``numpy`` on first use; None when it is not installed.
+
+    Only large batches need it, so ordinary runs and importers of the tools
+    skip its import cost.
+    """
+    try:  # pragma: no cover - optional dependency
+        import numpy  # type: ignore
+    except Exception:  # pragma: no cover - import guard
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def load_orjson() -> Any:
+    """Import ``orjson`` on first use; None when it is not installed."""
+    try:  # pragma: no cover - optional dependency
+        import orjson  # type: ignore
+    except Exception:  # pragma: no cover - import guard
+        return None
+    return orjson
+
+
+def dumps_json(data: Any, compact: bool = False) -> str:
+    """Serialize tool output as JSON, preferring ``orjson`` when available.
+
+    Args:
+        data: Object to serialize
+        compact: Skip indentation and whitespace
+
+    Returns:
+        JSON string
+    """
+    orjson = load_orjson()
+    if orjson is not None:
+        text: str = orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode("utf-8")
+        return text
+    # Only needed for --json output, so keep it off the startup path
+    import json
+
+    if compact:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
@@ -7,14 +7,21 @@ adventure content using templates and random elements.
 from __future__ import annotations
 
 import argparse
-import json
+import heapq
 import logging
 import random
 import sys
-from typing import Any, Dict, List
+import textwrap
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple, TypeVar
+
+from . import name_generator
+from ._helpers import dumps_json
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ContentGeneratorError(RuntimeError):
     """Raised when content generation fails."""
@@ -105,34 +112,39 @@ TAVERN_NOUNS = [
     "Crown",
 ]
 
-# Location features
-LOCATION_FEATURES = {
+# Location features, weighted by how common each trait is
+LOCATION_FEATURES_WEIGHTED: Dict[str, List[Tuple[str, float]]] = {
     "tavern": [
-        "Has a roaring fireplace",
-        "Known for its excellent ale",
-        "Frequented by adventurers",
-        "Has gambling tables in the back",
-        "The bartender knows everything",
-        "There's a secret room",
+        ("Has a roaring fireplace", 3.0),
+        ("Known for its excellent ale", 3.0),
+        ("Frequented by adventurers", 2.0),
+        ("Has gambling tables in the back", 1.5),
+        ("The bartender knows everything", 1.0),
+        ("There's a secret room", 0.5),
     ],
     "dungeon": [
-        "Ancient and crumbling",
-        "Recently excavated",
-        "Built by a long-dead civilization",
-        "Still partially occupied",
-        "Filled with traps",
-        "Contains a powerful artifact",
+        ("Ancient and crumbling", 3.0),
+        ("Recently excavated", 1.5),
+        ("Built by a long-dead civilization", 2.0),
+        ("Still partially occupied", 2.0),
+        ("Filled with traps", 2.0),
+        ("Contains a powerful artifact", 0.5),
     ],
     "village": [
-        "Peaceful farming community",
-        "Plagued by recent troubles",
-        "Known for its skilled craftsmen",
-        "Isolated and suspicious of strangers",
-        "Recently attacked by monsters",
-        "Holds an annual festival",
+        ("Peaceful farming community", 3.0),
+        ("Plagued by recent troubles", 2.0),
+        ("Known for its skilled craftsmen", 1.5),
+        ("Isolated and suspicious of strangers", 1.5),
+        ("Recently attacked by monsters", 1.0),
+        ("Holds an annual festival", 2.0),
     ],
 }
 
+LOCATION_FEATURES: Dict[str, List[str]] = {
+    kind: [feature for feature, _ in features]
+    for kind, features in LOCATION_FEATURES_WEIGHTED.items()
+}
+
 # Monster types
 MONSTER_TYPES = [
     "Goblin",
@@ -173,6 +185,28 @@ PLOT_HOOKS = [
 ]
 
 
+def weighted_sample(
+    items_weights: Sequence[Tuple[T, float]], k: int, rng: random.Random | None = None
+) -> List[T]:
+    """Pick ``k`` distinct items with probability proportional to their weight.
+
+    Uses the Efraimidis-Spirakis key ``u ** (1 / w)`` and keeps the ``k``
+    largest keys, so no normalisation or cumulative table is needed.
+    Items with a non-positive weight are never selected.
+
+    Args:
+        items_weights: Sequence of ``(item, weight)`` pairs
+        k: Number of items to pick
+        rng: Random generator (module-level generator if None)
+
+    Returns:
+        Up to ``k`` items, most strongly favoured first
+    """
+    rand = rng.random if rng is not None else random.random
+    keyed = ((rand() ** (1.0 / w), item) for item, w in items_weights if w > 0)
+    return [item for _, item in heapq.nlargest(k, keyed, key=itemgetter(0))]
+
+
 def generate_quest(seed: int | None = None) -> Dict[str, Any]:
     """Generate a random quest.
 
@@ -208,7 +242,7 @@ def generate_tavern(seed: int | None = None) -> Dict[str, Any]:
         random.seed(seed)
 
     name = f"The {random.choice(TAVERN_ADJECTIVES)} {random.choice(TAVERN_NOUNS)}"
-    features = random.sample(LOCATION_FEATURES["tavern"], k=min(3, len(LOCATION_FEATURES["tavern"])))
+    features = weighted_sample(LOCATION_FEATURES_WEIGHTED["tavern"], 3)
 
     return {
         "type": "tavern",
@@ -231,16 +265,13 @@ def generate_dungeon(seed: int | None = None) -> Dict[str, Any]:
     if seed is not None:
         random.seed(seed)
 
-    # Import name generator
-    from . import name_generator
-
     # Generate location name
     place_name = name_generator.generate_place_name(compound=True)
 
     dungeon_types = ["Crypt", "Cave", "Ruins", "Fortress", "Temple", "Sewers"]
     dungeon_type = random.choice(dungeon_types)
 
-    features = random.sample(LOCATION_FEATURES["dungeon"], k=min(3, len(LOCATION_FEATURES["dungeon"])))
+    features = weighted_sample(LOCATION_FEATURES_WEIGHTED["dungeon"], 3)
 
     # Generate encounter
     num_rooms = random.randint(5, 15)
@@ -268,11 +299,9 @@ def generate_village(seed: int | None = None) -> Dict[str, Any]:
     if seed is not None:
         random.seed(seed)
 
-    from . import name_generator
-
     name = name_generator.generate_place_name(compound=True)
     population = random.randint(50, 500)
-    features = random.sample(LOCATION_FEATURES["village"], k=min(3, len(LOCATION_FEATURES["village"])))
+    features = weighted_sample(LOCATION_FEATURES_WEIGHTED["village"], 3)
 
     # Key NPCs
     has_elder = random.choice([True, False])
@@ -436,6 +465,61 @@ In return, they offer {content['reward']}, {content['complication']}.
     return str(content)
 
 
+# Content type -> generator taking (seed, parsed CLI args)
+_GENERATORS: Dict[str, Callable[[int | None, argparse.Namespace], Dict[str, Any]]] = {
+    "quest": lambda seed, args: generate_quest(seed=seed),
+    "tavern": lambda seed, args: generate_tavern(seed=seed),
+    "dungeon": lambda seed, args: generate_dungeon(seed=seed),
+    "village": lambda seed, args: generate_village(seed=seed),
+    "encounter": lambda seed, args: generate_encounter(cr=getattr(args, "cr", 1), seed=seed),
+    "plot-hook": lambda seed, args: generate_plot_hook(seed=seed),
+}
+
+
+def _stream_content(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    """Yield content items one at a time instead of building a list."""
+    generator = _GENERATORS.get(args.content_type)
+    if generator is None:
+        raise ContentGeneratorError(f"Unknown content type: {args.content_type}")
+
+    for i in range(args.num):
+        # Use seed for first item, then None
+        current_seed = args.seed if args.seed is not None and i == 0 else None
+        yield generator(current_seed, args)
+
+
+def write_content(items: Iterable[Dict[str, Any]], out: TextIO, args: argparse.Namespace) -> None:
+    """Format and write each item as soon as it is generated.
+
+    Only one item is held in memory at a time. JSON arrays are written
+    piecewise with the same layout ``json.dumps(items, indent=2)`` produces.
+
+    Args:
+        items: Content items to write
+        out: Text stream to write to
+        args: Parsed CLI arguments (output format options)
+    """
+    if args.markdown:
+        for i, item in enumerate(items):
+            if i:
+                out.write("\n---\n\n")
+            out.write(format_content_markdown(item))
+        return
+
+    if args.json and args.num == 1:
+        for item in items:
+            out.write(dumps_json(item, args.compact))
+        return
+
+    out.write("[" if args.compact else "[\n")
+    for i, item in enumerate(items):
+        if i:
+            out.write("," if args.compact else ",\n")
+        text = dumps_json(item, args.compact)
+        out.write(text if args.compact else textwrap.indent(text, "  "))
+    out.write("]" if args.compact else "\n]")
+
+
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate procedural content for TTRPG adventures.",
@@ -485,6 +569,9 @@ Examples:
             "--markdown", action="store_true", help="Output as Markdown"
         )
         subparser.add_argument("--json", action="store_true", help="Output as JSON")
+        subparser.add_argument(
+            "--compact", action="store_true", help="Write JSON without indentation"
+        )
         subparser.add_argument("--output", help="Output file (otherwise print to stdout)")
         subparser.add_argument(
             "--log-level",
@@ -514,64 +601,24 @@ def main() -> int:
         return 2
 
     try:
-        content_items: List[Dict[str, Any]] = []
-
-        for i in range(args.num):
-            # Use seed for first item, then None
-            current_seed = args.seed if args.seed is not None and i == 0 else None
-
-            if args.content_type == "quest":
-                item = generate_quest(seed=current_seed)
-            elif args.content_type == "tavern":
-                item = generate_tavern(seed=current_seed)
-            elif args.content_type == "dungeon":
-                item = generate_dungeon(seed=current_seed)
-            elif args.content_type == "village":
-                item = generate_village(seed=current_seed)
-            elif args.content_type == "encounter":
-                cr = getattr(args, "cr", 1)
-                item = generate_encounter(cr=cr, seed=current_seed)
-            elif args.content_type == "plot-hook":
-                item = generate_plot_hook(seed=current_seed)
-            else:
-                logger.error(f"Unknown content type: {args.content_type}")
-                return 2
-
-            content_items.append(item)
-
+        items = _stream_content(args)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                write_content(items, f, args)
+            logger.info(f"Content written to {args.output}")
+        else:
+            write_content(items, sys.stdout, args)
+            sys.stdout.write("\n")
     except ContentGeneratorError as ex:
         logger.error(str(ex))
         return 1
+    except IOError as ex:
+        logger.error(f"Failed to write file: {ex}")
+        return 1
     except Exception as ex:  # noqa: BLE001
         logger.error(f"Unexpected error: {ex}")
         return 1
 
-    # Format output
-    if args.markdown:
-        output = "\n---\n\n".join(
-            format_content_markdown(item) for item in content_items
-        )
-    elif args.json:
-        if args.num == 1:
-            output = json.dumps(content_items[0], indent=2)
-        else:
-            output = json.dumps(content_items, indent=2)
-    else:
-        # Simple text format
-        output = json.dumps(content_items, indent=2)
-
-    # Write output
-    if args.output:
-        try:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(output)
-            logger.info(f"Content written to {args.output}")
-        except IOError as ex:
-            logger.error(f"Failed to write file: {ex}")
-            return 1
-    else:
-        print(output)
-
     return 0
 
 
@@ -7,15 +7,19 @@ keep highest/lowest, and multiple rolls with detailed output.
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import random
 import re
 import sys
 from typing import Any, Dict, List, Tuple
 
+from ._helpers import dumps_json, load_numpy
+
 logger = logging.getLogger(__name__)
 
+# Dice pools at least this large are rolled and summed with numpy when installed
+NUMPY_MIN_DICE = 64
+
 
 class DiceRollerError(RuntimeError):
     """Raised when dice rolling fails."""
@@ -82,6 +86,8 @@ def roll_dice(
     modifier: int = 0,
     keep_mode: str = "",
     seed: int | None = None,
+    include_dropped: bool = True,
+    allow_numpy: bool = True,
 ) -> Dict[str, Any]:
     """Roll dice and return results.
 
@@ -91,6 +97,10 @@ def roll_dice(
         modifier: Modifier to add to total
         keep_mode: Keep expression like "kh3" or "kl2"
         seed: Random seed for reproducibility
+        include_dropped: Whether to fill in dropped_rolls (left empty if False)
+        allow_numpy: Roll pools of ``NUMPY_MIN_DICE`` or more with numpy when it
+            is installed. A ``seed`` always rolls with ``random``, so seeded
+            results do not depend on the pool size or on numpy
 
     Returns:
         Dict with rolls, kept_rolls, dropped_rolls, total, and details
@@ -98,12 +108,21 @@ def roll_dice(
     if seed is not None:
         random.seed(seed)
 
-    # Roll all dice
-    rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
+    # Roll all dice; big pools stay in a numpy array until the result is built
+    big_pool = allow_numpy and seed is None and num_dice >= NUMPY_MIN_DICE
+    np: Any = load_numpy() if big_pool else None
+    use_numpy = np is not None
+    if use_numpy:
+        # Drawn from the module RNG, so random.seed still covers the pool
+        rng = np.random.default_rng(random.getrandbits(64))
+        rolls_arr = rng.integers(1, num_sides, size=num_dice, endpoint=True)
+    else:
+        # One C-level call instead of a randint() per die
+        rolls_arr = random.choices(range(1, num_sides + 1), k=num_dice)
 
     # Handle keep logic
-    kept_rolls = rolls.copy()
-    dropped_rolls: List[int] = []
+    kept_arr = rolls_arr
+    dropped_arr = rolls_arr[:0]
 
     if keep_mode:
         mode, count = parse_keep_expression(keep_mode, num_dice)
@@ -114,11 +133,26 @@ def roll_dice(
         elif count < 1:
             raise DiceRollerError("Keep count must be at least 1")
         else:
-            sorted_rolls = sorted(rolls, reverse=(mode == "highest"))
-            kept_rolls = sorted_rolls[:count]
-            dropped_rolls = sorted_rolls[count:]
-
-    total = sum(kept_rolls) + modifier
+            if use_numpy:
+                sorted_rolls = np.sort(rolls_arr)
+                if mode == "highest":
+                    sorted_rolls = sorted_rolls[::-1]
+            else:
+                sorted_rolls = sorted(rolls_arr, reverse=(mode == "highest"))
+            kept_arr = sorted_rolls[:count]
+            if include_dropped:
+                dropped_arr = sorted_rolls[count:]
+
+    if use_numpy:
+        total = int(kept_arr.sum()) + modifier
+        rolls = rolls_arr.tolist()
+        kept_rolls = kept_arr.tolist()
+        dropped_rolls: List[int] = dropped_arr.tolist()
+    else:
+        total = sum(kept_arr) + modifier
+        rolls = rolls_arr
+        kept_rolls = list(kept_arr)
+        dropped_rolls = list(dropped_arr)
 
     return {
         "rolls": rolls,
@@ -259,6 +293,7 @@ Examples:
         "--verbose", action="store_true", help="Show detailed roll breakdown"
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
     parser.add_argument(
         "--log-level",
         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
@@ -282,6 +317,8 @@ def main() -> int:
         return 2
 
     results: List[Dict[str, Any]] = []
+    # Plain output never shows dropped dice, so skip collecting them
+    include_dropped = args.verbose or args.json
 
     try:
         for i in range(args.repeat):
@@ -297,7 +334,14 @@ def main() -> int:
                     args.notation
                 )
                 result = roll_dice(
-                    num_dice, num_sides, modifier, keep_mode, seed=current_seed
+                    num_dice,
+                    num_sides,
+                    modifier,
+                    keep_mode,
+                    seed=current_seed,
+                    include_dropped=include_dropped,
+                    # Later rolls of a seeded run get no seed of their own
+                    allow_numpy=args.seed is None,
                 )
 
             results.append(result)
@@ -310,9 +354,9 @@ def main() -> int:
 
     if args.json:
         if args.repeat == 1:
-            print(json.dumps(results[0], indent=2))
+            print(dumps_json(results[0], args.compact))
         else:
-            print(json.dumps(results, indent=2))
+            print(dumps_json(results, args.compact))
     else:
         for i, result in enumerate(results):
             if args.repeat > 1:
@@ -7,147 +7,173 @@ fantasy races, locations, and magical items.
 from __future__ import annotations
 
 import argparse
-import json
+import bisect
+import functools
+import itertools
 import logging
 import random
 import sys
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ._helpers import dumps_json, load_numpy
 
 logger = logging.getLogger(__name__)
 
+# --log-level choices mapped straight to logging levels
+_LOG_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name) for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+}
+
 
 class NameGeneratorError(RuntimeError):
     """Raised when name generation fails."""
 
 
-# Syllable banks for different name types
-NAME_PATTERNS: Dict[str, Dict[str, List[str]]] = {
-    "human_male": {
-        "first": ["Ald", "Bran", "Ced", "Dar", "Ed", "Finn", "Gar", "Hal", "Ian"],
-        "middle": ["ar", "or", "er", "an", "on", "en", "al", "ol"],
-        "last": ["ric", "win", "ton", "wald", "bert", "fred", "red", "mund"],
-    },
-    "human_female": {
-        "first": ["Al", "Bel", "Cel", "Del", "El", "Fel", "Gwen", "Hel", "Il"],
-        "middle": ["a", "i", "e", "la", "na", "ra", "sa", "ta"],
-        "last": ["ria", "dra", "na", "ra", "la", "ssa", "nda", "tha"],
-    },
-    "elf_male": {
-        "first": ["Aeg", "Cael", "Gal", "Luth", "Sil", "Thran", "Leg", "El"],
-        "middle": ["a", "o", "i", "or", "and", "ion", "dir"],
-        "last": ["las", "dor", "mir", "dir", "ion", "oth", "wen", "rion"],
-    },
-    "elf_female": {
-        "first": ["Ar", "Gal", "Cel", "Luth", "Sil", "Aer", "Nim"],
-        "middle": ["wen", "iel", "eth", "iel", "anna", "reth"],
-        "last": ["wen", "driel", "iel", "eth", "riel", "las", "anna"],
-    },
-    "dwarf_male": {
-        "first": ["Bal", "Dur", "Gim", "Thor", "Bom", "Gro", "Dwa"],
-        "middle": ["in", "li", "im", "or", "ur", "om"],
-        "last": ["in", "li", "ur", "im", "or", "bur", "dil", "rim"],
-    },
-    "dwarf_female": {
-        "first": ["Dis", "Gret", "Hild", "Kar", "Ris"],
-        "middle": ["a", "i", "el", "da"],
-        "last": ["da", "na", "tha", "dris", "nir"],
-    },
-    "orc": {
-        "first": ["Grom", "Durg", "Thrak", "Ug", "Mag", "Grok", "Skar"],
-        "middle": ["ash", "nak", "gul", "rak", "ush"],
-        "last": ["ug", "tar", "ash", "gul", "nak", "rim"],
-    },
-    "halfling": {
-        "first": ["Bil", "Mer", "Pip", "Sam", "Fro", "Tob"],
-        "middle": ["bo", "ry", "pin", "wi", "do"],
-        "last": ["bo", "pins", "wise", "gins", "dle"],
-    },
-}
-
-PLACE_PATTERNS: Dict[str, List[str]] = {
-    "prefix": [
-        "North",
-        "South",
-        "East",
-        "West",
-        "New",
-        "Old",
-        "High",
-        "Low",
-        "Silver",
-        "Gold",
-        "Iron",
-        "Stone",
-        "River",
-        "Lake",
-        "Mountain",
-        "Forest",
-        "Shadow",
-        "Dragon",
-        "King",
-        "Queen",
-    ],
-    "suffix": [
-        "dale",
-        "haven",
-        "ford",
-        "shire",
-        "ton",
-        "ville",
-        "port",
-        "burg",
-        "wood",
-        "mere",
-        "mount",
-        "fall",
-        "gate",
-        "keep",
-        "hold",
-    ],
-}
+def _freeze(mapping: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a (nested) dict literal in read-only MappingProxyType views."""
+    return MappingProxyType(
+        {
+            key: _freeze(value) if isinstance(value, dict) else value
+            for key, value in mapping.items()
+        }
+    )
 
-ITEM_PATTERNS: Dict[str, List[str]] = {
-    "prefix": [
-        "Flaming",
-        "Frost",
-        "Thunder",
-        "Lightning",
-        "Shadow",
-        "Vorpal",
-        "Holy",
-        "Unholy",
-        "Keen",
-        "Returning",
-        "Dancing",
-        "Defending",
-    ],
-    "base": [
-        "Sword",
-        "Blade",
-        "Axe",
-        "Hammer",
-        "Staff",
-        "Wand",
-        "Bow",
-        "Dagger",
-        "Mace",
-        "Spear",
-    ],
-    "suffix": [
-        "of Power",
-        "of the Bear",
-        "of the Eagle",
-        "of Slaying",
-        "of Protection",
-        "of Speed",
-        "of Wisdom",
-        "of Valor",
-        "+1",
-        "+2",
-    ],
-}
 
-SURNAME_PATTERNS: List[str] = [
+# Syllable banks for different name types
+NAME_PATTERNS: Mapping[str, Mapping[str, Tuple[str, ...]]] = _freeze(
+    {
+        "human_male": {
+            "first": ("Ald", "Bran", "Ced", "Dar", "Ed", "Finn", "Gar", "Hal", "Ian"),
+            "middle": ("ar", "or", "er", "an", "on", "en", "al", "ol"),
+            "last": ("ric", "win", "ton", "wald", "bert", "fred", "red", "mund"),
+        },
+        "human_female": {
+            "first": ("Al", "Bel", "Cel", "Del", "El", "Fel", "Gwen", "Hel", "Il"),
+            "middle": ("a", "i", "e", "la", "na", "ra", "sa", "ta"),
+            "last": ("ria", "dra", "na", "ra", "la", "ssa", "nda", "tha"),
+        },
+        "elf_male": {
+            "first": ("Aeg", "Cael", "Gal", "Luth", "Sil", "Thran", "Leg", "El"),
+            "middle": ("a", "o", "i", "or", "and", "ion", "dir"),
+            "last": ("las", "dor", "mir", "dir", "ion", "oth", "wen", "rion"),
+        },
+        "elf_female": {
+            "first": ("Ar", "Gal", "Cel", "Luth", "Sil", "Aer", "Nim"),
+            "middle": ("wen", "iel", "eth", "iel", "anna", "reth"),
+            "last": ("wen", "driel", "iel", "eth", "riel", "las", "anna"),
+        },
+        "dwarf_male": {
+            "first": ("Bal", "Dur", "Gim", "Thor", "Bom", "Gro", "Dwa"),
+            "middle": ("in", "li", "im", "or", "ur", "om"),
+            "last": ("in", "li", "ur", "im", "or", "bur", "dil", "rim"),
+        },
+        "dwarf_female": {
+            "first": ("Dis", "Gret", "Hild", "Kar", "Ris"),
+            "middle": ("a", "i", "el", "da"),
+            "last": ("da", "na", "tha", "dris", "nir"),
+        },
+        "orc": {
+            "first": ("Grom", "Durg", "Thrak", "Ug", "Mag", "Grok", "Skar"),
+            "middle": ("ash", "nak", "gul", "rak", "ush"),
+            "last": ("ug", "tar", "ash", "gul", "nak", "rim"),
+        },
+        "halfling": {
+            "first": ("Bil", "Mer", "Pip", "Sam", "Fro", "Tob"),
+            "middle": ("bo", "ry", "pin", "wi", "do"),
+            "last": ("bo", "pins", "wise", "gins", "dle"),
+        },
+    }
+)
+
+PLACE_PATTERNS: Mapping[str, Tuple[str, ...]] = _freeze(
+    {
+        "prefix": (
+            "North",
+            "South",
+            "East",
+            "West",
+            "New",
+            "Old",
+            "High",
+            "Low",
+            "Silver",
+            "Gold",
+            "Iron",
+            "Stone",
+            "River",
+            "Lake",
+            "Mountain",
+            "Forest",
+            "Shadow",
+            "Dragon",
+            "King",
+            "Queen",
+        ),
+        "suffix": (
+            "dale",
+            "haven",
+            "ford",
+            "shire",
+            "ton",
+            "ville",
+            "port",
+            "burg",
+            "wood",
+            "mere",
+            "mount",
+            "fall",
+            "gate",
+            "keep",
+            "hold",
+        ),
+    }
+)
+
+ITEM_PATTERNS: Mapping[str, Tuple[str, ...]] = _freeze(
+    {
+        "prefix": (
+            "Flaming",
+            "Frost",
+            "Thunder",
+            "Lightning",
+            "Shadow",
+            "Vorpal",
+            "Holy",
+            "Unholy",
+            "Keen",
+            "Returning",
+            "Dancing",
+            "Defending",
+        ),
+        "base": (
+            "Sword",
+            "Blade",
+            "Axe",
+            "Hammer",
+            "Staff",
+            "Wand",
+            "Bow",
+            "Dagger",
+            "Mace",
+            "Spear",
+        ),
+        "suffix": (
+            "of Power",
+            "of the Bear",
+            "of the Eagle",
+            "of Slaying",
+            "of Protection",
+            "of Speed",
+            "of Wisdom",
+            "of Valor",
+            "+1",
+            "+2",
+        ),
+    }
+)
+
+SURNAME_PATTERNS: Tuple[str, ...] = (
     "Smith",
     "Miller",
     "Cooper",
@@ -161,7 +187,104 @@ SURNAME_PATTERNS: List[str] = [
     "Brewer",
     "Fisher",
     "Hunter",
-]
+)
+
+# Below this many names one weighted draw per pattern beats the numpy path
+NUMPY_MIN_NAMES = 256
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_arrays() -> Tuple[Dict[str, Dict[str, Any]], Any]:
+    """Return the NAME_PATTERNS banks and surnames as numpy object arrays.
+
+    Built on the first numpy batch; requires numpy to be installed.
+    """
+    np = load_numpy()
+    patterns = {
+        key: {part: np.array(syllables, dtype=object) for part, syllables in pattern.items()}
+        for key, pattern in NAME_PATTERNS.items()
+    }
+    return patterns, np.array(SURNAME_PATTERNS, dtype=object)
+
+
+def _normalize_race(race: str) -> str:
+    """Lower-case a race name, falling back to human for unknown races."""
+    race = race.lower()
+    if race not in ["human", "elf", "dwarf", "orc", "halfling"]:
+        return "human"
+    return race
+
+
+def _batch_rng(rng: random.Random | None, seed: int | None) -> Any:
+    """Pick the generator a batch draws from.
+
+    An explicit ``rng`` wins, then a private ``random.Random(seed)``. Otherwise
+    the ``random`` module itself is used: its functions share one global
+    generator, so a single ``random.seed`` in ``main`` still covers the batch.
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
+
+
+@functools.lru_cache(maxsize=None)
+def _name_table(key: str) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Flatten first x (middle | none) x last for one pattern into a weighted table.
+
+    Built once per pattern key so a whole name costs a single weighted draw.
+    The middle syllable appears 70% of the time.
+
+    Returns:
+        Tuple of (names, cumulative weights)
+    """
+    pattern = NAME_PATTERNS[key]
+    middles = pattern["middle"]
+    middle_options = [("", 0.3)] + [(middle, 0.7 / len(middles)) for middle in middles]
+
+    population: List[str] = []
+    weights: List[float] = []
+    for first, (middle, weight), last in itertools.product(
+        pattern["first"], middle_options, pattern["last"]
+    ):
+        population.append(f"{first}{middle}{last}")
+        weights.append(weight)
+
+    return tuple(population), tuple(itertools.accumulate(weights))
+
+
+def _draw_character_names(
+    race: str, gender: str | None, num: int, surname: bool, rng: Any = random
+) -> List[str]:
+    """Draw names with one weighted ``rng.choices`` call per pattern."""
+    race = _normalize_race(race)
+    choices = rng.choices
+
+    # Orcs and halflings don't have gender-specific patterns
+    if race in ["orc", "halfling"]:
+        keys = [race] * num
+    elif gender is None:
+        keys = [f"{race}_{g}" for g in choices(["male", "female"], k=num)]
+    else:
+        keys = [f"{race}_{gender.lower()}"] * num
+
+    names = [""] * num
+    for key in dict.fromkeys(keys):
+        if key not in NAME_PATTERNS:
+            raise NameGeneratorError(f"Unknown name pattern: {key}")
+        population, cum_weights = _name_table(key)
+        idx = [i for i, k in enumerate(keys) if k == key]
+        drawn = choices(population, cum_weights=cum_weights, k=len(idx))
+        for i, name in zip(idx, drawn):
+            names[i] = name
+
+    # Add surname if requested
+    if surname:
+        surnames = choices(SURNAME_PATTERNS, k=num)
+        names = [f"{first} {last}" for first, last in zip(names, surnames)]
+
+    return names
 
 
 def generate_character_name(
@@ -178,43 +301,190 @@ def generate_character_name(
     Returns:
         Generated name
     """
-    if seed is not None:
-        random.seed(seed)
+    return _draw_character_names(race, gender, 1, surname, _batch_rng(None, seed))[0]
+
+
+def generate_character_names(
+    race: str,
+    gender: str | None = None,
+    num: int = 1,
+    surname: bool = False,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+    allow_numpy: bool = True,
+) -> List[str]:
+    """Generate many character names at once.
+
+    Unseeded batches of at least ``NUMPY_MIN_NAMES`` with numpy installed draw
+    every syllable slot for the whole batch in one numpy call; smaller batches,
+    and any batch given a ``seed`` or ``rng``, draw whole names from the
+    precomputed per-pattern table, so seeded names do not depend on the batch
+    size or on numpy. A random gender is picked per name when ``gender`` is None.
 
-    # Normalize race
-    race = race.lower()
-    if race not in ["human", "elf", "dwarf", "orc", "halfling"]:
-        race = "human"
+    Args:
+        race: Race type (human, elf, dwarf, orc, halfling)
+        gender: Gender (male/female), random per name if None
+        num: Number of names to generate
+        surname: Whether to add a surname
+        seed: Random seed for a private generator; leave as None when the
+            caller has already seeded ``random`` for the whole batch
+        rng: ``random.Random`` instance to draw from (overrides ``seed``)
+        allow_numpy: Use the numpy path for big unseeded batches; callers that
+            seeded ``random`` themselves turn it off
+
+    Returns:
+        List of generated names
+    """
+    seeded = seed is not None or rng is not None
+    py_rng = _batch_rng(rng, seed)
+    big_batch = allow_numpy and not seeded and num >= NUMPY_MIN_NAMES
+    np: Any = load_numpy() if big_batch else None
+    if np is None:
+        return _draw_character_names(race, gender, num, surname, py_rng)
 
-    # Handle gender
-    if gender is None:
-        gender = random.choice(["male", "female"])
-    gender = gender.lower()
+    # Drawn from the module RNG, so random.seed still covers the batch
+    np_rng = np.random.default_rng(py_rng.getrandbits(64))
+    race = _normalize_race(race)
 
     # Orcs and halflings don't have gender-specific patterns
+    if race in ["orc", "halfling"]:
+        keys = np.full(num, race, dtype=object)
+    elif gender is None:
+        keys = race + "_" + np_rng.choice(np.array(["male", "female"], dtype=object), size=num)
+    else:
+        keys = np.full(num, f"{race}_{gender.lower()}", dtype=object)
+
+    pattern_arrays, surname_array = _pattern_arrays()
+    names = np.empty(num, dtype=object)
+    for key in dict.fromkeys(keys.tolist()):
+        if key not in pattern_arrays:
+            raise NameGeneratorError(f"Unknown name pattern: {key}")
+        pattern = pattern_arrays[key]
+        idx = np.flatnonzero(keys == key)
+        count = len(idx)
+
+        first = np_rng.choice(pattern["first"], size=count)
+        middle = np.where(
+            np_rng.random(count) > 0.3, np_rng.choice(pattern["middle"], size=count), ""
+        )
+        last = np_rng.choice(pattern["last"], size=count)
+        names[idx] = first + middle + last
+
+    if surname:
+        names = names + " " + np_rng.choice(surname_array, size=num)
+
+    result: List[str] = names.tolist()
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _markov_table(
+    pattern_key: str, order: int = 2
+) -> Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...]]]:
+    """Build a character-level Markov transition table for a name pattern.
+
+    The chain is trained on every first + (middle) + last combination of the
+    syllable bank and cached per pattern, so it is built at most once per
+    process. ``^`` pads the start state and ``$`` marks the end of a name.
+
+    Returns:
+        Mapping of state -> (next characters, cumulative counts)
+    """
+    pattern = NAME_PATTERNS[pattern_key]
+    counts: Dict[str, Dict[str, int]] = {}
+    for first, middle, last in itertools.product(
+        pattern["first"], ("",) + tuple(pattern["middle"]), pattern["last"]
+    ):
+        padded = "^" * order + first + middle + last + "$"
+        for i in range(order, len(padded)):
+            followers = counts.setdefault(padded[i - order : i], {})
+            followers[padded[i]] = followers.get(padded[i], 0) + 1
+
+    return {
+        state: (tuple(followers), tuple(itertools.accumulate(followers.values())))
+        for state, followers in counts.items()
+    }
+
+
+def generate_markov_name(
+    race: str,
+    gender: str | None = None,
+    surname: bool = False,
+    seed: int | None = None,
+    max_length: int = 12,
+    order: int = 2,
+) -> str:
+    """Generate a character name by walking a Markov chain over letters.
+
+    Produces names that blend the race's syllables instead of gluing whole
+    syllables together. Each letter costs one uniform draw and a bisect.
+
+    Args:
+        race: Race type (human, elf, dwarf, orc, halfling)
+        gender: Gender (male/female), random if None
+        surname: Whether to add a surname
+        seed: Random seed
+        max_length: Maximum number of letters in the first name
+        order: Number of preceding letters each letter is drawn from
+
+    Returns:
+        Generated name
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    race = _normalize_race(race)
     if race in ["orc", "halfling"]:
         pattern_key = race
     else:
-        pattern_key = f"{race}_{gender}"
+        pattern_key = f"{race}_{(gender or random.choice(['male', 'female'])).lower()}"
 
     if pattern_key not in NAME_PATTERNS:
         raise NameGeneratorError(f"Unknown name pattern: {pattern_key}")
 
-    pattern = NAME_PATTERNS[pattern_key]
-
-    # Build first name
-    first = random.choice(pattern["first"])
-    if "middle" in pattern and random.random() > 0.3:
-        first += random.choice(pattern["middle"])
-    if "last" in pattern:
-        first += random.choice(pattern["last"])
+    table = _markov_table(pattern_key, order)
+    # Retry walks that run past max_length rather than cutting a name short
+    for _ in range(10):
+        state = "^" * order
+        letters: List[str] = []
+        while len(letters) < max_length:
+            followers, cum_counts = table[state]
+            letter = followers[bisect.bisect(cum_counts, random.random() * cum_counts[-1])]
+            if letter == "$":
+                break
+            letters.append(letter)
+            state = state[1:] + letter
+        else:
+            continue
+        break
 
-    # Add surname if requested
+    name = "".join(letters)
     if surname:
-        last = random.choice(SURNAME_PATTERNS)
-        return f"{first} {last}"
+        return f"{name} {random.choice(SURNAME_PATTERNS)}"
+    return name
+
 
-    return first
+def generate_place_names(
+    compound: bool = True,
+    num: int = 1,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> List[str]:
+    """Generate several place names.
+
+    Args:
+        compound: Whether to use compound names (e.g., Silverdale)
+        num: Number of names to generate
+        seed: Random seed for a private generator
+        rng: ``random.Random`` instance to draw from (overrides ``seed``)
+
+    Returns:
+        List of generated place names
+    """
+    choices = _batch_rng(rng, seed).choices
+    prefixes = choices(PLACE_PATTERNS["prefix"], k=num)
+    suffixes = choices(PLACE_PATTERNS["suffix"], k=num)
+    return [f"{prefix}{suffix}" for prefix, suffix in zip(prefixes, suffixes)]
 
 
 def generate_place_name(compound: bool = True, seed: int | None = None) -> str:
@@ -227,56 +497,83 @@ def generate_place_name(compound: bool = True, seed: int | None = None) -> str:
     Returns:
         Generated place name
     """
-    if seed is not None:
-        random.seed(seed)
+    return generate_place_names(compound, 1, seed=seed)[0]
 
-    if compound:
-        prefix = random.choice(PLACE_PATTERNS["prefix"])
-        suffix = random.choice(PLACE_PATTERNS["suffix"])
-        return f"{prefix}{suffix}"
 
-    # Simple name
-    return random.choice(PLACE_PATTERNS["prefix"]) + random.choice(
-        PLACE_PATTERNS["suffix"]
-    )
+@functools.lru_cache(maxsize=None)
+def _item_name_table(prefix_chance: float) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Flatten (prefix | none) x base x (suffix | none) into one weighted table.
 
+    Built once per ``prefix_chance`` so each magical item name costs a single
+    weighted draw. Suffixes appear 60% of the time.
 
-def generate_item_name(
-    magical: bool = True, prefix_chance: float = 0.7, seed: int | None = None
-) -> str:
-    """Generate an item name.
+    Returns:
+        Tuple of (names, cumulative weights)
+    """
+    prefix_chance = min(max(prefix_chance, 0.0), 1.0)
+    prefixes = ITEM_PATTERNS["prefix"]
+    suffixes = ITEM_PATTERNS["suffix"]
+    prefix_options = [("", 1.0 - prefix_chance)]
+    prefix_options += [(p, prefix_chance / len(prefixes)) for p in prefixes]
+    suffix_options = [("", 0.4)] + [(s, 0.6 / len(suffixes)) for s in suffixes]
+
+    population: List[str] = []
+    weights: List[float] = []
+    for (prefix, prefix_weight), base, (suffix, suffix_weight) in itertools.product(
+        prefix_options, ITEM_PATTERNS["base"], suffix_options
+    ):
+        population.append(" ".join(part for part in (prefix, base, suffix) if part))
+        weights.append(prefix_weight * suffix_weight)
+
+    return tuple(population), tuple(itertools.accumulate(weights))
+
+
+def generate_item_names(
+    magical: bool = True,
+    prefix_chance: float = 0.7,
+    num: int = 1,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> List[str]:
+    """Generate several item names.
 
     Args:
         magical: Whether to generate magical item names
         prefix_chance: Probability of adding a prefix (0.0-1.0)
-        seed: Random seed
+        num: Number of names to generate
+        seed: Random seed for a private generator
+        rng: ``random.Random`` instance to draw from (overrides ``seed``)
 
     Returns:
-        Generated item name
+        List of generated item names
     """
-    if seed is not None:
-        random.seed(seed)
-
-    base = random.choice(ITEM_PATTERNS["base"])
-
+    choices = _batch_rng(rng, seed).choices
     if not magical:
-        return base
+        return choices(ITEM_PATTERNS["base"], k=num)
 
-    # Build magical name
-    name_parts = []
+    population, cum_weights = _item_name_table(prefix_chance)
+    return choices(population, cum_weights=cum_weights, k=num)
 
-    if random.random() < prefix_chance:
-        name_parts.append(random.choice(ITEM_PATTERNS["prefix"]))
 
-    name_parts.append(base)
+def generate_item_name(
+    magical: bool = True, prefix_chance: float = 0.7, seed: int | None = None
+) -> str:
+    """Generate an item name.
 
-    if random.random() > 0.4:
-        name_parts.append(random.choice(ITEM_PATTERNS["suffix"]))
+    Args:
+        magical: Whether to generate magical item names
+        prefix_chance: Probability of adding a prefix (0.0-1.0)
+        seed: Random seed
 
-    return " ".join(name_parts)
+    Returns:
+        Generated item name
+    """
+    return generate_item_names(magical, prefix_chance, 1, seed=seed)[0]
 
 
-def parse_arguments() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; later calls in the same process reuse it."""
     parser = argparse.ArgumentParser(
         description="Generate fantasy names for characters, places, and items.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -287,6 +584,7 @@ Examples:
   name_generator.py place --num 10
   name_generator.py item --magical --num 3
   name_generator.py character --race dwarf --json
+  name_generator.py character --race elf --markov --num 5
         """,
     )
     subparsers = parser.add_subparsers(dest="type", help="Type of name to generate")
@@ -305,6 +603,11 @@ Examples:
     char_parser.add_argument(
         "--surname", action="store_true", help="Include surname"
     )
+    char_parser.add_argument(
+        "--markov",
+        action="store_true",
+        help="Build names letter by letter with a Markov chain",
+    )
 
     # Place name parser
     place_parser = subparsers.add_parser("place", help="Generate place names")
@@ -333,21 +636,28 @@ Examples:
             "--seed", type=int, help="Random seed for reproducibility"
         )
         subparser.add_argument("--json", action="store_true", help="Output as JSON")
+        subparser.add_argument(
+            "--compact", action="store_true", help="Write JSON without indentation"
+        )
         subparser.add_argument(
             "--log-level",
-            choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+            choices=tuple(_LOG_LEVELS),
             default="WARNING",
             help="Logging verbosity",
         )
 
-    return parser.parse_args()
+    return parser
+
 
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
-def main() -> int:
-    args = parse_arguments()
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
 
     logging.basicConfig(
-        level=getattr(logging, args.log_level.upper(), logging.WARNING),
+        level=_LOG_LEVELS.get(args.log_level, logging.WARNING),
         format="%(message)s",
         stream=sys.stderr,
     )
@@ -360,28 +670,26 @@ def main() -> int:
         logger.error("--num must be at least 1")
         return 2
 
+    # Seed once for the whole batch; the generators then draw from ``random``
+    if args.seed is not None:
+        random.seed(args.seed)
+
     try:
-        names: List[str] = []
-
-        for i in range(args.num):
-            # Use seed for first generation, then None
-            current_seed = args.seed if args.seed is not None and i == 0 else None
-
-            if args.type == "character":
-                name = generate_character_name(
-                    args.race, args.gender, args.surname, seed=current_seed
-                )
-            elif args.type == "place":
-                name = generate_place_name(args.compound, seed=current_seed)
-            elif args.type == "item":
-                name = generate_item_name(
-                    args.magical, args.prefix_chance, seed=current_seed
-                )
-            else:
-                logger.error(f"Unknown name type: {args.type}")
-                return 2
-
-            names.append(name)
+        if args.type == "character" and args.markov:
+            names = [
+                generate_markov_name(args.race, args.gender, args.surname) for _ in range(args.num)
+            ]
+        elif args.type == "character":
+            names = generate_character_names(
+                args.race, args.gender, args.num, args.surname, allow_numpy=args.seed is None
+            )
+        elif args.type == "place":
+            names = generate_place_names(args.compound, args.num)
+        elif args.type == "item":
+            names = generate_item_names(args.magical, args.prefix_chance, args.num)
+        else:
+            logger.error(f"Unknown name type: {args.type}")
+            return 2
 
     except NameGeneratorError as ex:
         logger.error(str(ex))
@@ -392,9 +700,9 @@ def main() -> int:
 
     if args.json:
         if args.num == 1:
-            print(json.dumps({"name": names[0]}, indent=2))
+            print(dumps_json({"name": names[0]}, args.compact))
         else:
-            print(json.dumps({"names": names}, indent=2))
+            print(dumps_json({"names": names}, args.compact))
     else:
         for name in names:
             print(name)
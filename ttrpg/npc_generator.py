@@ -7,21 +7,108 @@ Supports D&D 5e-style stat blocks with Markdown and JSON output.
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import logging
+import os
 import random
 import sys
-from typing import Any, Dict, List
+import textwrap
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple
+
+from . import name_generator
+from ._helpers import dumps_json, load_numpy
 
 logger = logging.getLogger(__name__)
 
+# --log-level choices mapped straight to logging levels
+_LOG_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name) for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+}
+
+# Shared numpy generator for unseeded ability rolls, created on first use.
+# Seeded runs roll with ``random`` alone, so their NPCs do not depend on numpy
+_np_rng: Any = None
+_seeded = False
+
+# Without numpy, unseeded batches at least this large are spread across worker
+# processes. One NPC costs ~20us, so smaller batches finish before a pool has started.
+PARALLEL_MIN_NPCS = 5000
+
+# NPCs generated together as one structured array block
+SCORE_BATCH_SIZE = 1024
+
 
 class NPCGeneratorError(RuntimeError):
     """Raised when NPC generation fails."""
 
 
+@dataclass
+class NPC:
+    """A generated NPC stat block.
+
+    Declares ``__slots__`` by hand (``dataclass(slots=True)`` needs Python 3.10)
+    so each NPC carries no per-instance ``__dict__``.
+    """
+
+    __slots__ = (
+        "name",
+        "race",
+        "char_class",
+        "level",
+        "background",
+        "alignment",
+        "ability_scores",
+        "ability_modifiers",
+        "proficiency_bonus",
+        "armor_class",
+        "hit_points",
+        "hit_dice",
+        "personality",
+        "equipment",
+    )
+
+    name: str
+    race: str
+    char_class: str
+    level: int
+    background: str
+    alignment: str
+    ability_scores: Dict[str, int]
+    ability_modifiers: Dict[str, int]
+    proficiency_bonus: int
+    armor_class: int
+    hit_points: int
+    hit_dice: str
+    personality: Dict[str, str]
+    equipment: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the NPC as a plain dictionary using the JSON key names."""
+        return {
+            "name": self.name,
+            "race": self.race,
+            "class": self.char_class,
+            "level": self.level,
+            "background": self.background,
+            "alignment": self.alignment,
+            "ability_scores": self.ability_scores,
+            "ability_modifiers": self.ability_modifiers,
+            "proficiency_bonus": self.proficiency_bonus,
+            "armor_class": self.armor_class,
+            "hit_points": self.hit_points,
+            "hit_dice": self.hit_dice,
+            "personality": self.personality,
+            "equipment": self.equipment,
+        }
+
+
+# Playable races
+RACES: Tuple[str, ...] = ("human", "elf", "dwarf", "halfling", "orc")
+
 # D&D 5e classes
-CLASSES = [
+CLASSES: Tuple[str, ...] = (
     "Barbarian",
     "Bard",
     "Cleric",
@@ -34,10 +121,10 @@ CLASSES = [
     "Sorcerer",
     "Warlock",
     "Wizard",
-]
+)
 
 # Common backgrounds
-BACKGROUNDS = [
+BACKGROUNDS: Tuple[str, ...] = (
     "Acolyte",
     "Criminal",
     "Folk Hero",
@@ -48,10 +135,10 @@ BACKGROUNDS = [
     "Sailor",
     "Entertainer",
     "Outlander",
-]
+)
 
 # Personality traits
-PERSONALITY_TRAITS = [
+PERSONALITY_TRAITS: Tuple[str, ...] = (
     "I am always polite and respectful",
     "I am haunted by memories of war",
     "I judge others by their actions, not their words",
@@ -60,50 +147,117 @@ PERSONALITY_TRAITS = [
     "I am suspicious of strangers",
     "I have a strong sense of fair play",
     "I am slow to trust others",
-]
+)
 
-IDEALS = [
+IDEALS: Tuple[str, ...] = (
     "Respect - People deserve to be treated with dignity",
     "Freedom - Everyone should be free to pursue their own destiny",
     "Charity - I always help those in need",
     "Power - I seek to become powerful",
     "Honor - I don't steal from others",
     "Knowledge - The path to power is through knowledge",
-]
+)
 
-BONDS = [
+BONDS: Tuple[str, ...] = (
     "My family is the most important thing in my life",
     "I owe my life to my mentor",
     "I seek revenge on those who wronged me",
     "I protect those who cannot protect themselves",
     "I am searching for someone important to me",
     "My honor is my life",
-]
+)
 
-FLAWS = [
+FLAWS: Tuple[str, ...] = (
     "I can't resist a pretty face",
     "I am too greedy for my own good",
     "I have a weakness for vice",
     "I turn tail and run when things look bad",
     "I am convinced that no one could be as smart as me",
     "I have a secret that could ruin me",
-]
+)
 
 # Simple equipment by class
-EQUIPMENT = {
-    "Barbarian": ["Greataxe", "Handaxe", "Hide Armor", "Explorer's Pack"],
-    "Bard": ["Rapier", "Lute", "Leather Armor", "Diplomat's Pack"],
-    "Cleric": ["Mace", "Chain Mail", "Shield", "Holy Symbol", "Priest's Pack"],
-    "Druid": ["Quarterstaff", "Leather Armor", "Druidic Focus", "Explorer's Pack"],
-    "Fighter": ["Longsword", "Shield", "Chain Mail", "Dungeoner's Pack"],
-    "Monk": ["Quarterstaff", "Darts (10)", "Explorer's Pack"],
-    "Paladin": ["Longsword", "Shield", "Chain Mail", "Holy Symbol", "Priest's Pack"],
-    "Ranger": ["Longbow", "Quiver (20 arrows)", "Leather Armor", "Explorer's Pack"],
-    "Rogue": ["Shortsword", "Shortbow", "Leather Armor", "Burglar's Pack", "Thieves' Tools"],
-    "Sorcerer": ["Dagger", "Component Pouch", "Explorer's Pack"],
-    "Warlock": ["Dagger", "Leather Armor", "Component Pouch", "Scholar's Pack"],
-    "Wizard": ["Quarterstaff", "Component Pouch", "Scholar's Pack", "Spellbook"],
-}
+EQUIPMENT: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "Barbarian": ("Greataxe", "Handaxe", "Hide Armor", "Explorer's Pack"),
+        "Bard": ("Rapier", "Lute", "Leather Armor", "Diplomat's Pack"),
+        "Cleric": ("Mace", "Chain Mail", "Shield", "Holy Symbol", "Priest's Pack"),
+        "Druid": ("Quarterstaff", "Leather Armor", "Druidic Focus", "Explorer's Pack"),
+        "Fighter": ("Longsword", "Shield", "Chain Mail", "Dungeoner's Pack"),
+        "Monk": ("Quarterstaff", "Darts (10)", "Explorer's Pack"),
+        "Paladin": ("Longsword", "Shield", "Chain Mail", "Holy Symbol", "Priest's Pack"),
+        "Ranger": ("Longbow", "Quiver (20 arrows)", "Leather Armor", "Explorer's Pack"),
+        "Rogue": ("Shortsword", "Shortbow", "Leather Armor", "Burglar's Pack", "Thieves' Tools"),
+        "Sorcerer": ("Dagger", "Component Pouch", "Explorer's Pack"),
+        "Warlock": ("Dagger", "Leather Armor", "Component Pouch", "Scholar's Pack"),
+        "Wizard": ("Quarterstaff", "Component Pouch", "Scholar's Pack", "Spellbook"),
+    }
+)
+
+ABILITIES: Tuple[str, ...] = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+# Ability modifier for every legal score (0-30)
+_MODIFIER_TABLE: Tuple[int, ...] = tuple((score - 10) // 2 for score in range(31))
+
+# Column layout for batch generation: one structured array per batch instead
+# of one object per NPC. Text columns hold indexes into the tables above.
+_NPC_FIELDS: Tuple[Tuple[Any, ...], ...] = (
+    ("name", "O"),
+    ("race", "u1"),
+    ("class", "u1"),
+    ("scores", "u1", (6,)),
+    ("hp", "i2"),
+    ("ac", "u1"),
+    ("trait", "u1"),
+    ("ideal", "u1"),
+    ("bond", "u1"),
+    ("flaw", "u1"),
+    ("background", "u1"),
+)
+
+# Hit die size by class
+HIT_DICE: Mapping[str, int] = MappingProxyType(
+    {
+        "Barbarian": 12,
+        "Fighter": 10,
+        "Paladin": 10,
+        "Ranger": 10,
+        "Bard": 8,
+        "Cleric": 8,
+        "Druid": 8,
+        "Monk": 8,
+        "Rogue": 8,
+        "Warlock": 8,
+        "Sorcerer": 6,
+        "Wizard": 6,
+    }
+)
+
+
+def _shared_np_rng() -> Any:
+    """Return the shared numpy generator.
+
+    None when numpy is not installed or the generators were seeded.
+    """
+    global _np_rng
+    if _np_rng is None and not _seeded:
+        np = load_numpy()
+        if np is not None:
+            _np_rng = np.random.default_rng()
+    return _np_rng
+
+
+def _seed_generators(seed: Optional[int]) -> None:
+    """Seed ``random``; a seed also turns the shared numpy generator off.
+
+    ``None`` reseeds from fresh entropy and lets unseeded rolls use numpy
+    again. The numpy generator is only rebuilt when it is next used, so seeding
+    alone never imports numpy.
+    """
+    global _np_rng, _seeded
+    random.seed(seed)
+    _np_rng = None
+    _seeded = seed is not None
 
 
 def roll_ability_score(method: str = "standard", seed: int | None = None) -> int:
@@ -137,19 +291,51 @@ def get_ability_modifier(score: int) -> int:
     Returns:
         Modifier
     """
+    if 0 <= score <= 30:
+        return _MODIFIER_TABLE[score]
     return (score - 10) // 2
 
 
-def generate_ability_scores(method: str = "standard") -> Dict[str, int]:
+def combat_stats(level: int, hit_die: int, con_mod: int, dex_mod: int) -> Tuple[int, int, int]:
+    """Compute the purely numeric part of a stat block.
+
+    Args:
+        level: Character level
+        hit_die: Class hit die size (e.g. 10 for a d10)
+        con_mod: Constitution modifier
+        dex_mod: Dexterity modifier
+
+    Returns:
+        Tuple of (proficiency bonus, hit points, armor class)
+    """
+    # Proficiency bonus
+    proficiency = 2 + ((level - 1) // 4)
+
+    # Hit points (class hit die + CON modifier, average per extra level)
+    hp = hit_die + con_mod + (level - 1) * (hit_die // 2 + 1 + con_mod)
+    hp = max(1, hp)  # Minimum 1 HP
+
+    # Armor class (simplified); base, can be improved with armor
+    ac = 10 + dex_mod
+
+    return proficiency, hp, ac
+
+
+def generate_ability_scores(method: str = "standard", rng: Any = None) -> Dict[str, int]:
     """Generate full set of ability scores.
 
+    With numpy installed, the standard method rolls all 24 dice as one 6x4
+    matrix and drops the lowest die per row in a single vectorized pass.
+    After a seed, rolls without an ``rng`` use ``random`` instead.
+
     Args:
         method: Generation method (standard, array)
+        rng: numpy Generator to roll with (shared module generator if None)
 
     Returns:
         Dict of ability scores
     """
-    abilities = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
+    abilities = ABILITIES
 
     if method == "array":
         # Standard array: 15, 14, 13, 12, 10, 8
@@ -157,17 +343,61 @@ def generate_ability_scores(method: str = "standard") -> Dict[str, int]:
         random.shuffle(scores)
         return dict(zip(abilities, scores))
 
+    if rng is None:
+        rng = _shared_np_rng()
+
+    if rng is not None:
+        # 4d6 drop lowest for all six abilities at once
+        rolls = rng.integers(1, 7, size=(6, 4))
+        rolls.sort(axis=1)
+        return dict(zip(abilities, rolls[:, 1:].sum(axis=1).tolist()))
+
     # Standard method: 4d6 drop lowest for each
     return {ability: roll_ability_score(method) for ability in abilities}
 
 
+def generate_ability_score_batch(num: int, rng: Any = None) -> List[Dict[str, int]]:
+    """Roll standard (4d6 drop lowest) ability scores for many NPCs at once.
+
+    All ``num * 24`` dice come from a single ``(num, 6, 4)`` draw. The dtype is
+    left at numpy's default so a seeded batch matches ``num`` separate calls
+    to :func:`generate_ability_scores`.
+
+    Args:
+        num: Number of score sets to roll
+        rng: numpy Generator to roll with (shared module generator if None)
+
+    Returns:
+        List of ability score dicts
+    """
+    if rng is None:
+        rng = _shared_np_rng()
+    if rng is None:
+        return [generate_ability_scores("standard") for _ in range(num)]
+
+    scores = _roll_score_matrix(num, "standard", rng)
+    return [dict(zip(ABILITIES, row)) for row in scores.tolist()]
+
+
+def _roll_score_matrix(num: int, method: str, rng: Any) -> Any:
+    """Return a ``(num, 6)`` array of ability scores in ``ABILITIES`` order."""
+    if method == "array":
+        np = load_numpy()
+        standard = np.tile(np.array([15, 14, 13, 12, 10, 8]), (num, 1))
+        return rng.permuted(standard, axis=1)
+
+    rolls = rng.integers(1, 7, size=(num, 6, 4))
+    rolls.sort(axis=-1)
+    return rolls[:, :, 1:].sum(axis=-1)
+
+
 def generate_npc(
     race: str | None = None,
     char_class: str | None = None,
     level: int = 1,
     method: str = "standard",
     seed: int | None = None,
-) -> Dict[str, Any]:
+) -> NPC:
     """Generate a complete NPC.
 
     Args:
@@ -178,18 +408,36 @@ def generate_npc(
         seed: Random seed
 
     Returns:
-        NPC dictionary
+        Generated NPC
     """
     if seed is not None:
-        random.seed(seed)
+        _seed_generators(seed)
 
-    # Import name generator for race-appropriate names
-    from . import name_generator
+    return generate_npc_from_scores(None, race, char_class, level, method)
 
+
+def generate_npc_from_scores(
+    abilities: Optional[Dict[str, int]],
+    race: str | None = None,
+    char_class: str | None = None,
+    level: int = 1,
+    method: str = "standard",
+) -> NPC:
+    """Generate an NPC around pre-rolled ability scores.
+
+    Args:
+        abilities: Ability scores, rolled with ``method`` if None
+        race: Race (human, elf, etc.) - random if None
+        char_class: Class - random if None
+        level: Character level
+        method: Ability score method used when ``abilities`` is None
+
+    Returns:
+        Generated NPC
+    """
     # Determine race
-    races = ["human", "elf", "dwarf", "halfling", "orc"]
     if race is None:
-        race = random.choice(races)
+        race = random.choice(RACES)
     race = race.lower()
 
     # Generate name
@@ -201,34 +449,13 @@ def generate_npc(
         char_class = random.choice(CLASSES)
 
     # Generate ability scores
-    abilities = generate_ability_scores(method)
+    if abilities is None:
+        abilities = generate_ability_scores(method)
 
-    # Calculate proficiency bonus
-    proficiency = 2 + ((level - 1) // 4)
+    modifiers = {ability: get_ability_modifier(score) for ability, score in abilities.items()}
 
-    # Hit points (use class hit die + CON modifier)
-    hit_dice = {
-        "Barbarian": 12,
-        "Fighter": 10,
-        "Paladin": 10,
-        "Ranger": 10,
-        "Bard": 8,
-        "Cleric": 8,
-        "Druid": 8,
-        "Monk": 8,
-        "Rogue": 8,
-        "Warlock": 8,
-        "Sorcerer": 6,
-        "Wizard": 6,
-    }
-    hd = hit_dice.get(char_class, 8)
-    con_mod = get_ability_modifier(abilities["CON"])
-    hp = hd + con_mod + (level - 1) * (hd // 2 + 1 + con_mod)
-    hp = max(1, hp)  # Minimum 1 HP
-
-    # Armor class (simplified)
-    dex_mod = get_ability_modifier(abilities["DEX"])
-    ac = 10 + dex_mod  # Base, can be improved with armor
+    hd = HIT_DICE.get(char_class, 8)
+    proficiency, hp, ac = combat_stats(level, hd, modifiers["CON"], modifiers["DEX"])
 
     # Generate personality
     personality = {
@@ -242,90 +469,315 @@ def generate_npc(
     background = random.choice(BACKGROUNDS)
 
     # Get equipment
-    equipment = EQUIPMENT.get(char_class, ["Basic equipment"])
-
-    return {
-        "name": name,
-        "race": race.capitalize(),
-        "class": char_class,
-        "level": level,
-        "background": background,
-        "alignment": "Neutral",  # Could be randomized
-        "ability_scores": abilities,
-        "ability_modifiers": {
-            ability: get_ability_modifier(score)
-            for ability, score in abilities.items()
-        },
-        "proficiency_bonus": proficiency,
-        "armor_class": ac,
-        "hit_points": hp,
-        "hit_dice": f"{level}d{hd}",
-        "personality": personality,
-        "equipment": equipment,
-    }
+    equipment = list(EQUIPMENT.get(char_class, ("Basic equipment",)))
+
+    return NPC(
+        name=name,
+        race=race.capitalize(),
+        char_class=char_class,
+        level=level,
+        background=background,
+        alignment="Neutral",  # Could be randomized
+        ability_scores=abilities,
+        ability_modifiers=modifiers,
+        proficiency_bonus=proficiency,
+        armor_class=ac,
+        hit_points=hp,
+        hit_dice=f"{level}d{hd}",
+        personality=personality,
+        equipment=equipment,
+    )
+
+
+def _table_index(table: Tuple[str, ...], value: str, label: str) -> int:
+    """Return the position of ``value`` in ``table`` or raise a generator error."""
+    try:
+        return table.index(value)
+    except ValueError:
+        raise NPCGeneratorError(f"Unknown {label}: {value}") from None
+
+
+def generate_npc_batch(
+    num: int,
+    race: str | None = None,
+    char_class: str | None = None,
+    level: int = 1,
+    method: str = "standard",
+    rng: Any = None,
+) -> Any:
+    """Generate many NPCs as one numpy structured array.
+
+    Every column is filled with a single vectorized draw. Races, classes,
+    personality and background are stored as small integer indexes into the
+    module tables, and names are generated once per race group. Use
+    :func:`npcs_from_batch` to turn rows back into :class:`NPC` objects.
+
+    Args:
+        num: Number of NPCs
+        race: Race for every NPC - random per NPC if None
+        char_class: Class for every NPC - random per NPC if None
+        level: Character level
+        method: Ability score method (standard, array)
+        rng: numpy Generator to draw from (shared module generator if None)
+
+    Returns:
+        Structured array with ``_NPC_FIELDS`` rows
+
+    Raises:
+        NPCGeneratorError: If numpy is not installed or race/class is unknown
+    """
+    np = load_numpy()
+    if np is None:
+        raise NPCGeneratorError("numpy is required for batch NPC generation")
+    if rng is None:
+        # After a seed, derive the batch's generator from the seeded ``random``
+        rng = _shared_np_rng() or np.random.default_rng(random.getrandbits(64))
+
+    batch = np.empty(num, dtype=np.dtype(list(_NPC_FIELDS)))
+
+    if race is None:
+        batch["race"] = rng.integers(0, len(RACES), size=num)
+    else:
+        batch["race"] = _table_index(RACES, race.lower(), "race")
+    if char_class is None:
+        batch["class"] = rng.integers(0, len(CLASSES), size=num)
+    else:
+        batch["class"] = _table_index(CLASSES, char_class, "class")
+
+    scores = _roll_score_matrix(num, method, rng)
+    batch["scores"] = scores
+
+    # Same arithmetic as combat_stats, one column at a time
+    modifiers = np.array(_MODIFIER_TABLE)[scores]
+    con_mod = modifiers[:, ABILITIES.index("CON")]
+    dex_mod = modifiers[:, ABILITIES.index("DEX")]
+    hit_die = np.array([HIT_DICE.get(name, 8) for name in CLASSES])[batch["class"]]
+    hp = hit_die + con_mod + (level - 1) * (hit_die // 2 + 1 + con_mod)
+    batch["hp"] = np.maximum(hp, 1)
+    batch["ac"] = 10 + dex_mod
+
+    for column, table in (
+        ("trait", PERSONALITY_TRAITS),
+        ("ideal", IDEALS),
+        ("bond", BONDS),
+        ("flaw", FLAWS),
+        ("background", BACKGROUNDS),
+    ):
+        batch[column] = rng.integers(0, len(table), size=num)
+
+    race_idx = batch["race"]
+    for idx in np.unique(race_idx).tolist():
+        rows = np.flatnonzero(race_idx == idx)
+        batch["name"][rows] = name_generator.generate_character_names(
+            RACES[idx], None, len(rows), surname=True
+        )
+
+    return batch
+
+
+def npcs_from_batch(batch: Any, level: int = 1) -> Iterator[NPC]:
+    """Yield an :class:`NPC` for each row of a :func:`generate_npc_batch` array.
 
+    Args:
+        batch: Structured array from ``generate_npc_batch``
+        level: Character level the batch was generated for
 
-def format_npc_markdown(npc: Dict[str, Any]) -> str:
+    Returns:
+        Iterator of NPCs, built lazily one row at a time
+    """
+    proficiency = 2 + ((level - 1) // 4)
+    columns = zip(
+        batch["name"].tolist(),
+        batch["race"].tolist(),
+        batch["class"].tolist(),
+        batch["scores"].tolist(),
+        batch["hp"].tolist(),
+        batch["ac"].tolist(),
+        batch["trait"].tolist(),
+        batch["ideal"].tolist(),
+        batch["bond"].tolist(),
+        batch["flaw"].tolist(),
+        batch["background"].tolist(),
+    )
+    for name, race, cls, scores, hp, ac, trait, ideal, bond, flaw, background in columns:
+        char_class = CLASSES[cls]
+        yield NPC(
+            name=name,
+            race=RACES[race].capitalize(),
+            char_class=char_class,
+            level=level,
+            background=BACKGROUNDS[background],
+            alignment="Neutral",
+            ability_scores=dict(zip(ABILITIES, scores)),
+            ability_modifiers={
+                ability: _MODIFIER_TABLE[score] for ability, score in zip(ABILITIES, scores)
+            },
+            proficiency_bonus=proficiency,
+            armor_class=ac,
+            hit_points=hp,
+            hit_dice=f"{level}d{HIT_DICE.get(char_class, 8)}",
+            personality={
+                "trait": PERSONALITY_TRAITS[trait],
+                "ideal": IDEALS[ideal],
+                "bond": BONDS[bond],
+                "flaw": FLAWS[flaw],
+            },
+            equipment=list(EQUIPMENT.get(char_class, ("Basic equipment",))),
+        )
+
+
+def format_npc_markdown(npc: NPC) -> str:
     """Format NPC as Markdown stat block.
 
+    The block is a single f-string, so it is built in one pass without an
+    intermediate list of lines.
+
     Args:
-        npc: NPC dictionary
+        npc: NPC to format
 
     Returns:
         Markdown string
     """
-    lines = [
-        f"# {npc['name']}",
-        f"",
-        f"*{npc['race']} {npc['class']} {npc['level']}, {npc['alignment']}*",
-        f"",
-        f"**Armor Class:** {npc['armor_class']}  ",
-        f"**Hit Points:** {npc['hit_points']} ({npc['hit_dice']})  ",
-        f"**Proficiency Bonus:** +{npc['proficiency_bonus']}",
-        f"",
-        f"---",
-        f"",
-        f"### Ability Scores",
-        f"",
-    ]
+    abilities = npc.ability_scores
+    modifiers = npc.ability_modifiers
+    personality = npc.personality
 
     # Ability scores table
-    abilities = npc["ability_scores"]
-    modifiers = npc["ability_modifiers"]
-
-    for ability in ["STR", "DEX", "CON", "INT", "WIS", "CHA"]:
-        score = abilities[ability]
-        mod = modifiers[ability]
-        mod_str = f"+{mod}" if mod >= 0 else str(mod)
-        lines.append(f"**{ability}:** {score} ({mod_str})  ")
-
-    lines.extend(
+    ability_block = "\n".join(
         [
-            f"",
-            f"---",
-            f"",
-            f"### Personality",
-            f"",
-            f"**Background:** {npc['background']}  ",
-            f"**Trait:** {npc['personality']['trait']}  ",
-            f"**Ideal:** {npc['personality']['ideal']}  ",
-            f"**Bond:** {npc['personality']['bond']}  ",
-            f"**Flaw:** {npc['personality']['flaw']}",
-            f"",
-            f"---",
-            f"",
-            f"### Equipment",
-            f"",
+            f"**{ability}:** {abilities[ability]} "
+            f"({'+' if modifiers[ability] >= 0 else ''}{modifiers[ability]})  "
+            for ability in ABILITIES
         ]
     )
+    equipment_block = "\n".join([f"- {item}" for item in npc.equipment])
+
+    return (
+        f"# {npc.name}\n"
+        "\n"
+        f"*{npc.race} {npc.char_class} {npc.level}, {npc.alignment}*\n"
+        "\n"
+        f"**Armor Class:** {npc.armor_class}  \n"
+        f"**Hit Points:** {npc.hit_points} ({npc.hit_dice})  \n"
+        f"**Proficiency Bonus:** +{npc.proficiency_bonus}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "### Ability Scores\n"
+        "\n"
+        f"{ability_block}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "### Personality\n"
+        "\n"
+        f"**Background:** {npc.background}  \n"
+        f"**Trait:** {personality['trait']}  \n"
+        f"**Ideal:** {personality['ideal']}  \n"
+        f"**Bond:** {personality['bond']}  \n"
+        f"**Flaw:** {personality['flaw']}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "### Equipment\n"
+        "\n"
+        f"{equipment_block}"
+    )
+
+
+def _init_worker() -> None:
+    """Give each worker process its own entropy instead of the forked state."""
+    _seed_generators(None)
+
+
+def _generate_npc_worker(args: argparse.Namespace) -> NPC:
+    """Generate one NPC from CLI options inside a worker process."""
+    return generate_npc(
+        race=args.race,
+        char_class=args.char_class,
+        level=args.level,
+        method=args.method,
+    )
 
-    for item in npc["equipment"]:
-        lines.append(f"- {item}")
 
-    return "\n".join(lines)
+def _stream_npcs(args: argparse.Namespace) -> Iterator[NPC]:
+    """Yield NPCs one at a time for the requested CLI options.
 
+    Seeding happens once here, before the first NPC, rather than being passed
+    into ``generate_npc`` on every iteration.
+    """
+    if args.seed is not None:
+        _seed_generators(args.seed)
+
+    if args.seed is None and args.num > 1 and load_numpy() is not None:
+        # Fill one structured array per block; NPC objects only exist while
+        # they are being written. This beats a process pool's startup cost
+        # at any size, so the pool below is only for installs without numpy.
+        # Seeded runs stay on ``random`` so their output does not depend on numpy
+        for start in range(0, args.num, SCORE_BATCH_SIZE):
+            count = min(SCORE_BATCH_SIZE, args.num - start)
+            batch = generate_npc_batch(count, args.race, args.char_class, args.level, args.method)
+            yield from npcs_from_batch(batch, args.level)
+        return
+
+    workers = os.cpu_count() or 1
+    if args.seed is None and args.num >= PARALLEL_MIN_NPCS and workers > 1:
+        # Seeded runs stay serial so their output remains reproducible
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, args.num // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            yield from executor.map(_generate_npc_worker, [args] * args.num, chunksize=chunksize)
+        return
+
+    for _ in range(args.num):
+        yield generate_npc(
+            race=args.race,
+            char_class=args.char_class,
+            level=args.level,
+            method=args.method,
+        )
+
+
+def write_npcs(npcs: Iterable[NPC], out: TextIO, args: argparse.Namespace) -> None:
+    """Format each NPC and write it straight to ``out``.
 
-def parse_arguments() -> argparse.Namespace:
+    Args:
+        npcs: NPCs to write
+        out: Text stream to write to
+        args: Parsed CLI arguments (output format options)
+    """
+    if args.json and not args.markdown:
+        if args.num == 1:
+            for npc in npcs:
+                out.write(dumps_json(npc.to_dict(), args.compact))
+            return
+
+        # Same layout as dumping the whole list, one NPC at a time
+        out.write("[" if args.compact else "[\n")
+        for i, npc in enumerate(npcs):
+            if i:
+                out.write("," if args.compact else ",\n")
+            text = dumps_json(npc.to_dict(), args.compact)
+            out.write(text if args.compact else textwrap.indent(text, "  "))
+        out.write("]" if args.compact else "\n]")
+        return
+
+    for i, npc in enumerate(npcs):
+        if args.markdown:
+            if i:
+                out.write("\n\n---\n\n")
+            out.write(format_npc_markdown(npc))
+        else:
+            # Simple text format
+            if i:
+                out.write("\n")
+            out.write(f"{npc.name} - {npc.race} {npc.char_class} {npc.level}")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; later calls in the same process reuse it."""
     parser = argparse.ArgumentParser(
         description="Generate NPC stat blocks for D&D 5e-style games.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -339,7 +791,7 @@ Examples:
     )
     parser.add_argument(
         "--race",
-        choices=["human", "elf", "dwarf", "halfling", "orc"],
+        choices=RACES,
         help="NPC race (random if not specified)",
     )
     parser.add_argument(
@@ -362,22 +814,27 @@ Examples:
         "--markdown", action="store_true", help="Output as Markdown stat block"
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
     parser.add_argument("--output", help="Output file (otherwise print to stdout)")
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
     parser.add_argument(
         "--log-level",
-        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        choices=tuple(_LOG_LEVELS),
         default="WARNING",
         help="Logging verbosity",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
-def main() -> int:
-    args = parse_arguments()
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
 
     logging.basicConfig(
-        level=getattr(logging, args.log_level.upper(), logging.WARNING),
+        level=_LOG_LEVELS.get(args.log_level, logging.WARNING),
         format="%(message)s",
         stream=sys.stderr,
     )
@@ -391,57 +848,24 @@ def main() -> int:
         return 2
 
     try:
-        npcs: List[Dict[str, Any]] = []
-
-        for i in range(args.num):
-            # Use seed for first NPC, then None
-            current_seed = args.seed if args.seed is not None and i == 0 else None
-
-            npc = generate_npc(
-                race=args.race,
-                char_class=args.char_class,
-                level=args.level,
-                method=args.method,
-                seed=current_seed,
-            )
-            npcs.append(npc)
-
+        npcs = _stream_npcs(args)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                write_npcs(npcs, f, args)
+            logger.info(f"NPC(s) written to {args.output}")
+        else:
+            write_npcs(npcs, sys.stdout, args)
+            sys.stdout.write("\n")
     except NPCGeneratorError as ex:
         logger.error(str(ex))
         return 1
+    except IOError as ex:
+        logger.error(f"Failed to write file: {ex}")
+        return 1
     except Exception as ex:  # noqa: BLE001
         logger.error(f"Unexpected error: {ex}")
         return 1
 
-    # Format output
-    if args.markdown:
-        output = "\n\n---\n\n".join(format_npc_markdown(npc) for npc in npcs)
-    elif args.json:
-        if args.num == 1:
-            output = json.dumps(npcs[0], indent=2)
-        else:
-            output = json.dumps(npcs, indent=2)
-    else:
-        # Simple text format
-        lines = []
-        for npc in npcs:
-            lines.append(
-                f"{npc['name']} - {npc['race']} {npc['class']} {npc['level']}"
-            )
-        output = "\n".join(lines)
-
-    # Write output
-    if args.output:
-        try:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(output)
-            logger.info(f"NPC(s) written to {args.output}")
-        except IOError as ex:
-            logger.error(f"Failed to write file: {ex}")
-            return 1
-    else:
-        print(output)
-
     return 0
 
 
@@ -7,21 +7,61 @@ entries, nested tables, and multiple roll formats (d100, d20, etc.).
 from __future__ import annotations
 
 import argparse
+import bisect
 import csv
+import functools
+import itertools
 import json
 import logging
 import random
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ._helpers import dumps_json, load_numpy, load_orjson
 
 logger = logging.getLogger(__name__)
 
+# Unseeded batches at least this large are rolled and looked up with numpy when
+# installed
+NUMPY_MIN_ROLLS = 64
+
+# Dice up to this many sides get a roll -> entry lookup tuple; bigger dice bisect
+DENSE_MAX_SIDES = 10_000
+
 
 class RandomTableError(RuntimeError):
     """Raised when random table operations fail."""
 
 
+@dataclass
+class PreparedTable:
+    """Parsed dice, ranges and weights for one table, ready to roll on.
+
+    Range tables fill ``num_sides``, ``lower``/``upper`` (sorted by range) and
+    ``lookup``; weighted tables fill ``cdf``. ``results`` is parallel to the
+    bounds or weights, and ``p``/``results_array`` are filled by the first
+    numpy batch on a weighted table.
+    """
+
+    name: str
+    dice: str
+    kind: str
+    results: Tuple[Any, ...]
+    num_sides: int = 0
+    lower: Tuple[int, ...] = ()
+    upper: Tuple[int, ...] = ()
+    cdf: Tuple[float, ...] = ()
+    lookup: Optional[Callable[[int], int]] = None
+    p: Any = None
+    results_array: Any = None
+
+
+# A table dict, or its prepared form to skip parsing it again
+TableLike = Union[Dict[str, Any], PreparedTable]
+
+
 def load_table_from_json(file_path: str) -> Dict[str, Any]:
     """Load random table from JSON file.
 
@@ -55,12 +95,15 @@ def load_table_from_json(file_path: str) -> Dict[str, Any]:
         Table dictionary
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            table = json.load(f)
+        # Parse straight from bytes; orjson is much faster on large tables
+        data = Path(file_path).read_bytes()
+        orjson = load_orjson()
+        table: Dict[str, Any] = orjson.loads(data) if orjson is not None else json.loads(data)
 
         if "entries" not in table:
             raise RandomTableError("Table must have 'entries' field")
 
+        prepared_table(table)
         return table
     except json.JSONDecodeError as ex:
         raise RandomTableError(f"Invalid JSON: {ex}") from ex
@@ -95,35 +138,42 @@ def load_table_from_csv(file_path: str, dice: str = "d100") -> Dict[str, Any]:
         entries: List[Dict[str, Any]] = []
 
         with open(file_path, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
+            # Plain rows plus column indices found once, instead of a dict per row
+            reader = csv.reader(f)
+            header = next(reader, None)
 
-            for row in reader:
+            if header is not None:
                 if dice == "weighted":
-                    if "weight" not in row or "result" not in row:
+                    if "weight" not in header or "result" not in header:
                         raise RandomTableError(
                             "CSV must have 'weight' and 'result' columns for weighted tables"
                         )
-                    entries.append(
-                        {"weight": int(row["weight"]), "result": row["result"]}
-                    )
+                    key_i, res_i = header.index("weight"), header.index("result")
+                    entries = [
+                        {"weight": int(row[key_i]), "result": row[res_i]} for row in reader if row
+                    ]
                 else:
-                    if "range" not in row or "result" not in row:
+                    if "range" not in header or "result" not in header:
                         raise RandomTableError(
                             "CSV must have 'range' and 'result' columns"
                         )
-                    entries.append({"range": row["range"], "result": row["result"]})
+                    key_i, res_i = header.index("range"), header.index("result")
+                    entries = [{"range": row[key_i], "result": row[res_i]} for row in reader if row]
 
-        return {
+        table = {
             "name": Path(file_path).stem,
             "dice": dice,
             "entries": entries,
         }
+        prepared_table(table)
+        return table
     except FileNotFoundError as ex:
         raise RandomTableError(f"File not found: {file_path}") from ex
-    except (ValueError, KeyError) as ex:
+    except (ValueError, KeyError, IndexError) as ex:
         raise RandomTableError(f"Invalid CSV format: {ex}") from ex
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_dice_type(dice_str: str) -> int:
     """Parse dice type to number of sides.
 
@@ -144,6 +194,7 @@ def parse_dice_type(dice_str: str) -> int:
     raise RandomTableError(f"Invalid dice type: {dice_str}")
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_range(range_str: str) -> Tuple[int, int]:
     """Parse range string like "1-20" or "42".
 
@@ -166,86 +217,291 @@ def parse_range(range_str: str) -> Tuple[int, int]:
     return num, num
 
 
-def roll_on_range_table(
-    table: Dict[str, Any], seed: int | None = None
-) -> Dict[str, Any]:
-    """Roll on a range-based table.
+def _table_rng(rng: random.Random | None, seed: int | None) -> Any:
+    """Pick the generator a roll draws from.
+
+    An explicit ``rng`` wins, then a private ``random.Random(seed)``, so a seed
+    never reseeds the global generator. Otherwise the ``random`` module is used.
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
+
+
+def _intern_results(entries: List[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Collect entry results, interning strings so repeated results share one object."""
+    return tuple(
+        sys.intern(entry["result"]) if isinstance(entry["result"], str) else entry["result"]
+        for entry in entries
+    )
+
+
+def _prepare_table(table: Dict[str, Any]) -> PreparedTable:
+    """Parse dice and ranges once so rolling never re-parses strings.
+
+    The entries are flattened into parallel tuples so a roll touches no entry
+    dicts. ``table`` itself is only read, so it stays JSON-serializable.
 
     Args:
         table: Table dictionary
-        seed: Random seed
 
     Returns:
-        Result dictionary with roll and result
+        The prepared table
     """
-    if seed is not None:
-        random.seed(seed)
-
     dice_type = table.get("dice", "d100")
+    name = table.get("name", "Unknown")
+
+    if dice_type.lower() == "weighted":
+        try:
+            cdf = tuple(itertools.accumulate(entry["weight"] for entry in table["entries"]))
+        except (TypeError, KeyError) as ex:
+            raise RandomTableError(f"Invalid table entry: {ex}") from ex
+        if not cdf or cdf[-1] <= 0:
+            raise RandomTableError("Weighted table needs a positive total weight")
+
+        return PreparedTable(
+            name=name,
+            dice=dice_type,
+            kind="weighted",
+            results=_intern_results(table["entries"]),
+            cdf=cdf,
+        )
+
     num_sides = parse_dice_type(dice_type)
+    try:
+        bounds = [(parse_range(entry["range"]), entry) for entry in table["entries"]]
+    except (ValueError, KeyError) as ex:
+        raise RandomTableError(f"Invalid table entry: {ex}") from ex
+
+    ordered = sorted(bounds, key=lambda item: item[0][0])
+    for (prev_range, prev), (entry_range, entry) in zip(ordered, ordered[1:]):
+        if entry_range[0] <= prev_range[1]:
+            raise RandomTableError(f"Overlapping ranges: {prev['range']} and {entry['range']}")
+
+    prepared = PreparedTable(
+        name=name,
+        dice=dice_type,
+        kind="range",
+        results=_intern_results([entry for _, entry in ordered]),
+        num_sides=num_sides,
+        lower=tuple(low for (low, _), _ in ordered),
+        upper=tuple(high for (_, high), _ in ordered),
+    )
+    prepared.lookup = compile_roll_fn(prepared)
+    return prepared
+
+
+def prepared_table(table: TableLike) -> PreparedTable:
+    """Return the prepared form of ``table``.
+
+    A dict is parsed on every call, so edits to it always take effect; callers
+    rolling many times on one table should prepare it once and pass the
+    ``PreparedTable`` to the roll functions instead.
+
+    Args:
+        table: Table dictionary, or an already prepared table
+
+    Returns:
+        The prepared table
+    """
+    if isinstance(table, PreparedTable):
+        return table
+    return _prepare_table(table)
 
-    roll = random.randint(1, num_sides)
 
-    # Find matching entry
-    for entry in table["entries"]:
-        min_val, max_val = parse_range(entry["range"])
+def compile_roll_fn(prepared: PreparedTable) -> Callable[[int], int]:
+    """Build a lookup function specialized to one prepared range table.
 
-        if min_val <= roll <= max_val:
-            return {
-                "table": table.get("name", "Unknown"),
-                "dice": dice_type,
-                "roll": roll,
-                "result": entry["result"],
-            }
+    Dice with at most ``DENSE_MAX_SIDES`` sides get a tuple holding the entry
+    index for every possible roll, so a lookup is a single index; larger dice
+    fall back to a binary search over the range bounds.
+
+    Args:
+        prepared: Range table returned by ``prepared_table``
+
+    Returns:
+        Function mapping a roll to its index in ``results``, or -1 for a gap
+    """
+    lower, upper = prepared.lower, prepared.upper
+    num_sides = prepared.num_sides
+
+    if num_sides <= DENSE_MAX_SIDES:
+        slots = [-1] * (num_sides + 1)
+        for idx, (low, high) in enumerate(zip(lower, upper)):
+            for roll in range(max(low, 1), min(high, num_sides) + 1):
+                slots[roll] = idx
+        by_roll = tuple(slots)
+
+        def lookup(roll: int) -> int:
+            return by_roll[roll]
+
+        return lookup
+
+    def search(roll: int) -> int:
+        # First range whose upper bound reaches the roll; gaps have no match
+        idx = bisect.bisect_left(upper, roll)
+        if idx < len(upper) and lower[idx] <= roll:
+            return idx
+        return -1
+
+    return search
+
+
+def roll_on_range_table(
+    table: TableLike,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> Dict[str, Any]:
+    """Roll on a range-based table.
+
+    Args:
+        table: Table dictionary or ``PreparedTable``
+        seed: Random seed (ignored when ``rng`` is given)
+        rng: Random generator to draw from instead of the global one
+
+    Returns:
+        Result dictionary with roll and result
+    """
+    rng = _table_rng(rng, seed)
+    prepared = prepared_table(table)
+
+    roll = rng.randint(1, prepared.num_sides)
+
+    idx = prepared.lookup(roll) if prepared.lookup is not None else -1
+    if idx >= 0:
+        return {
+            "table": prepared.name,
+            "dice": prepared.dice,
+            "roll": roll,
+            "result": prepared.results[idx],
+        }
 
     # No match found
-    raise RandomTableError(f"No entry found for roll {roll} on {dice_type}")
+    raise RandomTableError(f"No entry found for roll {roll} on {prepared.dice}")
 
 
 def roll_on_weighted_table(
-    table: Dict[str, Any], seed: int | None = None
+    table: TableLike,
+    seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Dict[str, Any]:
     """Roll on a weighted table.
 
     Args:
-        table: Table dictionary
-        seed: Random seed
+        table: Table dictionary or ``PreparedTable``
+        seed: Random seed (ignored when ``rng`` is given)
+        rng: Random generator to draw from instead of the global one
 
     Returns:
         Result dictionary
     """
-    if seed is not None:
-        random.seed(seed)
-
-    entries = table["entries"]
-    weights = [entry["weight"] for entry in entries]
-    results = [entry["result"] for entry in entries]
+    rng = _table_rng(rng, seed)
+    prepared = prepared_table(table)
 
-    chosen = random.choices(results, weights=weights, k=1)[0]
+    # Same draw as random.choices, without rebuilding the CDF on every roll
+    cdf = prepared.cdf
+    idx = bisect.bisect_right(cdf, rng.random() * cdf[-1], 0, len(cdf) - 1)
+    chosen = prepared.results[idx]
 
     return {
-        "table": table.get("name", "Unknown"),
+        "table": prepared.name,
         "dice": "weighted",
         "result": chosen,
     }
 
 
-def roll_on_table(table: Dict[str, Any], seed: int | None = None) -> Dict[str, Any]:
+def roll_on_table(
+    table: TableLike,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> Dict[str, Any]:
     """Roll on a table (auto-detect type).
 
     Args:
-        table: Table dictionary
-        seed: Random seed
+        table: Table dictionary or ``PreparedTable``
+        seed: Random seed (ignored when ``rng`` is given)
+        rng: Random generator to draw from instead of the global one
 
     Returns:
         Result dictionary
     """
-    dice_type = table.get("dice", "d100").lower()
+    prepared = prepared_table(table)
+    if prepared.kind == "weighted":
+        return roll_on_weighted_table(prepared, seed, rng)
+
+    return roll_on_range_table(prepared, seed, rng)
 
-    if dice_type == "weighted":
-        return roll_on_weighted_table(table, seed)
 
-    return roll_on_range_table(table, seed)
+def roll_on_table_batch(
+    table: TableLike,
+    num: int,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> List[Dict[str, Any]]:
+    """Roll on a table several times.
+
+    Unseeded batches of at least ``NUMPY_MIN_ROLLS`` with numpy installed draw
+    every roll in one call: range rolls map to entries with ``np.searchsorted``
+    and weighted tables sample entry indices with ``Generator.choice``. Smaller
+    batches, and any batch given a ``seed`` or ``rng``, roll one at a time, so
+    seeded results do not depend on the batch size or on numpy being installed.
+
+    Args:
+        table: Table dictionary or ``PreparedTable`` (prepared once per batch)
+        num: Number of rolls
+        seed: Random seed (applied once for the whole batch)
+        rng: Random generator to draw from instead of the global one
+
+    Returns:
+        List of result dictionaries
+    """
+    seeded = seed is not None or rng is not None
+    rng = _table_rng(rng, seed)
+    prepared = prepared_table(table)
+
+    np: Any = load_numpy() if not seeded and num >= NUMPY_MIN_ROLLS else None
+    if np is None:
+        return [roll_on_table(prepared, rng=rng) for _ in range(num)]
+
+    # Drawn from the global generator, so random.seed still covers the batch
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    name = prepared.name
+    dice_type = prepared.dice
+
+    if prepared.kind == "weighted":
+        # Probabilities and an object array of results are built once per table
+        if prepared.p is None:
+            p = np.diff(np.asarray(prepared.cdf, dtype=np.float64), prepend=0.0)
+            prepared.p = p / p.sum()
+            # Filled item by item so list-valued results stay single objects
+            results = np.empty(len(prepared.results), dtype=object)
+            for i, result in enumerate(prepared.results):
+                results[i] = result
+            prepared.results_array = results
+        idx = np_rng.choice(len(prepared.p), size=num, p=prepared.p)
+        return [
+            {"table": name, "dice": "weighted", "result": result}
+            for result in prepared.results_array[idx].tolist()
+        ]
+
+    upper = np.asarray(prepared.upper)
+    rolls = np_rng.integers(1, prepared.num_sides + 1, size=num)
+    idx = np.searchsorted(upper, rolls)
+
+    # Rolls past the last range or inside a gap have no entry
+    clipped = np.minimum(idx, len(upper) - 1)
+    missing = (idx == len(upper)) | (np.asarray(prepared.lower)[clipped] > rolls)
+    if missing.any():
+        roll = int(rolls[np.argmax(missing)])
+        raise RandomTableError(f"No entry found for roll {roll} on {dice_type}")
+
+    entry_results = prepared.results
+    return [
+        {"table": name, "dice": dice_type, "roll": roll, "result": entry_results[i]}
+        for roll, i in zip(rolls.tolist(), idx.tolist())
+    ]
 
 
 def create_example_table(table_type: str) -> str:
@@ -299,7 +555,7 @@ def create_example_table(table_type: str) -> str:
             ],
         }
 
-    return json.dumps(table, indent=2)
+    return dumps_json(table)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -402,15 +658,9 @@ def main() -> int:
         logger.error(str(ex))
         return 1
 
-    # Roll on table
-    results: List[Dict[str, Any]] = []
-
+    # Roll on table; --seed keeps every roll on one reproducible generator
     try:
-        for i in range(args.repeat):
-            # Use seed for first roll, then None
-            current_seed = args.seed if args.seed is not None and i == 0 else None
-            result = roll_on_table(table, seed=current_seed)
-            results.append(result)
+        results = roll_on_table_batch(table, args.repeat, seed=args.seed)
     except RandomTableError as ex:
         logger.error(str(ex))
         return 1
@@ -418,18 +668,20 @@ def main() -> int:
     # Output results
     if args.json:
         if args.repeat == 1:
-            print(json.dumps(results[0], indent=2))
+            print(dumps_json(results[0]))
         else:
-            print(json.dumps(results, indent=2))
+            print(dumps_json(results))
     else:
-        for i, result in enumerate(results):
-            if args.repeat > 1:
-                print(f"Roll {i + 1}:", end=" ")
-
+        # Format every roll first and write them in one call; print per roll
+        # dominates large --repeat runs
+        lines = []
+        for i, result in enumerate(results, 1):
             if "roll" in result:
-                print(f"[{result['roll']}] {result['result']}")
+                text = f"[{result['roll']}] {result['result']}"
             else:
-                print(result["result"])
+                text = str(result["result"])
+            lines.append(f"Roll {i}: {text}" if args.repeat > 1 else text)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
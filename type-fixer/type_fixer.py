@@ -14,20 +14,74 @@ from __future__ import annotations
 
 import argparse
 import ast
+import contextlib
+import functools
+import hashlib
 import importlib.util
+import io
 import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
 from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+try:  # pragma: no cover - optional dependency
+    import black  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    black = None
+
+try:  # pragma: no cover - optional dependency
+    from mypy import api as mypy_api  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    mypy_api = None
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    orjson = None
+
+# Top-level modules that ship with the interpreter; never worth a sys.path scan.
+# ``sys.stdlib_module_names`` only exists on Python 3.10+.
+_STDLIB_MODULES = frozenset(sys.builtin_module_names) | frozenset(
+    getattr(sys, "stdlib_module_names", ())
+)
+
+
+# Statement fields that can hold further module-scope statements (if/try/with/for/match)
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_module_scope_nodes(tree: ast.Module) -> list[ast.AST]:
+    """Return statements that run at import time, skipping function bodies.
+
+    Class bodies are kept: they execute when the module is imported.
+    """
+    nodes: list[ast.AST] = []
+    pending: list[ast.AST] = list(tree.body)
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for field in _BLOCK_FIELDS:
+            pending.extend(getattr(node, field, ()))
+    return nodes
+
+
+@functools.lru_cache(maxsize=None)
+def _find_spec_cached(module: str) -> bool:
+    """Return whether ``module`` resolves, scanning ``sys.path`` once per process."""
+    return importlib.util.find_spec(module) is not None
+
 
 @dataclass(frozen=True)
 class FixerConfig:
@@ -36,6 +90,8 @@ class FixerConfig:
     input_path: Path
     output_path: Path | None
     dry_run: bool
+    import_cache_path: Path | None = None
+    nested_imports: bool = False
 
 
 @dataclass(frozen=True)
@@ -105,7 +161,10 @@ class FixSummary:
         else:
             file_path = destination
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        if orjson is not None:
+            file_path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            file_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
 
 
 class PythonFileFixer:
@@ -116,7 +175,8 @@ class PythonFileFixer:
         self._input_path = config.input_path.expanduser().resolve(strict=False)
         self._files = tuple(self._discover_python_files())
         self._target_arguments = self._build_target_arguments()
-        self._spec_cache: dict[str, bool] = {}
+        # Top-level imports keyed by path, reused while the file's content digest matches
+        self._import_cache: dict[str, tuple[str, tuple[str, ...]]] = self._load_import_cache()
 
     def run(self) -> FixSummary:
         if not self._files:
@@ -125,12 +185,8 @@ class PythonFileFixer:
         logger.info("Found %s Python file(s) to process", len(self._files))
 
         import_errors = self._check_import_errors()
-
-        command_results = [
-            self._format_with_black(),
-            self._lint_with_ruff(),
-            self._type_check_with_mypy(),
-        ]
+        self._save_import_cache()
+        command_results = self._run_tools()
 
         summary = FixSummary(
             files_processed=tuple(str(path) for path in self._files),
@@ -145,6 +201,21 @@ class PythonFileFixer:
 
         return summary
 
+    def _run_tools(self) -> list[CommandResult]:
+        """Run black, ruff, and mypy, returning their results in that order."""
+        steps = (self._format_with_black, self._lint_with_ruff, self._type_check_with_mypy)
+        if not self._config.dry_run:
+            # black and ruff rewrite files in place, so mypy has to wait for them
+            return [step() for step in steps]
+
+        # Dry runs only read the sources, so ruff and mypy can overlap. black goes
+        # first on its own: in-process it swaps the process-wide sys.stdout and
+        # sys.stderr, which would also capture whatever the other tools print
+        black_result = steps[0]()
+        with ThreadPoolExecutor(max_workers=len(steps) - 1) as executor:
+            futures = [executor.submit(step) for step in steps[1:]]
+            return [black_result, *(future.result() for future in futures)]
+
     def _discover_python_files(self) -> tuple[Path, ...]:
         path = self._input_path
         if not path.exists():
@@ -155,12 +226,35 @@ class PythonFileFixer:
                 raise ValueError(f"Input file '{path}' is not a Python file.")
             return (path.resolve(),)
 
-        files = sorted(
-            p.resolve()
-            for p in path.rglob("*.py")
-            if "__pycache__" not in p.parts and not self._is_hidden(p)
-        )
-        return tuple(files)
+        # scandir reuses the listing's file types, and hidden and __pycache__
+        # directories are pruned here instead of being walked and filtered out.
+        # Symlinked directories are followed once; the visited set stops link loops.
+        files: list[str] = []
+        visited = {os.path.realpath(path)}
+        stack = [(str(path), False)]
+        while stack:
+            directory, via_link = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as exc:
+                logger.warning("Unable to scan %s: %s", directory, exc)
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    linked = via_link or entry.is_symlink()
+                    if entry.is_dir():
+                        if name == "__pycache__":
+                            continue
+                        real = os.path.realpath(entry.path)
+                        if real not in visited:
+                            visited.add(real)
+                            stack.append((entry.path, linked))
+                    elif name.endswith(".py") and entry.is_file():
+                        files.append(os.path.realpath(entry.path) if linked else entry.path)
+        return tuple(sorted(Path(file) for file in files))
 
     def _build_target_arguments(self) -> tuple[str, ...]:
         path = self._input_path
@@ -169,9 +263,16 @@ class PythonFileFixer:
         return (str(path),)
 
     def _check_import_errors(self) -> tuple[ImportErrorDetail, ...]:
+        if len(self._files) >= 8:
+            # Overlap file reads across threads; results come back in file order
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                file_modules = list(executor.map(self._collect_import_modules, self._files))
+        else:
+            file_modules = [self._collect_import_modules(path) for path in self._files]
+
         module_to_files: dict[str, set[str]] = defaultdict(set)
-        for path in self._files:
-            for module in self._collect_import_modules(path):
+        for path, modules in zip(self._files, file_modules):
+            for module in modules:
                 module_to_files[module].add(str(path))
 
         missing: list[ImportErrorDetail] = []
@@ -194,21 +295,61 @@ class PythonFileFixer:
 
         return tuple(missing)
 
+    def _load_import_cache(self) -> dict[str, tuple[str, tuple[str, ...]]]:
+        cache_path = self._config.import_cache_path
+        if cache_path is None or not cache_path.exists():
+            return {}
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            return {
+                path: (digest, tuple(modules)) for path, (digest, modules) in data["files"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable import cache %s: %s", cache_path, exc)
+            return {}
+
+    def _save_import_cache(self) -> None:
+        cache_path = self._config.import_cache_path
+        if cache_path is None:
+            return
+        # Only files seen this run are kept, so deleted files drop out of the cache
+        current = {str(path) for path in self._files}
+        files = {
+            path: [digest, list(modules)]
+            for path, (digest, modules) in sorted(self._import_cache.items())
+            if path in current
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"files": files}), encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Unable to write import cache %s: %s", cache_path, exc)
+
     def _collect_import_modules(self, file_path: Path) -> set[str]:
         try:
-            source = file_path.read_text(encoding="utf-8")
+            source = file_path.read_bytes()
         except OSError as exc:
             logger.error("Unable to read %s: %s", file_path, exc)
             return set()
 
+        # A content digest (not mtime) so the cache survives checkouts and CI caches;
+        # the scan mode is mixed in so toggling --nested-imports invalidates entries
+        scope = b"nested" if self._config.nested_imports else b"module"
+        digest = hashlib.blake2b(source, digest_size=16, person=scope).hexdigest()
+        key = str(file_path)
+        cached = self._import_cache.get(key)
+        if cached is not None and cached[0] == digest:
+            return set(cached[1])
+
         try:
             tree = ast.parse(source)
         except SyntaxError as exc:
             logger.warning("Skipping import scan for %s (syntax error: %s)", file_path, exc)
             return set()
 
+        nodes = ast.walk(tree) if self._config.nested_imports else _iter_module_scope_nodes(tree)
         modules: set[str] = set()
-        for node in ast.walk(tree):
+        for node in nodes:
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     modules.add(alias.name.split(".", 1)[0])
@@ -216,30 +357,22 @@ class PythonFileFixer:
                 if node.level != 0 or not node.module:
                     continue
                 modules.add(node.module.split(".", 1)[0])
+
+        self._import_cache[key] = (digest, tuple(sorted(modules)))
         return modules
 
     def _module_is_available(self, module: str) -> bool:
-        if not module:
+        if not module or module in _STDLIB_MODULES:
             return True
-        if module in sys.builtin_module_names:
-            return True
-        cached = self._spec_cache.get(module)
-        if cached is not None:
-            return cached
-        spec = importlib.util.find_spec(module)
-        available = spec is not None
-        self._spec_cache[module] = available
-        return available
-
-    @staticmethod
-    def _is_hidden(path: Path) -> bool:
-        return any(part.startswith(".") for part in path.parts if part not in (".", ".."))
+        return _find_spec_cached(module)
 
     def _format_with_black(self) -> CommandResult:
         args = ["black"]
         if self._config.dry_run:
             args.extend(["--check", "--diff"])
         args.extend(self._target_arguments)
+        if black is not None:
+            return self._run_black_in_process(args)
         return self._run_command("black", args)
 
     def _lint_with_ruff(self) -> CommandResult:
@@ -261,32 +394,87 @@ class PythonFileFixer:
         if not self._config.dry_run:
             args.extend(["--install-types", "--non-interactive"])
         args.extend(self._target_arguments)
+        if mypy_api is not None:
+            logger.info("Running mypy in-process: %s", " ".join(args))
+            stdout, stderr, return_code = mypy_api.run(args[1:])
+            return self._command_result("mypy", args, return_code, stdout, stderr)
         return self._run_command("mypy", args)
 
+    def _run_black_in_process(self, args: Sequence[str]) -> CommandResult:
+        """Run black's CLI entry point without starting a new interpreter."""
+        import click  # black's CLI is built on click, so it is installed with black
+
+        logger.info("Running black in-process: %s", " ".join(args))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                return_code = black.main(list(args[1:]), standalone_mode=False)
+            except SystemExit as exc:
+                return_code = exc.code
+            except click.exceptions.ClickException as exc:
+                # What click prints and exits with when it runs standalone
+                exc.show()
+                return_code = exc.exit_code
+            except click.exceptions.Abort:
+                print("Aborted!", file=sys.stderr)
+                return_code = 1
+        return self._command_result(
+            "black", args, int(return_code or 0), stdout.getvalue(), stderr.getvalue()
+        )
+
     def _run_command(self, name: str, args: Sequence[str]) -> CommandResult:
         executable = args[0]
         self._ensure_executable_available(executable)
         logger.info("Running %s: %s", name, " ".join(args))
 
-        completed = subprocess.run(
+        with subprocess.Popen(
             args,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
+            bufsize=1,
+        ) as process:
+            # Drain both pipes concurrently so neither can fill up and stall the tool
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                stdout = executor.submit(self._drain_pipe, name, "stdout", process.stdout)
+                stderr = executor.submit(self._drain_pipe, name, "stderr", process.stderr)
+                stdout_text, stderr_text = stdout.result(), stderr.result()
+            return_code = process.wait()
+
+        return self._command_result(
+            name, args, return_code, stdout_text, stderr_text, log_output=False
         )
 
-        stdout = completed.stdout.strip()
-        stderr = completed.stderr.strip()
+    @staticmethod
+    def _drain_pipe(name: str, stream_name: str, pipe: Any) -> str:
+        """Read a tool's output line by line, logging progress as it arrives."""
+        lines: list[str] = []
+        for line in pipe:
+            lines.append(line)
+            logger.debug("%s %s: %s", name, stream_name, line.rstrip())
+        return "".join(lines)
 
-        if stdout:
+    @staticmethod
+    def _command_result(
+        name: str,
+        args: Sequence[str],
+        return_code: int,
+        stdout: str,
+        stderr: str,
+        log_output: bool = True,
+    ) -> CommandResult:
+        stdout = stdout.strip()
+        stderr = stderr.strip()
+
+        if log_output and stdout:
             logger.debug("%s stdout:\n%s", name, stdout)
-        if stderr:
+        if log_output and stderr:
             logger.debug("%s stderr:\n%s", name, stderr)
 
         return CommandResult(
             name=name,
             command=tuple(args),
-            return_code=completed.returncode,
+            return_code=return_code,
             stdout=stdout,
             stderr=stderr,
         )
@@ -319,6 +507,18 @@ def parse_arguments() -> argparse.Namespace:
         help="Optional JSON file to write a summary report to.",
     )
 
+    parser.add_argument(
+        "--import-cache",
+        type=Path,
+        help="Optional JSON file caching each file's imports between runs.",
+    )
+
+    parser.add_argument(
+        "--nested-imports",
+        action="store_true",
+        help="Also scan imports inside function bodies for missing modules.",
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -349,6 +549,8 @@ def main() -> int:
             input_path=args.input,
             output_path=args.output,
             dry_run=args.dry_run,
+            import_cache_path=args.import_cache,
+            nested_imports=args.nested_imports,
         )
         fixer = PythonFileFixer(config)
         summary = fixer.run()
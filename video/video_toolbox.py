@@ -17,27 +17,72 @@ Convert part of a clip to a GIF::
 Extract one frame per second::
 
     python -m video.video_toolbox extract-frames clip.mp4 ./frames --fps 1
+
+Run many jobs in parallel from a JSON list of ``{"command", "args"}`` objects::
+
+    python -m video.video_toolbox batch jobs.json --workers 4
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
+import functools
+import json
 import logging
+import math
+import os
+import re
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
-try:  # pragma: no cover - optional dependency
-    import moviepy.editor as moviepy_editor  # type: ignore
-except Exception:  # pragma: no cover - import guard
-    moviepy_editor = None
 
-try:  # pragma: no cover - optional dependency
-    import ffmpeg  # type: ignore
-except Exception:  # pragma: no cover - import guard
-    ffmpeg = None
+@functools.lru_cache(maxsize=1)
+def _load_moviepy() -> Any:
+    """Import moviepy on first use; it pulls in numpy, PIL and imageio."""
+    try:  # pragma: no cover - optional dependency
+        import moviepy.editor as moviepy_editor  # type: ignore
+    except Exception:  # pragma: no cover - import guard
+        return None
+    return moviepy_editor
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ffmpeg() -> Any:
+    """Import ffmpeg-python on first use."""
+    try:  # pragma: no cover - optional dependency
+        import ffmpeg  # type: ignore
+    except Exception:  # pragma: no cover - import guard
+        return None
+    return ffmpeg
+
+
+# ffmpeg's progress lines ("frame=  120 fps=...") report how many frames were written
+_FRAME_COUNT_RE = re.compile(r"frame=\s*(\d+)")
+# [[HH:]MM:]SS[.fff]; hours are only allowed together with minutes
+_TIMECODE_NUMBER = r"\d+(?:\.\d*)?"
+_TIMECODE_RE = re.compile(
+    rf"(?:(?:({_TIMECODE_NUMBER}):)?({_TIMECODE_NUMBER}):)?({_TIMECODE_NUMBER}|\.\d+)"
+)
+# Progress updates end in "\r", log lines in "\n"; either ends a stderr line
+_STDERR_LINE_SPLIT_RE = re.compile(rb"[\r\n]")
+# How many trailing stderr lines run_ffmpeg keeps for counters and error messages
+FFMPEG_STDERR_TAIL = 64
+
+# Hardware decoders --hwaccel accepts, in the order 'auto' tries them
+HWACCEL_METHODS = ("cuda", "videotoolbox", "vaapi")
+
+# Thread limits passed to every ffmpeg run (None leaves ffmpeg's own default);
+# set from --threads/--filter-threads, and per worker by ``run_batch`` so
+# concurrent jobs split the cores instead of each claiming all of them
+_ffmpeg_threads: Optional[int] = None
+_ffmpeg_filter_threads: Optional[int] = None
 
 
 class MissingDependencyError(RuntimeError):
@@ -66,6 +111,24 @@ def build_parser() -> argparse.ArgumentParser:
         default="auto",
         help="Processing backend to use. 'auto' prefers moviepy when available.",
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Encoder threads for the ffmpeg backend (default: ffmpeg's choice; "
+        "batch jobs split the CPUs between workers)",
+    )
+    parser.add_argument(
+        "--filter-threads",
+        type=int,
+        help="Filter graph threads for the ffmpeg backend (default: ffmpeg's choice)",
+    )
+    parser.add_argument(
+        "--hwaccel",
+        choices=["none", "auto", *HWACCEL_METHODS],
+        default="none",
+        help="Hardware decoder for the ffmpeg backend. 'auto' picks the first one "
+        "your ffmpeg build reports.",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -78,7 +141,13 @@ def build_parser() -> argparse.ArgumentParser:
     trim_parser.add_argument("output", type=Path, help="Output video path")
     add_time_range_arguments(trim_parser)
     trim_parser.add_argument("--fps", type=float, help="Force output frame rate")
-    trim_parser.set_defaults(handler=handle_trim)
+    trim_parser.add_argument(
+        "--reencode",
+        action="store_true",
+        help="Always re-encode with ffmpeg; by default same-container trims without --fps "
+        "copy streams, which is much faster but cuts on the nearest keyframe",
+    )
+    trim_parser.set_defaults(handler=handle_job)
 
     gif_parser = subparsers.add_parser(
         "to-gif",
@@ -89,7 +158,7 @@ def build_parser() -> argparse.ArgumentParser:
     gif_parser.add_argument("output", type=Path, help="Output GIF path")
     add_time_range_arguments(gif_parser)
     gif_parser.add_argument("--fps", type=float, help="Frame rate for GIF frames")
-    gif_parser.set_defaults(handler=handle_to_gif)
+    gif_parser.set_defaults(handler=handle_job)
 
     frames_parser = subparsers.add_parser(
         "extract-frames",
@@ -110,7 +179,24 @@ def build_parser() -> argparse.ArgumentParser:
         default="png",
         help="Image format/extension for frames (png, jpg, ...)",
     )
-    frames_parser.set_defaults(handler=handle_extract_frames)
+    frames_parser.set_defaults(handler=handle_job)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run trim/to-gif/extract-frames jobs from a JSON file in parallel.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    batch_parser.add_argument(
+        "config",
+        type=Path,
+        help='JSON list of jobs like {"command": "trim", "args": ["in.mp4", "out.mp4"]}',
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Maximum concurrent jobs (defaults to the CPU count)",
+    )
+    batch_parser.set_defaults(handler=handle_batch)
 
     return parser
 
@@ -129,6 +215,7 @@ def add_time_range_arguments(parser: argparse.ArgumentParser) -> None:
 TimeRange = Tuple[Optional[float], Optional[float]]
 
 
+@functools.lru_cache(maxsize=512)
 def parse_timecode(value: Optional[str]) -> Optional[float]:
     """Convert a time code into seconds."""
     if value is None:
@@ -136,18 +223,14 @@ def parse_timecode(value: Optional[str]) -> Optional[float]:
     text = value.strip()
     if not text:
         return None
+    match = _TIMECODE_RE.fullmatch(text)
+    if match:
+        hours, minutes, seconds = match.groups()
+        return float(hours or 0) * 3600 + float(minutes or 0) * 60 + float(seconds)
     if ":" in text:
-        parts = text.split(":")
-        if len(parts) > 3:
-            raise VideoProcessingError(f"Invalid timecode '{value}'.")
-        seconds = 0.0
-        for part in parts:
-            try:
-                number = float(part)
-            except ValueError as exc:  # pragma: no cover - defensive
-                raise VideoProcessingError(f"Invalid time value '{value}'.") from exc
-            seconds = seconds * 60 + number
-        return seconds
+        raise VideoProcessingError(f"Invalid timecode '{value}'.")
+    # Plain numbers the pattern does not cover (signs, exponents); negatives are
+    # rejected with a clearer message by resolve_time_range
     try:
         return float(text)
     except ValueError as exc:  # pragma: no cover - defensive
@@ -208,25 +291,70 @@ def pick_backend(preference: str) -> str:
     """Select a processing backend based on availability and user preference."""
     preference = preference or "auto"
     if preference == "moviepy":
-        if moviepy_editor is None:
+        if _load_moviepy() is None:
             raise MissingDependencyError(
                 "moviepy is not installed. Install 'moviepy' to use this backend."
             )
         return "moviepy"
     if preference == "ffmpeg":
-        if ffmpeg is None:
+        if _load_ffmpeg() is None:
             raise MissingDependencyError(
                 "ffmpeg-python is not installed. Install 'ffmpeg-python' to use this backend."
             )
         return "ffmpeg"
 
-    if moviepy_editor is not None:
+    if _load_moviepy() is not None:
         return "moviepy"
-    if ffmpeg is not None:
+    if _load_ffmpeg() is not None:
         return "ffmpeg"
     raise MissingDependencyError("Install 'moviepy' or 'ffmpeg-python' to use video features.")
 
 
+@functools.lru_cache(maxsize=1)
+def available_hwaccels() -> frozenset:
+    """Return the hardware decoders the local ffmpeg build supports (probed once)."""
+    try:
+        completed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return frozenset()
+    # Output is a "Hardware acceleration methods:" header followed by one name per line
+    lines = completed.stdout.splitlines()[1:]
+    return frozenset(line.strip() for line in lines if line.strip())
+
+
+def resolve_hwaccel(preference: Optional[str]) -> Optional[str]:
+    """Turn the --hwaccel choice into an ffmpeg ``-hwaccel`` value (None for software)."""
+    if not preference or preference == "none":
+        return None
+    available = available_hwaccels()
+    if preference == "auto":
+        for method in HWACCEL_METHODS:
+            if method in available:
+                logger.debug("Using %s hardware decoding", method)
+                return method
+        return None
+    if preference not in available:
+        logger.warning(
+            "ffmpeg does not report '%s' hardware decoding; trying it anyway.", preference
+        )
+    return preference
+
+
+def set_ffmpeg_threads(threads: Optional[int], filter_threads: Optional[int] = None) -> None:
+    """Set the encoder and filter thread counts used for every ffmpeg run."""
+    global _ffmpeg_threads, _ffmpeg_filter_threads
+    for name, value in (("--threads", threads), ("--filter-threads", filter_threads)):
+        if value is not None and value < 1:
+            raise VideoProcessingError(f"{name} must be at least 1.")
+    _ffmpeg_threads = threads
+    _ffmpeg_filter_threads = filter_threads
+
+
 def format_seconds(value: Optional[float]) -> str:
     """Human friendly formatting for seconds."""
     if value is None:
@@ -240,43 +368,28 @@ def format_seconds(value: Optional[float]) -> str:
     return f"{seconds:.2f}s"
 
 
-def handle_trim(args: argparse.Namespace) -> None:
-    """Handle the trim subcommand."""
-    input_path: Path = args.input
-    output_path: Path = args.output
-    ensure_input_file(input_path)
-    ensure_parent_dir(output_path)
+class _LazySeconds:
+    """Log argument that only runs ``format_seconds`` if the record is emitted."""
 
-    start, end = resolve_time_range(args.start, args.end, args.duration)
-    fps = args.fps
-    if fps is not None and fps <= 0:
-        raise VideoProcessingError("FPS must be greater than zero.")
+    __slots__ = ("value",)
 
-    backend = pick_backend(args.backend)
-    logger.info(
-        "Trimming %s -> %s using %s backend (start=%s, end=%s, fps=%s)",
-        input_path,
-        output_path,
-        backend,
-        format_seconds(start),
-        format_seconds(end),
-        fps or "source",
-    )
+    def __init__(self, value: Optional[float]) -> None:
+        self.value = value
 
-    if backend == "moviepy":
-        trim_with_moviepy(input_path, output_path, start, end, fps)
-    else:
-        trim_with_ffmpeg(input_path, output_path, start, end, fps)
-
-    logger.info("Saved trimmed clip to %s", output_path)
+    def __str__(self) -> str:
+        return format_seconds(self.value)
 
 
-def handle_to_gif(args: argparse.Namespace) -> None:
-    """Handle the to-gif subcommand."""
+def handle_job(args: argparse.Namespace) -> None:
+    """Handle the trim, to-gif and extract-frames subcommands via ``_JOB_COMMANDS``."""
+    job = _JOB_COMMANDS[args.command]
     input_path: Path = args.input
     output_path: Path = args.output
     ensure_input_file(input_path)
-    ensure_parent_dir(output_path)
+    if job.output_is_dir:
+        ensure_output_dir(output_path)
+    else:
+        ensure_parent_dir(output_path)
 
     start, end = resolve_time_range(args.start, args.end, args.duration)
     fps = args.fps
@@ -285,68 +398,146 @@ def handle_to_gif(args: argparse.Namespace) -> None:
 
     backend = pick_backend(args.backend)
     logger.info(
-        "Converting %s -> %s using %s backend (start=%s, end=%s, fps=%s)",
+        "%s %s -> %s using %s backend (start=%s, end=%s, fps=%s)",
+        job.action,
         input_path,
         output_path,
         backend,
-        format_seconds(start),
-        format_seconds(end),
+        _LazySeconds(start),
+        _LazySeconds(end),
         fps or "source",
     )
 
+    options = {name: getattr(args, name) for name in job.options}
     if backend == "moviepy":
-        gif_with_moviepy(input_path, output_path, start, end, fps)
+        result = job.moviepy(input_path, output_path, start, end, fps, **options)
     else:
-        gif_with_ffmpeg(input_path, output_path, start, end, fps)
-
-    logger.info("Saved GIF to %s", output_path)
+        options.update((name, getattr(args, name)) for name in job.ffmpeg_options)
+        result = job.ffmpeg(
+            input_path,
+            output_path,
+            start,
+            end,
+            fps,
+            hwaccel=resolve_hwaccel(args.hwaccel),
+            **options,
+        )
 
+    if job.output_is_dir:
+        logger.info("Extracted %s frame(s) into %s", result, output_path)
+    else:
+        logger.info("Saved %s to %s", job.label, output_path)
+
+
+def handle_batch(args: argparse.Namespace) -> None:
+    """Handle the batch subcommand."""
+    failed = run_batch(
+        args.config,
+        max_workers=args.workers,
+        backend=args.backend,
+        hwaccel=args.hwaccel,
+        threads=args.threads,
+        filter_threads=args.filter_threads,
+    )
+    if failed:
+        raise VideoProcessingError(f"{failed} batch job(s) failed.")
 
-def handle_extract_frames(args: argparse.Namespace) -> None:
-    """Handle the extract-frames subcommand."""
-    input_path: Path = args.input
-    output_dir: Path = args.output
-    ensure_input_file(input_path)
-    ensure_output_dir(output_dir)
 
-    start, end = resolve_time_range(args.start, args.end, args.duration)
-    fps = args.fps
-    if fps is not None and fps <= 0:
-        raise VideoProcessingError("FPS must be greater than zero.")
+def load_batch_jobs(
+    config_path: Path, backend: str = "auto", hwaccel: str = "none"
+) -> List[argparse.Namespace]:
+    """Load and parse batch jobs, validating every job before any of them runs."""
+    ensure_input_file(config_path)
+    try:
+        jobs = json.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise VideoProcessingError(f"Unable to read batch file '{config_path}': {exc}") from exc
+    if not isinstance(jobs, list):
+        raise VideoProcessingError("Batch file must contain a JSON list of jobs.")
 
-    backend = pick_backend(args.backend)
+    parser = build_parser()
+    parsed: List[argparse.Namespace] = []
+    for index, job in enumerate(jobs, 1):
+        command = job.get("command") if isinstance(job, dict) else None
+        job_args = job.get("args", []) if isinstance(job, dict) else None
+        if command not in _JOB_COMMANDS or not isinstance(job_args, list):
+            raise VideoProcessingError(
+                f"Batch job {index} needs a 'command' (trim, to-gif, extract-frames) "
+                "and a list of 'args'."
+            )
+        try:
+            parsed.append(
+                parser.parse_args(
+                    ["--backend", backend, "--hwaccel", hwaccel, command, *map(str, job_args)]
+                )
+            )
+        except SystemExit as exc:
+            raise VideoProcessingError(f"Batch job {index} has invalid arguments.") from exc
+    return parsed
+
+
+def run_batch(
+    config_path: Path,
+    max_workers: Optional[int] = None,
+    backend: str = "auto",
+    hwaccel: str = "none",
+    threads: Optional[int] = None,
+    filter_threads: Optional[int] = None,
+) -> int:
+    """Run batch jobs concurrently, one ffmpeg/moviepy job per worker process.
+
+    Unless ``threads`` is given, each worker's ffmpeg gets an equal share of
+    the CPUs so the jobs do not oversubscribe the machine.
+
+    Returns:
+        Number of jobs that failed
+    """
+    jobs = load_batch_jobs(config_path, backend, hwaccel)
+    if not jobs:
+        logger.info("No batch jobs to run.")
+        return 0
+
+    cpu_count = os.cpu_count() or 1
+    workers = max(1, min(max_workers or cpu_count, cpu_count, len(jobs)))
+    threads = threads or max(1, cpu_count // workers)
     logger.info(
-        "Extracting frames from %s into %s using %s backend (start=%s, end=%s, fps=%s)",
-        input_path,
-        output_dir,
-        backend,
-        format_seconds(start),
-        format_seconds(end),
-        fps or "source",
+        "Running %s batch job(s) on %s worker(s), %s ffmpeg thread(s) each",
+        len(jobs),
+        workers,
+        threads,
     )
 
-    if backend == "moviepy":
-        count = frames_with_moviepy(
-            input_path,
-            output_dir,
-            start,
-            end,
-            fps,
-            prefix=args.prefix,
-            image_format=args.image_format,
-        )
-    else:
-        count = frames_with_ffmpeg(
-            input_path,
-            output_dir,
-            start,
-            end,
-            fps,
-            prefix=args.prefix,
-            image_format=args.image_format,
-        )
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_ffmpeg_threads, initargs=(threads, filter_threads)
+    ) as executor:
+        futures = [executor.submit(_run_batch_job, job) for job in jobs]
+        for index, (job, future) in enumerate(zip(jobs, futures), 1):
+            error = future.result()
+            if error is None:
+                logger.info("Batch job %s (%s %s) done", index, job.command, job.input)
+            else:
+                failed += 1
+                logger.error(
+                    "Batch job %s (%s %s) failed: %s", index, job.command, job.input, error
+                )
+    return failed
+
+
+def _run_batch_job(args: argparse.Namespace) -> Optional[str]:
+    """Run one parsed job in a worker, returning its error message if it fails."""
+    try:
+        handle_job(args)
+    except (MissingDependencyError, VideoProcessingError) as exc:
+        return str(exc)
+    return None
 
-    logger.info("Extracted %s frame(s) into %s", count, output_dir)
+
+def _output_kwargs(**kwargs: Any) -> Dict[str, Any]:
+    """Add the configured encoder thread limit, if any, to ffmpeg output options."""
+    if _ffmpeg_threads is not None:
+        kwargs.setdefault("threads", _ffmpeg_threads)
+    return kwargs
 
 
 def trim_with_moviepy(
@@ -356,6 +547,7 @@ def trim_with_moviepy(
     end: Optional[float],
     fps: Optional[float],
 ) -> None:
+    moviepy_editor = _load_moviepy()
     if moviepy_editor is None:  # pragma: no cover - defensive
         raise MissingDependencyError("moviepy backend is unavailable.")
 
@@ -369,7 +561,9 @@ def trim_with_moviepy(
         if fps:
             working_clip = working_clip.set_fps(fps)
             clips_to_close.append(working_clip)
-        write_kwargs = {"logger": None}
+        write_kwargs: Dict[str, Any] = {"logger": None}
+        if _ffmpeg_threads is not None:
+            write_kwargs["threads"] = _ffmpeg_threads
         working_clip.write_videofile(str(output_path), **write_kwargs)
     finally:
         close_clips(clips_to_close)
@@ -381,11 +575,17 @@ def trim_with_ffmpeg(
     start: Optional[float],
     end: Optional[float],
     fps: Optional[float],
+    *,
+    reencode: bool = False,
+    hwaccel: Optional[str] = None,
 ) -> None:
+    ffmpeg = _load_ffmpeg()
     if ffmpeg is None:  # pragma: no cover - defensive
         raise MissingDependencyError("ffmpeg backend is unavailable.")
 
-    input_kwargs = {}
+    input_kwargs: Dict[str, Any] = {}
+    if hwaccel:
+        input_kwargs["hwaccel"] = hwaccel
     if start is not None:
         input_kwargs["ss"] = start
     duration: Optional[float] = None
@@ -400,7 +600,13 @@ def trim_with_ffmpeg(
     stream = ffmpeg.input(str(input_path), **input_kwargs)
     if fps:
         stream = stream.filter("fps", fps=fps)
-    stream = ffmpeg.output(stream, str(output_path))
+        output_kwargs = _output_kwargs()
+    elif not reencode and output_path.suffix.lower() == input_path.suffix.lower():
+        # Same container and no filters: copy the streams instead of re-encoding them
+        output_kwargs = _output_kwargs(c="copy", avoid_negative_ts="make_zero")
+    else:
+        output_kwargs = _output_kwargs()
+    stream = ffmpeg.output(stream, str(output_path), **output_kwargs)
     run_ffmpeg(stream)
 
 
@@ -411,6 +617,7 @@ def gif_with_moviepy(
     end: Optional[float],
     fps: Optional[float],
 ) -> None:
+    moviepy_editor = _load_moviepy()
     if moviepy_editor is None:  # pragma: no cover - defensive
         raise MissingDependencyError("moviepy backend is unavailable.")
 
@@ -424,7 +631,11 @@ def gif_with_moviepy(
         if fps:
             working_clip = working_clip.set_fps(fps)
             clips_to_close.append(working_clip)
-        write_kwargs = {"logger": None}
+        write_kwargs: Dict[str, Any] = {"logger": None}
+        if shutil.which("ffmpeg"):
+            # Pipe raw frames into one ffmpeg process instead of imageio's
+            # per-frame PIL quantization
+            write_kwargs["program"] = "ffmpeg"
         working_clip.write_gif(str(output_path), **write_kwargs)
     finally:
         close_clips(clips_to_close)
@@ -436,11 +647,16 @@ def gif_with_ffmpeg(
     start: Optional[float],
     end: Optional[float],
     fps: Optional[float],
+    *,
+    hwaccel: Optional[str] = None,
 ) -> None:
+    ffmpeg = _load_ffmpeg()
     if ffmpeg is None:  # pragma: no cover - defensive
         raise MissingDependencyError("ffmpeg backend is unavailable.")
 
-    input_kwargs = {}
+    input_kwargs: Dict[str, Any] = {}
+    if hwaccel:
+        input_kwargs["hwaccel"] = hwaccel
     if start is not None:
         input_kwargs["ss"] = start
     if end is not None:
@@ -452,7 +668,7 @@ def gif_with_ffmpeg(
     stream = ffmpeg.input(str(input_path), **input_kwargs)
     if fps:
         stream = stream.filter("fps", fps=fps)
-    stream = ffmpeg.output(stream, str(output_path), loop=0)
+    stream = ffmpeg.output(stream, str(output_path), **_output_kwargs(loop=0))
     run_ffmpeg(stream)
 
 
@@ -466,9 +682,23 @@ def frames_with_moviepy(
     prefix: str,
     image_format: str,
 ) -> int:
+    moviepy_editor = _load_moviepy()
     if moviepy_editor is None:  # pragma: no cover - defensive
         raise MissingDependencyError("moviepy backend is unavailable.")
 
+    if _load_ffmpeg() is not None and shutil.which("ffmpeg"):
+        # One ffmpeg pass decodes the segment once; save_frame seeks and
+        # re-encodes through moviepy for every single frame
+        return frames_with_ffmpeg(
+            input_path,
+            output_dir,
+            start,
+            end,
+            fps,
+            prefix=prefix,
+            image_format=image_format,
+        )
+
     clip = moviepy_editor.VideoFileClip(str(input_path))
     clips_to_close = [clip]
     try:
@@ -482,18 +712,15 @@ def frames_with_moviepy(
         duration = float(working_clip.duration or 0.0)
         if duration <= 0:
             raise VideoProcessingError("Selected segment has zero duration.")
-        interval = 1.0 / fps_value
-        frame_time = 0.0
-        count = 0
-        while frame_time < duration:
-            count += 1
-            filename = output_dir / f"{prefix}{count:05d}.{image_format}"
-            working_clip.save_frame(str(filename), t=frame_time)
-            frame_time += interval
-        if count == 0:
-            filename = output_dir / f"{prefix}00001.{image_format}"
-            working_clip.save_frame(str(filename), t=0.0)
-            count = 1
+        # Timestamps come from the frame index rather than a running sum, so
+        # float drift cannot add or drop a frame at the end of the segment
+        count = max(1, math.ceil(duration * fps_value - 1e-9))
+        # Same %05d pattern as the ffmpeg backend, formatted as a plain string
+        # rather than building a Path for every frame
+        name = f"{prefix.replace('%', '%%')}%05d.{image_format.replace('%', '%%')}"
+        template = os.path.join(os.fspath(output_dir), name)
+        for index in range(count):
+            working_clip.save_frame(template % (index + 1), t=index / fps_value)
         return count
     finally:
         close_clips(clips_to_close)
@@ -508,11 +735,15 @@ def frames_with_ffmpeg(
     *,
     prefix: str,
     image_format: str,
+    hwaccel: Optional[str] = None,
 ) -> int:
+    ffmpeg = _load_ffmpeg()
     if ffmpeg is None:  # pragma: no cover - defensive
         raise MissingDependencyError("ffmpeg backend is unavailable.")
 
-    input_kwargs = {}
+    input_kwargs: Dict[str, Any] = {}
+    if hwaccel:
+        input_kwargs["hwaccel"] = hwaccel
     if start is not None:
         input_kwargs["ss"] = start
     if end is not None:
@@ -523,14 +754,75 @@ def frames_with_ffmpeg(
 
     pattern = output_dir / f"{prefix}%05d.{image_format}"
     stream = ffmpeg.input(str(input_path), **input_kwargs)
-    if fps:
+    source_fps = probe_frame_rate(str(input_path)) if fps else None
+    if fps and (source_fps is None or abs(source_fps - fps) >= 1e-3):
         stream = stream.filter("fps", fps=fps)
-    stream = ffmpeg.output(stream, str(pattern), vsync="vfr")
-    run_ffmpeg(stream)
+    # Without an fps filter image2 with vsync=vfr writes every decoded frame
+    stream = ffmpeg.output(stream, str(pattern), **_output_kwargs(vsync="vfr"))
+    stderr = run_ffmpeg(stream)
+
+    # Prefer ffmpeg's own frame counter; it also ignores frames left by earlier runs
+    counts = _FRAME_COUNT_RE.findall(stderr)
+    if counts:
+        return int(counts[-1])
+    return count_frame_files(output_dir, prefix, image_format)
+
+
+def count_frame_files(output_dir: Path, prefix: str, image_format: str) -> int:
+    """Count ``{prefix}NNNNN.{image_format}`` files without building Path objects."""
+    suffix = f".{image_format}"
+    digits_end = len(prefix) + 5
+    count = 0
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                len(name) == digits_end + len(suffix)
+                and name.startswith(prefix)
+                and name.endswith(suffix)
+                and name[len(prefix) : digits_end].isdigit()
+                and entry.is_file()
+            ):
+                count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=128)
+def probe_frame_rate(input_path: str) -> Optional[float]:
+    """Return the constant frame rate of a file's first video stream, if it has one.
+
+    Variable frame rate streams (nominal and average rates differ) and probe
+    failures return None.
+    """
+    ffmpeg = _load_ffmpeg()
+    if ffmpeg is None:  # pragma: no cover - defensive
+        return None
+    try:
+        streams = ffmpeg.probe(input_path).get("streams", [])
+    except Exception:  # noqa: BLE001 - probing is only an optimization
+        logger.debug("Unable to probe %s", input_path, exc_info=True)
+        return None
+
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        return None
+    nominal = _parse_rate(video.get("r_frame_rate"))
+    average = _parse_rate(video.get("avg_frame_rate"))
+    if nominal is None or average is None or abs(nominal - average) >= 1e-3:
+        return None
+    return nominal
 
-    # Estimate the number of frames by counting files matching the prefix
-    matching = list(sorted(output_dir.glob(f"{prefix}[0-9]{{5}}.{image_format}")))
-    return len(matching)
+
+def _parse_rate(value: Optional[str]) -> Optional[float]:
+    """Parse ffprobe rates such as ``30000/1001``."""
+    if not value:
+        return None
+    numerator, _, denominator = value.partition("/")
+    try:
+        rate = float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return rate if rate > 0 else None
 
 
 def close_clips(clips: Iterable[object]) -> None:
@@ -551,15 +843,75 @@ def close_clips(clips: Iterable[object]) -> None:
                 logger.debug("Failed to close clip cleanly", exc_info=True)
 
 
-def run_ffmpeg(stream: object) -> None:
-    """Execute an ffmpeg-python stream and surface errors clearly."""
+def run_ffmpeg(stream: object) -> str:
+    """Execute an ffmpeg-python stream and surface errors clearly.
+
+    stderr is read as it is produced and only the last ``FFMPEG_STDERR_TAIL``
+    lines are kept, so long encodes do not pile their whole log up in memory.
+
+    Returns the tail of ffmpeg's stderr (its last log and progress lines).
+    """
+    ffmpeg = _load_ffmpeg()
     if ffmpeg is None:  # pragma: no cover - defensive
         raise MissingDependencyError("ffmpeg backend is unavailable.")
+    if _ffmpeg_filter_threads is not None:
+        # A global option, so it cannot go through the output kwargs
+        stream = stream.global_args(  # type: ignore[attr-defined]
+            "-filter_threads", str(_ffmpeg_filter_threads)
+        )
     try:
-        ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
-    except ffmpeg.Error as exc:  # type: ignore[attr-defined]
-        stderr = exc.stderr.decode("utf-8", errors="ignore") if exc.stderr else str(exc)
-        raise VideoProcessingError(f"ffmpeg processing failed: {stderr.strip()}") from exc
+        process = ffmpeg.run_async(stream, pipe_stderr=True, overwrite_output=True)
+    except FileNotFoundError as exc:
+        raise MissingDependencyError("The ffmpeg executable was not found on PATH.") from exc
+
+    tail: collections.deque = collections.deque(maxlen=FFMPEG_STDERR_TAIL)
+    pending = b""
+    with process:
+        for chunk in iter(lambda: process.stderr.read1(65536), b""):
+            *lines, pending = _STDERR_LINE_SPLIT_RE.split(pending + chunk)
+            tail.extend(line for line in lines if line.strip())
+        if pending.strip():
+            tail.append(pending)
+        return_code = process.wait()
+
+    stderr = "\n".join(line.decode("utf-8", errors="ignore") for line in tail)
+    if return_code != 0:
+        raise VideoProcessingError(f"ffmpeg processing failed: {stderr.strip()}")
+    return stderr
+
+
+class _JobCommand(NamedTuple):
+    """How ``handle_job`` runs one subcommand on either backend."""
+
+    action: str
+    label: str
+    moviepy: Callable[..., Any]
+    ffmpeg: Callable[..., Any]
+    output_is_dir: bool
+    # Argument names passed through to both backends / to the ffmpeg backend only
+    options: Tuple[str, ...] = ()
+    ffmpeg_options: Tuple[str, ...] = ()
+
+
+_JOB_COMMANDS: Dict[str, _JobCommand] = {
+    "trim": _JobCommand(
+        "Trimming",
+        "trimmed clip",
+        trim_with_moviepy,
+        trim_with_ffmpeg,
+        output_is_dir=False,
+        ffmpeg_options=("reencode",),
+    ),
+    "to-gif": _JobCommand("Converting", "GIF", gif_with_moviepy, gif_with_ffmpeg, False),
+    "extract-frames": _JobCommand(
+        "Extracting frames from",
+        "frames",
+        frames_with_moviepy,
+        frames_with_ffmpeg,
+        output_is_dir=True,
+        options=("prefix", "image_format"),
+    ),
+}
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -580,6 +932,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 2
 
     try:
+        set_ffmpeg_threads(args.threads, args.filter_threads)
         handler(args)
     except MissingDependencyError as exc:
         logger.error(str(exc))
@@ -0,0 +1,20 @@
+"""HTTP helpers shared by the web tools."""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 4, user_agent: str | None = None) -> requests.Session:
+    """Create a keep-alive session that can hold ``pool_size`` connections per host.
+
+    ``user_agent`` replaces the default ``User-Agent`` header when given.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if user_agent is not None:
+        session.headers["User-Agent"] = user_agent
+    return session
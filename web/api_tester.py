@@ -7,13 +7,41 @@ import base64
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
 
 import requests
 
+from ._http import create_session
+
 logger = logging.getLogger(__name__)
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    orjson = None
+
+# Connections kept alive per host by the batch session, and batch tests run at once
+POOL_SIZE = 32
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Parse JSON, preferring ``orjson`` when available.
+
+    Both parsers raise a ``json.JSONDecodeError`` subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize results as indented JSON, preferring ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
 
 def make_request(
     method: str,
@@ -21,16 +49,22 @@ def make_request(
     headers: Dict[str, str] | None = None,
     data: str | None = None,
     timeout: int = 30,
+    session: requests.Session | None = None,
 ) -> Dict[str, Any]:
-    """Make HTTP request and return result."""
+    """Make HTTP request and return result.
+
+    Pass a ``session`` to reuse its pooled connections (and TLS sessions)
+    across calls; otherwise each request opens its own connection.
+    """
     headers = headers or {}
+    requester: Any = session if session is not None else requests
 
     try:
         if method.upper() in ["POST", "PUT", "PATCH"] and data:
             # Try to parse as JSON
             try:
-                json_data = json.loads(data)
-                response = requests.request(
+                json_data = loads_json(data)
+                response = requester.request(
                     method.upper(),
                     url,
                     json=json_data,
@@ -39,7 +73,7 @@ def make_request(
                 )
             except json.JSONDecodeError:
                 # Send as form data
-                response = requests.request(
+                response = requester.request(
                     method.upper(),
                     url,
                     data=data,
@@ -47,7 +81,7 @@ def make_request(
                     timeout=timeout,
                 )
         else:
-            response = requests.request(
+            response = requester.request(
                 method.upper(),
                 url,
                 headers=headers,
@@ -58,14 +92,19 @@ def make_request(
             "success": True,
             "status_code": response.status_code,
             "headers": dict(response.headers),
-            "body": response.text,
+            "body": None,
         }
 
-        # Try to parse JSON response
+        # Parse JSON straight from the raw bytes, once. JSON is UTF-8 unless the
+        # server says otherwise, so its text skips requests' charset detection,
+        # which is slow on large bodies. A body that is not JSON (or not even
+        # UTF-8) falls back to requests' decoded text.
         try:
-            result["json"] = response.json()
-        except json.JSONDecodeError:
-            pass
+            parsed = loads_json(response.content)
+            result["body"] = response.content.decode(response.encoding or "utf-8", errors="replace")
+            result["json"] = parsed
+        except (ValueError, LookupError):
+            result["body"] = response.text
 
         return result
 
@@ -80,8 +119,9 @@ def parse_headers(header_list: list[str]) -> Dict[str, str]:
     """Parse header strings into dict."""
     headers = {}
     for h in header_list:
-        if ":" in h:
-            key, value = h.split(":", 1)
+        # One scan for the first colon instead of a membership test plus split
+        key, sep, value = h.partition(":")
+        if sep:
             headers[key.strip()] = value.strip()
     return headers
 
@@ -128,45 +168,59 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def run_batch_tests(config_file: Path) -> int:
-    """Run batch tests from config file."""
-    with config_file.open("r") as f:
-        config = json.load(f)
+def _run_test(test: Dict[str, Any], session: requests.Session | None = None) -> Dict[str, Any]:
+    """Run one batch test and evaluate its assertions."""
+    name = test.get("name", "Unnamed test")
+    logger.info(f"Running test: {name}")
 
-    tests = config.get("tests", [])
-    results = []
+    headers = test.get("headers", {})
+    if test.get("auth"):
+        add_auth(headers, test["auth"].get("type"), test["auth"].get("value"))
+
+    result = make_request(
+        method=test.get("method", "GET"),
+        url=test["url"],
+        headers=headers,
+        data=test.get("data"),
+        timeout=test.get("timeout", 30),
+        session=session,
+    )
 
-    for test in tests:
-        name = test.get("name", "Unnamed test")
-        logger.info(f"Running test: {name}")
+    result["test_name"] = name
+
+    # Check assertions
+    assertions = test.get("assert", {})
+    if assertions:
+        result["assertions"] = {}
+        if "status_code" in assertions:
+            expected = assertions["status_code"]
+            actual = result.get("status_code")
+            result["assertions"]["status_code"] = (
+                expected == actual,
+                f"Expected {expected}, got {actual}",
+            )
 
-        headers = test.get("headers", {})
-        if test.get("auth"):
-            add_auth(headers, test["auth"].get("type"), test["auth"].get("value"))
+    return result
 
-        result = make_request(
-            method=test.get("method", "GET"),
-            url=test["url"],
-            headers=headers,
-            data=test.get("data"),
-            timeout=test.get("timeout", 30),
-        )
 
-        result["test_name"] = name
+def run_batch_tests(config_file: Path) -> int:
+    """Run batch tests from config file."""
+    config = loads_json(config_file.read_bytes())
 
-        # Check assertions
-        assertions = test.get("assert", {})
-        if assertions:
-            result["assertions"] = {}
-            if "status_code" in assertions:
-                expected = assertions["status_code"]
-                actual = result.get("status_code")
-                result["assertions"]["status_code"] = (expected == actual, f"Expected {expected}, got {actual}")
+    tests = config.get("tests", [])
 
-        results.append(result)
+    # One session for the batch so tests against the same host reuse connections;
+    # tests are independent and network-bound, so they run on a thread pool
+    # (map keeps results in config order)
+    with create_session(POOL_SIZE) as session:
+        if len(tests) > 1:
+            with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(tests))) as executor:
+                results = list(executor.map(lambda test: _run_test(test, session), tests))
+        else:
+            results = [_run_test(test, session) for test in tests]
 
     # Print results
-    print(json.dumps(results, indent=2))
+    print(dumps_json(results))
 
     # Return 0 if all tests passed
     failed = sum(
@@ -215,10 +269,10 @@ def main() -> int:
         timeout=args.timeout,
     )
 
-    output = json.dumps(result, indent=2)
+    output = dumps_json(result)
 
     if args.output:
-        args.output.write_text(output)
+        args.output.write_text(output, encoding="utf-8")
         logger.info(f"Response saved to {args.output}")
     else:
         print(output)
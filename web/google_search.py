@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import subprocess
 import sys
 import webbrowser
 from typing import Optional
@@ -21,6 +23,10 @@ except Exception:  # noqa: BLE001
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the platform opener to fail before assuming it handed the
+# URL to a browser (xdg-open may keep running for as long as the browser does)
+OPENER_WAIT = 1.0
+
 
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -41,6 +47,41 @@ def build_google_url(query: str) -> str:
     return f"https://www.google.com/search?q={quote_plus(query)}"
 
 
+def open_url(url: str) -> bool:
+    """Open ``url`` with the OS default handler, falling back to ``webbrowser``.
+
+    Launching the platform opener directly skips ``webbrowser``'s probing of
+    every registered browser candidate. xdg-open is only tried when there is a
+    display to open on, and a non-zero exit still falls back to ``webbrowser``.
+    """
+    try:
+        if sys.platform == "win32":
+            os.startfile(url)  # type: ignore[attr-defined]
+            return True
+        if sys.platform == "darwin":
+            opener = "open"
+        elif os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+            opener = "xdg-open"
+        else:
+            return webbrowser.open(url)
+        proc = subprocess.Popen(
+            [opener, url],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        try:
+            returncode = proc.wait(timeout=OPENER_WAIT)
+        except subprocess.TimeoutExpired:
+            return True
+        if returncode == 0:
+            return True
+        logger.debug(f"{opener} exited with status {returncode}")
+    except OSError as ex:
+        logger.debug(f"Default URL opener failed: {ex}")
+    return webbrowser.open(url)
+
+
 def perform_search(query: str) -> None:
     # Try pywhatkit first
     if kit is not None:
@@ -53,9 +94,9 @@ def perform_search(query: str) -> None:
         except Exception as ex:  # noqa: BLE001
             logger.debug(f"pywhatkit search failed: {ex}")
 
-    # Fallback to webbrowser
+    # Fallback to the default browser
     url = build_google_url(query)
-    opened = webbrowser.open(url)
+    opened = open_url(url)
     logger.info(f"Opened: {url}" if opened else f"Please open manually: {url}")
 
 
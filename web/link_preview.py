@@ -2,26 +2,57 @@
 
 Usage:
   python -m web.link_preview https://example.com --json out.json --download-image --out-card preview.png
+
+Card rendering is plain Pillow; installing ``pillow-simd`` built against
+libjpeg-turbo in its place speeds up the image decode and resize without
+any code changes.
 """
 
 from __future__ import annotations
 
 import argparse
+import html as html_lib
 import json
 import logging
+import re
 import sys
 from dataclasses import asdict, dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup, Tag
 from PIL import Image
 
+from ._http import create_session
+
+try:  # pragma: no cover - optional dependency
+    import lxml  # type: ignore  # noqa: F401
+except Exception:  # pragma: no cover - import guard
+    lxml = None
+
+try:  # pragma: no cover - optional dependency
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup tree builder for when selectolax is missing: libxml2's C
+# tokenizer when lxml is installed, the pure-Python one otherwise
+HTML_PARSER = "lxml" if lxml is not None else "html.parser"
+
+# fetch_html stops reading once </head> arrives or this many bytes are in
+HEAD_READ_LIMIT = 256 * 1024
+_HEAD_END_RE = re.compile(rb"</head\s*>", re.IGNORECASE)
+
+
+# Shared by the page, image and card fetches: OG images are often served from
+# the page's own host, so the later requests skip the TCP/TLS handshake
+_SESSION = create_session()
+
 
 @dataclass
 class LinkPreview:
@@ -68,10 +99,23 @@ def fetch_html(url: str, timeout: int) -> Tuple[str, str]:
         headers = {
             "User-Agent": "Mozilla/5.0 (compatible; LinkPreviewBot/1.0; +https://example.com)"
         }
-        resp = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
-        resp.raise_for_status()
-        final_url = resp.url
-        return resp.text, final_url
+        with _SESSION.get(
+            url, timeout=timeout, headers=headers, allow_redirects=True, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            # Only <head> is parsed, so the article body is never downloaded
+            buf = bytearray()
+            for chunk in resp.iter_content(chunk_size=16384):
+                # Start a little before the new chunk in case the tag was split
+                search_from = max(0, len(buf) - 8)
+                buf += chunk
+                if _HEAD_END_RE.search(buf, search_from) or len(buf) >= HEAD_READ_LIMIT:
+                    break
+            try:
+                html = buf.decode(resp.encoding or "utf-8", errors="replace")
+            except LookupError:  # unknown charset in the Content-Type header
+                html = buf.decode("utf-8", errors="replace")
+            return html, resp.url
     except requests.RequestException as ex:
         raise LinkPreviewError(f"Failed to fetch URL: {ex}") from ex
 
@@ -87,42 +131,153 @@ def get_attr_str(tag: Tag, attr: str) -> Optional[str]:
     return val if isinstance(val, str) else None
 
 
-def extract_meta(url: str, html: str) -> LinkPreview:
-    soup = BeautifulSoup(html, "html.parser")
-    # Canonical
-    canonical = soup.select_one("link[rel=canonical]")
-    canonical_href = (
-        get_attr_str(canonical, "href") if isinstance(canonical, Tag) else None
-    )
-    canonical_url = absolutize(url, canonical_href)
+# canonical href, icon href, <title> text, meta description, og:* map, twitter:* map
+HeadTags = Tuple[
+    Optional[str], Optional[str], Optional[str], Optional[str], Dict[str, str], Dict[str, str]
+]
 
-    # Favicon
-    icon = soup.select_one("link[rel~='icon'], link[rel~='shortcut icon']")
-    icon_href = get_attr_str(icon, "href") if isinstance(icon, Tag) else None
-    favicon_url = absolutize(url, icon_href)
-
-    # Title / description basics
-    title_tag = soup.find("title")
-    title = title_tag.get_text(strip=True) if title_tag else None
-    desc_tag = soup.find("meta", attrs={"name": "description"})
-    description = (
-        get_attr_str(desc_tag, "content") if isinstance(desc_tag, Tag) else None
-    )
 
-    # OpenGraph and Twitter
+def _split_social(
+    pairs: Iterable[Tuple[Optional[str], Optional[str]]],
+) -> Tuple[Dict[str, str], Dict[str, str]]:
     og: Dict[str, str] = {}
     tw: Dict[str, str] = {}
-    for tag in soup.find_all("meta"):
-        if not isinstance(tag, Tag):
+    for prop, content in pairs:
+        # One prefix test for both maps; the first letter tells them apart
+        if content and prop and prop.startswith(("og:", "twitter:")):
+            (og if prop[0] == "o" else tw)[prop] = content
+    return og, tw
+
+
+# Regex fast path: cut the document at </head>, drop comments/scripts/styles
+# (whose text could contain tag look-alikes), then scan the remaining tags
+_HEAD_CLOSE_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_HEAD_NOISE_RE = re.compile(
+    r"<!--.*?-->|<(script|style|noscript)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_HEAD_TAG_RE = re.compile(
+    r"<(meta|link)\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>|<title\b[^>]*>(.*?)</title\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
+
+
+def _tag_attrs(text: str) -> Dict[str, Optional[str]]:
+    attrs: Dict[str, Optional[str]] = {}
+    for match in _ATTR_RE.finditer(text):
+        name = match.group(1).lower()
+        if name in attrs:  # like HTML parsers, the first duplicate wins
+            continue
+        if match.lastindex is None or match.lastindex == 1:  # no "=value"
+            attrs[name] = None
+            continue
+        value = match.group(match.lastindex)
+        attrs[name] = html_lib.unescape(value) if "&" in value else value
+    return attrs
+
+
+def scan_head_regex(html: str) -> Optional[HeadTags]:
+    """Read the preview tags with regexes over the ``<head>`` markup, building no tree.
+
+    Returns ``None`` when the markup has no ``</head>`` or no meta tags, so the
+    caller can fall back to a real HTML parser.
+    """
+    head_end = _HEAD_CLOSE_RE.search(html)
+    if head_end is None:
+        return None
+    head = _HEAD_NOISE_RE.sub("", html[: head_end.start()])
+
+    canonical_href = icon_href = title = description = None
+    found_canonical = found_icon = found_title = found_description = False
+    pairs = []
+    for match in _HEAD_TAG_RE.finditer(head):
+        tag = match.group(1)
+        if tag is None:
+            if not found_title:
+                found_title = True
+                title = html_lib.unescape(match.group(3)).strip()
             continue
-        prop = get_attr_str(tag, "property") or get_attr_str(tag, "name")
-        content = get_attr_str(tag, "content")
-        if not prop or not content:
+        attrs = _tag_attrs(match.group(2))
+        if tag.lower() == "link":
+            rel = attrs.get("rel") or ""
+            if not found_canonical and rel == "canonical":
+                found_canonical = True
+                canonical_href = attrs.get("href")
+            if not found_icon and "icon" in rel.split():
+                found_icon = True
+                icon_href = attrs.get("href")
             continue
-        if prop.startswith("og:"):
-            og[prop] = content
-        if prop.startswith("twitter:"):
-            tw[prop] = content
+        name = attrs.get("name")
+        if not found_description and name == "description":
+            found_description = True
+            description = attrs.get("content")
+        if "property" in attrs or "name" in attrs:
+            pairs.append((attrs.get("property") or name, attrs.get("content")))
+    if not pairs:
+        return None
+    og, tw = _split_social(pairs)
+    return canonical_href, icon_href, title, description, og, tw
+
+
+def scan_head_lexbor(html: str) -> HeadTags:
+    """Read the preview tags with selectolax's lexbor parser (C, no Tag objects)."""
+    tree = LexborHTMLParser(html)
+    # Everything we read lives in <head>; skip the (usually much larger) body
+    head = tree.head or tree
+    canonical = head.css_first("link[rel=canonical]")
+    icon = head.css_first("link[rel~='icon'], link[rel~='shortcut icon']")
+    title_node = head.css_first("title")
+    desc_node = head.css_first("meta[name=description]")
+    og, tw = _split_social(
+        (attrs.get("property") or attrs.get("name"), attrs.get("content"))
+        for attrs in (node.attributes for node in head.css("meta[property], meta[name]"))
+    )
+    return (
+        canonical.attributes.get("href") if canonical is not None else None,
+        icon.attributes.get("href") if icon is not None else None,
+        title_node.text(strip=True) if title_node is not None else None,
+        desc_node.attributes.get("content") if desc_node is not None else None,
+        og,
+        tw,
+    )
+
+
+def scan_head_soup(html: str) -> HeadTags:
+    """Read the preview tags with BeautifulSoup."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    head = soup.head or soup
+    canonical = head.select_one("link[rel=canonical]")
+    icon = head.select_one("link[rel~='icon'], link[rel~='shortcut icon']")
+    title_tag = head.find("title")
+    desc_tag = head.find("meta", attrs={"name": "description"})
+    og, tw = _split_social(
+        (
+            get_attr_str(tag, "property") or get_attr_str(tag, "name"),
+            get_attr_str(tag, "content"),
+        )
+        for tag in head.find_all("meta")
+        if isinstance(tag, Tag)
+    )
+    return (
+        get_attr_str(canonical, "href") if isinstance(canonical, Tag) else None,
+        get_attr_str(icon, "href") if isinstance(icon, Tag) else None,
+        title_tag.get_text(strip=True) if title_tag else None,
+        get_attr_str(desc_tag, "content") if isinstance(desc_tag, Tag) else None,
+        og,
+        tw,
+    )
+
+
+def extract_meta(url: str, html: str) -> LinkPreview:
+    # lexbor when installed: it out-runs the regexes once a head has more than a
+    # handful of tags. Otherwise the regexes, with BeautifulSoup as the backstop
+    if LexborHTMLParser is not None:
+        tags = scan_head_lexbor(html)
+    else:
+        tags = scan_head_regex(html) or scan_head_soup(html)
+    canonical_href, icon_href, title, description, og, tw = tags
+    canonical_url = absolutize(url, canonical_href)
+    favicon_url = absolutize(url, icon_href)
 
     # Prefer OG/Twitter values when available
     site_name = og.get("og:site_name")
@@ -152,7 +307,7 @@ def extract_meta(url: str, html: str) -> LinkPreview:
 
 def download_image(image_url: str, out_path: Path, timeout: int) -> None:
     try:
-        resp = requests.get(image_url, timeout=timeout, stream=True)
+        resp = _SESSION.get(image_url, timeout=timeout, stream=True)
         resp.raise_for_status()
         out_path.parent.mkdir(parents=True, exist_ok=True)
         with open(out_path, "wb") as f:
@@ -164,16 +319,46 @@ def download_image(image_url: str, out_path: Path, timeout: int) -> None:
         raise LinkPreviewError(f"Failed to download image: {ex}") from ex
 
 
-def render_card(meta: LinkPreview, out_path: Path, timeout: int) -> None:
+# Modes that can be thumbnailed before the RGB conversion with the same result,
+# so the conversion runs on card-sized pixels (or, for RGB, not at all)
+_RESIZE_FIRST_MODES = ("RGB", "L", "CMYK")
+
+
+def _load_card_image(img: Image.Image, width: int, height: int) -> Image.Image:
+    # JPEGs decode straight at the smallest 1/2, 1/4 or 1/8 DCT scale still at
+    # least twice the card size; a no-op for other formats
+    img.draft("RGB", (width * 2, height * 2))
+    # thumbnail() only reads the pixels when it has to shrink, so decode them
+    # now while the caller still has the file or stream open
+    img.load()
+    if img.mode not in _RESIZE_FIRST_MODES:
+        img = img.convert("RGB")
+    # Bilinear is plenty for a downscaled card background and cheaper than
+    # the default Lanczos filter
+    img.thumbnail((width, height), Image.Resampling.BILINEAR)
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+
+def render_card(
+    meta: LinkPreview, out_path: Path, timeout: int, image_path: Optional[Path] = None
+) -> None:
+    """Render a small preview card.
+
+    ``image_path`` points at an already downloaded copy of ``meta.image`` so
+    the card does not fetch it a second time.
+    """
     # Very minimal: 800x420 card with background from image (if available) and a text strip
     width, height = 800, 420
     bg = Image.new("RGB", (width, height), (30, 30, 30))
     if meta.image:
         try:
-            resp = requests.get(meta.image, timeout=timeout, stream=True)
-            resp.raise_for_status()
-            img = Image.open(BytesIO(resp.content)).convert("RGB")
-            img.thumbnail((width, height))
+            if image_path is not None:
+                with Image.open(image_path) as source:
+                    img = _load_card_image(source, width, height)
+            else:
+                resp = _SESSION.get(meta.image, timeout=timeout)
+                resp.raise_for_status()
+                img = _load_card_image(Image.open(BytesIO(resp.content)), width, height)
             x = (width - img.width) // 2
             y = (height - img.height) // 2
             bg.paste(img, (x, y))
@@ -229,6 +414,7 @@ def main() -> int:
     else:
         print(json.dumps(asdict(meta), ensure_ascii=False, indent=2))
 
+    downloaded_image: Optional[Path] = None
     if args.download_image and meta.image:
         if not args.image_out:
             logger.error("--image-out is required when using --download-image")
@@ -238,10 +424,11 @@ def main() -> int:
         except LinkPreviewError as ex:
             logger.error(str(ex))
             return 1
+        downloaded_image = args.image_out
 
     if args.out_card:
         try:
-            render_card(meta, args.out_card, args.timeout)
+            render_card(meta, args.out_card, args.timeout, image_path=downloaded_image)
         except LinkPreviewError as ex:
             logger.error(str(ex))
             return 1
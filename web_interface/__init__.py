@@ -1,3 +1,3 @@
-"""Web interface for browsing pyutils tools."""
-
-__version__ = '1.0.0'
+"""Web interface for browsing pyutils tools."""
+
+__version__ = '1.0.0'
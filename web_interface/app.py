@@ -1,14 +1,33 @@
 """Flask web interface for browsing pyutils tools."""
 
+import functools
+import gzip
+import hashlib
+import importlib
+import io
 import json
 import logging
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.forkserver
+import os
 import shlex
 import subprocess
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
 from tool_indexer import ToolIndexer
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    orjson = None
+
 app = Flask(__name__)
 logger = logging.getLogger(__name__)
 
@@ -64,27 +83,161 @@ ALLOWED_MODULES = {
     "ttrpg.random_table",
 }
 
-# Load or create tool index
-tools_data = []
+# Tools whose ``main(argv)`` can run in a child of the fork server.
+# Their modules are preloaded there, so a run skips the interpreter start-up and
+# imports that ``python -m`` pays on every request; it still gets its own
+# process, so output, logging, globals and the timeout behave as before
+FORKED_MODULES = {
+    "ttrpg.name_generator",
+    "ttrpg.npc_generator",
+    "video.video_toolbox",
+    "web.url_status_checker",
+}
+EXECUTE_TIMEOUT = 30
+# The fork server is a single-threaded process started once; each run is forked
+# from it rather than from this threaded server, so a child only holds the pipe
+# it reports on, never the sockets and pipes of other in-flight requests
+_FORKSERVER_CONTEXT = (
+    multiprocessing.get_context("forkserver")
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else None
+)
+_forkserver_lock = threading.Lock()
+_forkserver_started = False
+_module_mains: dict[str, Callable[..., Any]] = {}
+
+# Tool index, loaded on first use by get_tools_data()
+tools_data: Optional[list[dict[str, Any]]] = None
+# Held while the index is built or reloaded. The page requests /api/categories
+# and /api/tools together, and only one of them should build and save it
+_tools_lock = threading.Lock()
+# Lookups rebuilt by set_tools_data() whenever the index changes
+_tools_by_key: dict[tuple[str, str], dict[str, Any]] = {}
+_tools_by_category: dict[str, list[dict[str, Any]]] = {}
+# Category (None for all tools) -> (tool, lowercased "name\0description\0deps...")
+# pairs, so /api/tools searches with one substring test per tool
+_search_index: dict[Optional[str], list[tuple[dict[str, Any], str]]] = {}
+# /api/categories and /api/stats payloads; they only change with the index
+_category_counts: dict[str, int] = {}
+_stats: dict[str, Any] = {}
+# Bumped by set_tools_data(); part of the cache keys of the encoded responses
+_index_version = 0
+
+# Encoded JSON bodies at least this large are also kept gzip-compressed
+GZIP_MIN_SIZE = 1024
+
+
+def set_tools_data(tools):
+    """Install a new tool index and rebuild the lookups derived from it."""
+    global tools_data, _tools_by_key, _tools_by_category, _search_index, _category_counts, _stats
+    global _index_version
+
+    by_category = {}
+    search_index = {None: []}
+    for tool in tools:
+        by_category.setdefault(tool["category"], []).append(tool)
+        haystack = "\0".join(
+            [tool["name"], tool.get("description", ""), *tool.get("dependencies", [])]
+        ).lower()
+        search_index[None].append((tool, haystack))
+        search_index.setdefault(tool["category"], []).append((tool, haystack))
+
+    tools_data = tools
+    _tools_by_key = {(t["category"], t["name"]): t for t in tools}
+    _tools_by_category = by_category
+    _search_index = search_index
+    _category_counts = {cat: len(cat_tools) for cat, cat_tools in by_category.items()}
+    _stats = {
+        "total_tools": len(tools),
+        "categories": len(by_category),
+        "category_breakdown": dict(_category_counts),
+    }
+    _index_version += 1
 
 
 def load_tools_index():
     """Load tools index from JSON or create if missing."""
-    global tools_data
-
     if not INDEX_FILE.exists():
         logger.info("Index not found, creating...")
         indexer = ToolIndexer(str(ROOT_DIR))
         indexer.index_all_tools()
         indexer.save_index()
 
-    with INDEX_FILE.open(encoding="utf-8") as f:
-        tools_data = json.load(f)
+    data = INDEX_FILE.read_bytes()
+    tools = orjson.loads(data) if orjson is not None else json.loads(data)
+    set_tools_data(tools)
 
-    logger.info(f"Loaded {len(tools_data)} tools")
+    logger.info(f"Loaded {len(tools)} tools")
+    return tools
+
+
+def get_tools_data():
+    """Return the tool index, loading it on the first call."""
+    if tools_data is None:
+        with _tools_lock:
+            # Another request may have loaded it while this one waited
+            if tools_data is None:
+                return load_tools_index()
     return tools_data
 
 
+def json_response(payload, status: int = 200, conditional: bool = False):
+    """Return ``payload`` as a JSON response, serialized with orjson when available.
+
+    With ``conditional``, the response carries an ETag and becomes an empty 304
+    when the request's ``If-None-Match`` already matches it.
+    """
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+    else:
+        response = Response(orjson.dumps(payload), status=status, mimetype="application/json")
+    if conditional:
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
+class EncodedJSON(NamedTuple):
+    """A serialized JSON body with its ETag and, if worth it, a gzipped copy."""
+
+    body: bytes
+    etag: str
+    gzipped: Optional[bytes]
+
+
+def encode_json(payload) -> EncodedJSON:
+    """Serialize ``payload`` once so cached responses skip re-encoding it."""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = app.json.dumps(payload).encode("utf-8")
+    gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+    return EncodedJSON(body, hashlib.blake2b(body, digest_size=8).hexdigest(), gzipped)
+
+
+def encoded_response(encoded: EncodedJSON):
+    """Serve an ``EncodedJSON``, gzipped when the client accepts it, or a 304."""
+    response = Response(mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    if encoded.gzipped is not None and "gzip" in request.accept_encodings:
+        response.set_data(encoded.gzipped)
+        response.headers["Content-Encoding"] = "gzip"
+        # Each representation needs its own validator
+        response.set_etag(f"{encoded.etag}-gzip")
+    else:
+        response.set_data(encoded.body)
+        response.set_etag(encoded.etag)
+    return response.make_conditional(request)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 @app.route("/")
 def index():
     """Main page."""
@@ -96,37 +249,58 @@ def get_tools():
     """Get all tools or search."""
     category = request.args.get("category", "")
     search = request.args.get("search", "").lower()
+    get_tools_data()
+    return encoded_response(_tools_listing(category, search, _index_version))
+
 
+@functools.lru_cache(maxsize=128)
+def _tools_listing(category: str, search: str, index_version: int) -> EncodedJSON:
     filtered_tools = tools_data
 
     # Filter by category
-    if category and category != "all":
-        filtered_tools = [t for t in filtered_tools if t["category"] == category]
+    key = category if category and category != "all" else None
+    if key is not None:
+        filtered_tools = _tools_by_category.get(key, [])
 
     # Search in name, description, and dependencies
     if search:
-        filtered_tools = [
-            t
-            for t in filtered_tools
-            if search in t["name"].lower()
-            or search in t.get("description", "").lower()
-            or any(search in dep.lower() for dep in t.get("dependencies", []))
-        ]
+        filtered_tools = [t for t, haystack in _search_index.get(key, ()) if search in haystack]
 
-    return jsonify(filtered_tools)
+    return encode_json(filtered_tools)
 
 
 @app.route("/api/tool/<category>/<tool_name>")
 def get_tool_detail(category, tool_name):
     """Get detailed information about a specific tool."""
-    tool = next(
-        (t for t in tools_data if t["category"] == category and t["name"] == tool_name),
-        None,
-    )
+    get_tools_data()
+    tool = _tools_by_key.get((category, tool_name))
 
     if not tool:
         return jsonify({"error": "Tool not found"}), 404
 
+    # The body only changes with the index, the tool's source or the README
+    tool_file = ROOT_DIR / tool["file_path"]
+    return encoded_response(
+        _tool_detail(
+            category,
+            tool_name,
+            _mtime_ns(tool_file),
+            _mtime_ns(ROOT_DIR / "README.md"),
+            _index_version,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _tool_detail(
+    category: str,
+    tool_name: str,
+    source_mtime_ns: Optional[int],
+    readme_mtime_ns: Optional[int],
+    index_version: int,
+) -> EncodedJSON:
+    tool = _tools_by_key[(category, tool_name)]
+
     # Read the actual source code
     tool_file = ROOT_DIR / tool["file_path"]
     source_code = ""
@@ -137,79 +311,290 @@ def get_tool_detail(category, tool_name):
     # Try to find examples from README
     examples = extract_examples_for_tool(tool_name)
 
-    return jsonify({**tool, "source_code": source_code, "examples": examples})
+    return encode_json({**tool, "source_code": source_code, "examples": examples})
+
+
+# README fenced code blocks as (text, stripped text), parsed once per README
+# version (st_mtime_ns), and the examples already looked up per tool name
+_readme_mtime_ns = None
+_readme_blocks: list[tuple[str, str]] = []
+_examples_by_tool: dict[str, list[str]] = {}
+
+
+def _parse_code_blocks(content: str) -> list[tuple[str, str]]:
+    blocks = []
+    in_code_block = False
+    current_block: list[str] = []
+
+    for line in content.split("\n"):
+        if line.startswith("```"):
+            if in_code_block:
+                block_text = "\n".join(current_block)
+                blocks.append((block_text, block_text.strip()))
+                current_block = []
+            in_code_block = not in_code_block
+        elif in_code_block:
+            current_block.append(line)
+    return blocks
 
 
 def extract_examples_for_tool(tool_name: str) -> list[str]:
     """Extract usage examples for a tool from README."""
+    global _readme_mtime_ns, _readme_blocks, _examples_by_tool
+
     readme_path = ROOT_DIR / "README.md"
-    if not readme_path.exists():
+    try:
+        mtime_ns = readme_path.stat().st_mtime_ns
+    except OSError:
         return []
 
-    examples: list[str] = []
     try:
-        with readme_path.open(encoding="utf-8") as f:
-            content = f.read()
-
-        # Look for code blocks that mention the tool
-        in_code_block = False
-        current_block: list[str] = []
-
-        for line in content.split("\n"):
-            if line.startswith("```"):
-                if in_code_block:
-                    block_text = "\n".join(current_block)
-                    if tool_name in block_text:
-                        examples.append(block_text.strip())
-                    current_block = []
-                in_code_block = not in_code_block
-            elif in_code_block:
-                current_block.append(line)
-
+        if mtime_ns != _readme_mtime_ns:
+            with readme_path.open(encoding="utf-8") as f:
+                _readme_blocks = _parse_code_blocks(f.read())
+            _readme_mtime_ns = mtime_ns
+            _examples_by_tool = {}
     except Exception as e:
         logger.error(f"Error extracting examples: {e}")
+        return []
 
-    return examples
+    examples = _examples_by_tool.get(tool_name)
+    if examples is None:
+        # Look for code blocks that mention the tool
+        examples = [stripped for text, stripped in _readme_blocks if tool_name in text]
+        _examples_by_tool[tool_name] = examples
+    return list(examples)
 
 
 @app.route("/api/categories")
 def get_categories():
     """Get list of all categories with counts."""
-    categories = {}
-    for tool in tools_data:
-        cat = tool["category"]
-        categories[cat] = categories.get(cat, 0) + 1
-
-    return jsonify(categories)
+    get_tools_data()
+    return json_response(_category_counts, conditional=True)
 
 
 @app.route("/api/stats")
 def get_stats():
     """Get overall statistics."""
-    stats = {
-        "total_tools": len(tools_data),
-        "categories": len({t["category"] for t in tools_data}),
-        "category_breakdown": {},
-    }
-
-    for tool in tools_data:
-        cat = tool["category"]
-        stats["category_breakdown"][cat] = stats["category_breakdown"].get(cat, 0) + 1
-
-    return jsonify(stats)
+    get_tools_data()
+    return json_response(_stats, conditional=True)
 
 
 @app.route("/api/refresh")
 def refresh_index():
     """Refresh the tool index."""
-    indexer = ToolIndexer(str(ROOT_DIR))
-    indexer.index_all_tools()
-    indexer.save_index()
+    with _tools_lock:
+        indexer = ToolIndexer(str(ROOT_DIR))
+        indexer.index_all_tools()
+        indexer.save_index()
+
+        set_tools_data(indexer.tools)
+
+    return jsonify({"status": "success", "tools_indexed": len(indexer.tools)})
+
+
+def _forkserver_context():
+    """Return the fork server context, starting the server on first use.
+
+    Returns None where fork servers are unsupported (Windows).
+    """
+    global _forkserver_started
+    if _FORKSERVER_CONTEXT is None:
+        return None
+    with _forkserver_lock:
+        if not _forkserver_started:
+            # This module is preloaded too, so children can unpickle the run targets
+            _FORKSERVER_CONTEXT.set_forkserver_preload(
+                list(dict.fromkeys(["__main__", __name__, *sorted(FORKED_MODULES)]))
+            )
+            # The server is a fresh interpreter: it imports from PYTHONPATH, not our sys.path
+            pythonpath = os.environ.get("PYTHONPATH")
+            os.environ["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [str(ROOT_DIR), str(Path(__file__).parent), pythonpath])
+            )
+            try:
+                multiprocessing.forkserver.ensure_running()
+            finally:
+                if pythonpath is None:
+                    os.environ.pop("PYTHONPATH", None)
+                else:
+                    os.environ["PYTHONPATH"] = pythonpath
+            _forkserver_started = True
+    return _FORKSERVER_CONTEXT
+
+
+def _module_main(module_path):
+    main = _module_mains.get(module_path)
+    if main is None:
+        if str(ROOT_DIR) not in sys.path:
+            sys.path.append(str(ROOT_DIR))
+        main = _module_mains[module_path] = importlib.import_module(module_path).main
+    return main
+
+
+def _prepare_forked_child(main, argv):
+    os.chdir(ROOT_DIR)
+    # argparse takes the program name from argv[0], as under ``python -m``
+    sys.argv = [sys.modules[main.__module__].__file__, *argv]
+    # Start from unconfigured logging, as a fresh interpreter would, so the
+    # tool's basicConfig binds to the redirected stderr
+    logging.getLogger().handlers.clear()
+
+
+def _call_main(main, argv):
+    """Run ``main(argv)`` and return its exit code, as ``python -m`` would."""
+    try:
+        code = main(argv)
+    except SystemExit as exc:
+        code = exc.code
+        if not isinstance(code, int):
+            if code is not None:
+                print(code, file=sys.stderr)
+            code = 0 if code is None else 1
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        code = 1
+    logging.shutdown()
+    return code or 0
+
+
+def _run_forked_main(module_path, argv, conn):
+    """Child side of ``run_forked``: run ``main(argv)`` and send back its output."""
+    main = _module_main(module_path)
+    _prepare_forked_child(main, argv)
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        code = _call_main(main, argv)
+    conn.send((code, out.getvalue(), err.getvalue()))
+    conn.close()
+
+
+def _stream_forked_main(module_path, argv, conn):
+    """Child side of ``start_streamed``: run ``main(argv)`` writing its output to ``conn``.
+
+    ``conn`` only carries the write end of a plain pipe into the child; the
+    output is written to it as text, not as pickled messages.
+    """
+    main = _module_main(module_path)
+    _prepare_forked_child(main, argv)
+    fd = os.dup(conn.fileno())
+    conn.close()
+    stream = os.fdopen(fd, "w", encoding="utf-8", buffering=1)
+    with stream, redirect_stdout(stream), redirect_stderr(stream):
+        code = _call_main(main, argv)
+    sys.exit(code)
+
+
+def run_forked(module_path, argv, timeout=EXECUTE_TIMEOUT):
+    """Run ``module_path``'s ``main(argv)`` in a child of the fork server.
+
+    Returns ``(exit_code, stdout, stderr)``, or ``None`` if it timed out.
+    """
+    context = _forkserver_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_forked_main, args=(module_path, argv, sender))
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            return None
+        try:
+            return receiver.recv()
+        except EOFError:  # the child died before reporting back
+            process.join()
+            return process.exitcode or 1, "", ""
+    finally:
+        process.join()
+        receiver.close()
+
+
+class StreamedRun(NamedTuple):
+    """A started tool run: its merged stdout/stderr and how to stop or reap it."""
+
+    output: io.TextIOBase
+    kill: Callable[[], None]
+    wait: Callable[[], int]
+
+
+def start_streamed(module_path, cmd):
+    """Start ``cmd`` with stdout and stderr merged into one readable pipe.
+
+    Modules in ``FORKED_MODULES`` run in a child of the fork server, like
+    ``run_forked``; everything else runs as an unbuffered subprocess so lines
+    arrive as printed.
+    """
+    context = _forkserver_context() if module_path in FORKED_MODULES else None
+    if context is not None:
+        read_fd, write_fd = os.pipe()
+        # A Connection pickles as a passed descriptor, so the child gets the write end
+        writer = multiprocessing.connection.Connection(write_fd, readable=False)
+        process = context.Process(target=_stream_forked_main, args=(module_path, cmd[3:], writer))
+        process.start()
+        writer.close()
+
+        def wait():
+            process.join()
+            return process.exitcode
+
+        # Owned by the StreamedRun; stream_events closes it
+        output = os.fdopen(read_fd, encoding="utf-8", errors="replace")
+        return StreamedRun(output, process.kill, wait)
+
+    process = subprocess.Popen(
+        cmd,
+        cwd=ROOT_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    return StreamedRun(process.stdout, process.kill, process.wait)
+
+
+def _sse(data, event=None):
+    payload = orjson.dumps(data).decode() if orjson is not None else json.dumps(data)
+    return f"event: {event}\ndata: {payload}\n\n" if event else f"data: {payload}\n\n"
 
-    global tools_data
-    tools_data = indexer.tools
 
-    return jsonify({"status": "success", "tools_indexed": len(tools_data)})
+def stream_events(run, timeout=EXECUTE_TIMEOUT):
+    """Yield ``run``'s output as server-sent events, killing it after ``timeout``.
+
+    Each output line is a ``data:`` event holding a JSON string. A final ``exit``
+    event carries ``success``, ``exit_code`` and, on timeout, ``error``, as the
+    JSON response of ``/api/execute`` does.
+    """
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        run.kill()
+
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    exit_code = None
+    try:
+        for line in run.output:
+            yield _sse(line.rstrip("\n"))
+        exit_code = run.wait()
+    finally:
+        timer.cancel()
+        if exit_code is None:  # the client went away mid-run
+            run.kill()
+            run.wait()
+        run.output.close()
+
+    if timed_out.is_set():
+        result = {
+            "success": False,
+            "exit_code": -1,
+            "error": f"Command timed out after {timeout} seconds",
+        }
+    else:
+        result = {"success": exit_code == 0, "exit_code": exit_code}
+    yield _sse(result, event="exit")
 
 
 @app.route("/api/execute", methods=["POST"])
@@ -247,6 +632,36 @@ def execute_tool():
 
         logger.info(f"Executing: {' '.join(cmd)}")
 
+        # Clients that accept an event stream get the output line by line as the
+        # tool prints it, instead of all at once when it exits
+        accepted = request.accept_mimetypes.best_match(["application/json", "text/event-stream"])
+        if accepted == "text/event-stream":
+            return Response(
+                stream_events(start_streamed(module_path, cmd)),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+
+        if module_path in FORKED_MODULES and _FORKSERVER_CONTEXT is not None:
+            forked = run_forked(module_path, cmd[3:])
+            if forked is None:
+                return jsonify(
+                    {
+                        "success": False,
+                        "exit_code": -1,
+                        "error": f"Command timed out after {EXECUTE_TIMEOUT} seconds",
+                    }
+                )
+            exit_code, output, error = forked
+            return jsonify(
+                {
+                    "success": exit_code == 0,
+                    "exit_code": exit_code,
+                    "output": output,
+                    "error": error,
+                }
+            )
+
         # Execute with timeout
         try:
             result = subprocess.run(
@@ -254,7 +669,7 @@ def execute_tool():
                 cwd=ROOT_DIR,
                 capture_output=True,
                 text=True,
-                timeout=30,  # 30 second timeout
+                timeout=EXECUTE_TIMEOUT,
             )
 
             return jsonify(
@@ -271,7 +686,7 @@ def execute_tool():
                 {
                     "success": False,
                     "exit_code": -1,
-                    "error": "Command timed out after 30 seconds",
+                    "error": f"Command timed out after {EXECUTE_TIMEOUT} seconds",
                 }
             )
 
@@ -282,16 +697,19 @@ def execute_tool():
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    debug = True
+
+    # The reloader runs this block in a parent process that only watches files;
+    # load the tools in the worker process that actually serves requests
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true" or not debug:
+        tools = load_tools_index()
 
-    # Load tools on startup
-    load_tools_index()
+        print("\n" + "=" * 60)
+        print("🔧 PyUtils Tool Browser")
+        print("=" * 60)
+        print(f"📊 Loaded {len(tools)} tools")
+        print("🌐 Starting server at http://localhost:5000")
+        print("=" * 60 + "\n")
 
     # Run Flask app
-    print("\n" + "=" * 60)
-    print("🔧 PyUtils Tool Browser")
-    print("=" * 60)
-    print(f"📊 Loaded {len(tools_data)} tools")
-    print("🌐 Starting server at http://localhost:5000")
-    print("=" * 60 + "\n")
-
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    app.run(debug=debug, host="0.0.0.0", port=5000)
@@ -39,8 +39,9 @@ def test_indexer():
     assert output_path.exists(), "Index file was not created!"
     print(f"✓ Index saved successfully")
 
-    # Clean up test file
+    # Clean up test file and its signature sidecar
     output_path.unlink()
+    indexer.meta_path(output_path).unlink()
 
     return True
 
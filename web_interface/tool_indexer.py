@@ -1,18 +1,145 @@
 """Tool metadata extraction and indexing for pyutils web interface."""
 
+import argparse
 import ast
+import functools
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - import guard
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 100
+# Files in the project root that are never standalone tools
+_ROOT_SKIP = frozenset({"setup.py", "test.py", "__init__.py"})
+# Stored in the index's sidecar; bump it when extract_tool_info's output changes
+# so records cached by an older version are rebuilt
+INDEX_VERSION = 2
+
+# Dependency names listed for a tool, in order, with the source snippets that reveal them
+_DEPENDENCY_MARKERS = (
+    ("typer", ("import typer",)),
+    ("Pillow", ("from PIL", "import PIL")),
+    ("openai", ("import openai",)),
+    ("transformers", ("transformers",)),
+    ("moviepy", ("moviepy",)),
+    ("PDF libraries", ("pdfplumber", "PyPDF2")),
+)
+
+# Capabilities mentioned in a generated long description, in order, with the
+# source snippets that reveal them
+_CONTEXT_MARKERS = (
+    ("image processing", ("PIL", "Image")),
+    ("data analysis", ("pandas", "DataFrame")),
+    ("HTTP requests", ("requests",)),
+    ("command-line interface", ("argparse", "typer")),
+)
+
+# Words in a tool's name or source that hint at what it does -> action verb
+_OPERATION_PATTERNS = {
+    "convert": "Convert",
+    "resize": "Resize",
+    "filter": "Filter",
+    "merge": "Merge",
+    "extract": "Extract",
+    "generate": "Generate",
+    "analyze": "Analyze",
+    "process": "Process",
+    "transform": "Transform",
+    "compare": "Compare",
+    "detect": "Detect",
+    "validate": "Validate",
+    "optimize": "Optimize",
+}
+
+
+# Summaries for tools without a docstring, per category: the first keyword found
+# in the tool's name picks its summary, otherwise the category default applies
+_CATEGORY_FALLBACKS: dict[str, tuple[dict[str, str], str]] = {
+    "images": (
+        {
+            "convert": "Convert images between formats",
+            "resize": "Resize and scale images",
+            "duplicate": "Find and remove duplicate images",
+            "dedup": "Find and remove duplicate images",
+        },
+        "Process and manipulate images",
+    ),
+    "files": (
+        {
+            "duplicate": "Find and manage duplicate files",
+            "rename": "Batch rename files with patterns",
+            "hash": "Generate and verify file checksums",
+        },
+        "Manage and organize files",
+    ),
+    "data": (
+        {
+            "csv": "Process and transform CSV files",
+            "json": "Query and manipulate JSON data",
+        },
+        "Process and analyze data",
+    ),
+    "web": (
+        {
+            "api": "Test and interact with REST APIs",
+            "link": "Generate and process web links",
+        },
+        "Web scraping and processing",
+    ),
+    "pdf": ({}, "Extract and process PDF documents"),
+    "text_nlp": ({}, "Analyze and process text data"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _fallback_short(category: str, tool_name: str, operation: str) -> str:
+    """Short description for a tool whose docstring gives none.
+
+    ``operation`` is the first action detected in the tool, or ``""`` for none.
+    """
+    templates = _CATEGORY_FALLBACKS.get(category)
+    if templates is None:
+        # Generic fallback
+        action = operation or "Process"
+        return f"{action.capitalize()} {' '.join(tool_name.replace('_', ' ').split())}"
+
+    keywords, default = templates
+    return next((summary for word, summary in keywords.items() if word in tool_name), default)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_features(docstring: str) -> tuple[str, ...]:
+    """Return up to three bullet points from a docstring's Features section."""
+    features = []
+    feature_section = False
+    for line in docstring.split("\n"):
+        line = line.strip()
+        if "Features:" in line or "Capabilities:" in line:
+            feature_section = True
+            continue
+        if feature_section and line.startswith(("-", "*", "•")):
+            feature = line.lstrip("-*•").strip()
+            if feature and len(feature) < 100:
+                features.append(feature)
+            if len(features) >= 3:
+                break
+    return tuple(features)
+
 
 class ToolIndexer:
     """Extract metadata from Python CLI tools."""
 
-    TOOL_CATEGORIES = [
+    TOOL_CATEGORIES = (
         "audio",
         "bulk",
         "data",
@@ -26,62 +153,76 @@ class ToolIndexer:
         "ttrpg",
         "video",
         "web",
-    ]
+    )
 
     def __init__(self, root_dir: Optional[str] = None):
         """Initialize indexer with project root directory."""
         self.root_dir = Path(root_dir) if root_dir else Path(__file__).parent.parent
         self.tools: list[dict] = []
+        # file_path -> [st_mtime_ns, st_size] of the files behind self.tools
+        self.file_signatures: dict[str, list[int]] = {}
 
-    def extract_docstring(self, file_path: Path) -> Optional[str]:
-        """Extract module docstring from Python file."""
-        try:
-            with file_path.open(encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-                return ast.get_docstring(tree)
-        except Exception as e:
-            logger.debug(f"Could not extract docstring from {file_path}: {e}")
-            return None
-
-    def extract_typer_commands(self, file_path: Path) -> list[dict]:
-        """Extract Typer command information from Python file."""
+    def extract_docstring(self, tree: ast.Module) -> Optional[str]:
+        """Extract the module docstring from a parsed Python file."""
+        return ast.get_docstring(tree)
+
+    def extract_typer_commands(self, tree: ast.Module, content: Optional[str] = None) -> list[dict]:
+        """Extract Typer command information from a parsed Python file.
+
+        With the file's ``content`` (newline-normalized, as ``Path.read_text``
+        returns it), one-line annotations are sliced from the source instead of
+        being unparsed.
+        """
         commands: list[dict] = []
-        try:
-            with file_path.open(encoding="utf-8") as f:
-                content = f.read()
-                tree = ast.parse(content)
-
-                for node in ast.walk(tree):
-                    # Look for @app.command() decorated functions
-                    if isinstance(node, ast.FunctionDef):
-                        has_command_decorator = any(
-                            isinstance(d, ast.Call)
-                            and isinstance(d.func, ast.Attribute)
-                            and d.func.attr == "command"
-                            for d in node.decorator_list
-                        )
-
-                        if has_command_decorator or node.name == "main":
-                            cmd_info: dict = {
-                                "name": node.name,
-                                "docstring": ast.get_docstring(node),
-                                "args": [],
-                            }
-
-                            # Extract function arguments
-                            for arg in node.args.args:
-                                arg_name = arg.arg
-                                arg_type = None
-                                if arg.annotation:
-                                    arg_type = ast.unparse(arg.annotation)
-                                args_list = cmd_info["args"]
-                                if isinstance(args_list, list):
-                                    args_list.append({"name": arg_name, "type": arg_type})
-
-                            commands.append(cmd_info)
-
-        except Exception as e:
-            logger.debug(f"Could not parse {file_path}: {e}")
+        lines: Optional[list[str]] = None
+
+        # Commands live at module level or, at most, directly inside a class;
+        # top-level functions come first, as they would from a breadth-first walk
+        candidates = list(tree.body)
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ClassDef):
+                candidates.extend(stmt.body)
+
+        for node in candidates:
+            # Look for @app.command() decorated functions
+            if isinstance(node, ast.FunctionDef):
+                has_command_decorator = any(
+                    isinstance(d, ast.Call)
+                    and isinstance(d.func, ast.Attribute)
+                    and d.func.attr == "command"
+                    for d in node.decorator_list
+                )
+
+                if has_command_decorator or node.name == "main":
+                    cmd_info: dict = {
+                        "name": node.name,
+                        "docstring": ast.get_docstring(node),
+                        "args": [],
+                    }
+
+                    # Extract function arguments
+                    for arg in node.args.args:
+                        arg_name = arg.arg
+                        arg_type = None
+                        annotation = arg.annotation
+                        if (
+                            annotation
+                            and content is not None
+                            and (annotation.lineno == annotation.end_lineno)
+                        ):
+                            if lines is None:
+                                lines = content.split("\n")
+                            # Column offsets count UTF-8 bytes
+                            line = lines[annotation.lineno - 1].encode()
+                            segment = line[annotation.col_offset : annotation.end_col_offset]
+                            arg_type = segment.decode()
+                        elif annotation:
+                            arg_type = ast.unparse(annotation)
+                        args_list = cmd_info["args"]
+                        if isinstance(args_list, list):
+                            args_list.append({"name": arg_name, "type": arg_type})
+
+                    commands.append(cmd_info)
 
         return commands
 
@@ -103,7 +244,7 @@ class ToolIndexer:
 
         # Try to extract from docstring first
         if docstring:
-            lines = [line.strip() for line in docstring.split("\n") if line.strip()]
+            lines = [line for line in map(str.strip, docstring.split("\n")) if line]
 
             # First non-empty line is usually the short description
             if lines:
@@ -126,108 +267,34 @@ class ToolIndexer:
             if paragraph_lines:
                 long_desc = " ".join(paragraph_lines)
 
-        # Analyze code patterns for better descriptions
-        patterns = {
-            "convert": "Convert",
-            "resize": "Resize",
-            "filter": "Filter",
-            "merge": "Merge",
-            "extract": "Extract",
-            "generate": "Generate",
-            "analyze": "Analyze",
-            "process": "Process",
-            "transform": "Transform",
-            "compare": "Compare",
-            "detect": "Detect",
-            "validate": "Validate",
-            "optimize": "Optimize",
-        }
-
-        # Detect operations from function names
-        operations = []
-        for pattern, action in patterns.items():
-            if pattern in tool_name.lower() or pattern in content.lower()[:500]:
-                operations.append(action.lower())
+        # Detect operations from the tool name and the top of its source
+        tool_name_lc = tool_name.lower()
+        content_lc_head = content[:500].lower()
+        operations = [
+            action.lower()
+            for pattern, action in _OPERATION_PATTERNS.items()
+            if pattern in tool_name_lc or pattern in content_lc_head
+        ]
 
         # Generate fallback based on tool name and category
         if not short_desc:
-            # Generate from tool name
-            name_parts = tool_name.replace("_", " ").split()
-
-            # Action-oriented templates based on category
-            if category == "images":
-                if "convert" in tool_name:
-                    short_desc = "Convert images between formats"
-                elif "resize" in tool_name:
-                    short_desc = "Resize and scale images"
-                elif "duplicate" in tool_name or "dedup" in tool_name:
-                    short_desc = "Find and remove duplicate images"
-                else:
-                    short_desc = "Process and manipulate images"
-            elif category == "files":
-                if "duplicate" in tool_name:
-                    short_desc = "Find and manage duplicate files"
-                elif "rename" in tool_name:
-                    short_desc = "Batch rename files with patterns"
-                elif "hash" in tool_name:
-                    short_desc = "Generate and verify file checksums"
-                else:
-                    short_desc = "Manage and organize files"
-            elif category == "data":
-                if "csv" in tool_name:
-                    short_desc = "Process and transform CSV files"
-                elif "json" in tool_name:
-                    short_desc = "Query and manipulate JSON data"
-                else:
-                    short_desc = "Process and analyze data"
-            elif category == "web":
-                if "api" in tool_name:
-                    short_desc = "Test and interact with REST APIs"
-                elif "link" in tool_name:
-                    short_desc = "Generate and process web links"
-                else:
-                    short_desc = "Web scraping and processing"
-            elif category == "pdf":
-                short_desc = "Extract and process PDF documents"
-            elif category == "text_nlp":
-                short_desc = "Analyze and process text data"
-            else:
-                # Generic fallback
-                action = operations[0] if operations else "Process"
-                short_desc = f"{action.capitalize()} {' '.join(name_parts)}"
+            short_desc = _fallback_short(category, tool_name, operations[0] if operations else "")
 
         # Enhance long description if missing or too short
         if not long_desc or len(long_desc) < 50:
             # Look for features in docstring
-            features = []
-            if docstring:
-                feature_section = False
-                for line in docstring.split("\n"):
-                    line = line.strip()
-                    if "Features:" in line or "Capabilities:" in line:
-                        feature_section = True
-                        continue
-                    if feature_section and line.startswith(("-", "*", "•")):
-                        feature = line.lstrip("-*•").strip()
-                        if feature and len(feature) < 100:
-                            features.append(feature)
-                        if len(features) >= 3:
-                            break
+            features = _extract_features(docstring) if docstring else ()
 
             # Build enhanced long description
             if features:
                 long_desc = f"{short_desc}. {' '.join(features[:3])}"
             elif not long_desc:
                 # Analyze imports for context
-                context_parts = []
-                if "PIL" in content or "Image" in content:
-                    context_parts.append("image processing")
-                if "pandas" in content or "DataFrame" in content:
-                    context_parts.append("data analysis")
-                if "requests" in content:
-                    context_parts.append("HTTP requests")
-                if "argparse" in content or "typer" in content:
-                    context_parts.append("command-line interface")
+                context_parts = [
+                    part
+                    for part, markers in _CONTEXT_MARKERS
+                    if any(marker in content for marker in markers)
+                ]
 
                 if context_parts:
                     long_desc = f"{short_desc}. Includes {', '.join(context_parts)} capabilities."
@@ -250,37 +317,28 @@ class ToolIndexer:
         """Extract comprehensive metadata from a tool file."""
         tool_name = file_path.stem
 
-        # Skip __init__ files
-        if tool_name == "__init__":
-            return None
-
-        docstring = self.extract_docstring(file_path)
-        commands = self.extract_typer_commands(file_path)
-
-        # Read file to extract additional info
-        content = ""
+        # Read and parse the file once; every extractor works from the same copy
         try:
-            with file_path.open(encoding="utf-8") as f:
-                content = f.read()
-
-            # Check for dependencies
-            imports = []
-            if "import typer" in content:
-                imports.append("typer")
-            if "from PIL" in content or "import PIL" in content:
-                imports.append("Pillow")
-            if "import openai" in content:
-                imports.append("openai")
-            if "transformers" in content:
-                imports.append("transformers")
-            if "moviepy" in content:
-                imports.append("moviepy")
-            if "pdfplumber" in content or "PyPDF2" in content:
-                imports.append("PDF libraries")
-
-        except Exception as e:
+            content = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
             logger.debug(f"Could not read {file_path}: {e}")
-            imports = []
+            content = ""
+
+        try:
+            tree: Optional[ast.Module] = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Could not parse {file_path}: {e}")
+            tree = None
+
+        docstring = self.extract_docstring(tree) if tree else None
+        commands = self.extract_typer_commands(tree, content) if tree else []
+
+        # Check for dependencies
+        imports = [
+            dep
+            for dep, markers in _DEPENDENCY_MARKERS
+            if any(marker in content for marker in markers)
+        ]
 
         # Generate smart descriptions
         short_desc, long_desc = self._generate_smart_descriptions(
@@ -300,40 +358,129 @@ class ToolIndexer:
             "module_path": f"{category}.{tool_name}",
         }
 
-    def index_all_tools(self) -> list[dict]:
-        """Scan all categories and index tools."""
-        self.tools = []
-
+    def find_tool_files(self) -> Iterator[tuple[Path, str]]:
+        """Yield ``(file_path, category)`` for every candidate tool file."""
         for category in self.TOOL_CATEGORIES:
             category_dir = self.root_dir / category
             if not category_dir.exists():
                 logger.warning(f"Category directory not found: {category_dir}")
                 continue
 
-            for py_file in category_dir.glob("*.py"):
-                tool_info = self.extract_tool_info(py_file, category)
-                if tool_info:
-                    self.tools.append(tool_info)
-                    logger.info(f"Indexed: {tool_info['name']} ({category})")
+            with os.scandir(category_dir) as entries:
+                for entry in entries:
+                    # Underscore modules (``__init__``, shared helpers) are not tools
+                    if entry.name.endswith(".py") and not entry.name.startswith("_"):
+                        yield Path(entry.path), category
 
         # Also check root directory for standalone tools
-        for py_file in self.root_dir.glob("*.py"):
-            if py_file.stem not in ["setup", "test", "__init__"]:
-                tool_info = self.extract_tool_info(py_file, "misc")
-                if tool_info:
-                    self.tools.append(tool_info)
-                    logger.info(f"Indexed: {tool_info['name']} (misc)")
+        with os.scandir(self.root_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py") and entry.name not in _ROOT_SKIP:
+                    yield Path(entry.path), "misc"
+
+    def index_path(self, output_file: str = "tool_index.json") -> Path:
+        """Return where ``save_index(output_file)`` writes the index."""
+        return self.root_dir / "web_interface" / output_file
+
+    @staticmethod
+    def meta_path(index_path: Path) -> Path:
+        """Return the sidecar holding the file signatures of ``index_path``."""
+        return index_path.with_name(f"{index_path.stem}.meta.json")
+
+    def load_cached_records(self, output_file: str = "tool_index.json") -> dict:
+        """Return ``file_path -> (signature, record)`` from a previously saved index.
+
+        Empty when the index or its sidecar is missing, unreadable or was written
+        by another ``INDEX_VERSION``.
+        """
+        index_path = self.index_path(output_file)
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            meta = loads(self.meta_path(index_path).read_bytes())
+            tools = loads(index_path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.debug(f"No reusable index at {index_path}: {e}")
+            return {}
+
+        if meta.get("version") != INDEX_VERSION:
+            return {}
+        signatures = meta.get("files", {})
+        return {
+            tool["file_path"]: (signatures[tool["file_path"]], tool)
+            for tool in tools
+            if tool.get("file_path") in signatures
+        }
+
+    def index_all_tools(
+        self, full: bool = False, output_file: str = "tool_index.json"
+    ) -> list[dict]:
+        """Scan all categories and index tools.
 
+        Files whose modification time and size match the sidecar of the index
+        previously saved as ``output_file`` reuse their saved record; ``full``
+        re-parses everything. Large batches (``PARALLEL_MIN_FILES`` or more files)
+        are parsed by a pool of worker processes when more than one CPU is available.
+        """
+        cached = {} if full else self.load_cached_records(output_file)
+
+        jobs = list(self.find_tool_files())
+        results: list[Optional[dict]] = [None] * len(jobs)
+        signatures: list[Optional[list[int]]] = [None] * len(jobs)
+        pending = []
+        for i, (path, _category) in enumerate(jobs):
+            try:
+                stat = path.stat()
+            except OSError:
+                pending.append(i)
+                continue
+            signatures[i] = [stat.st_mtime_ns, stat.st_size]
+            hit = cached.get(str(path.relative_to(self.root_dir)))
+            if hit is not None and hit[0] == signatures[i]:
+                results[i] = hit[1]
+            else:
+                pending.append(i)
+
+        if len(pending) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            worker_jobs = [(type(self), self.root_dir, *jobs[i]) for i in pending]
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(_extract_worker, worker_jobs, chunksize=16))
+        else:
+            parsed = [self.extract_tool_info(*jobs[i]) for i in pending]
+        for i, tool_info in zip(pending, parsed):
+            results[i] = tool_info
+
+        self.tools = []
+        self.file_signatures = {}
+        for tool_info, signature in zip(results, signatures):
+            if tool_info:
+                self.tools.append(tool_info)
+                if signature is not None:
+                    self.file_signatures[tool_info["file_path"]] = signature
+                logger.info(f"Indexed: {tool_info['name']} ({tool_info['category']})")
+
+        reused = len(jobs) - len(pending)
+        if reused:
+            logger.info(f"Reused {reused} unchanged files from the previous index")
         logger.info(f"Total tools indexed: {len(self.tools)}")
         return self.tools
 
     def save_index(self, output_file: str = "tool_index.json"):
-        """Save indexed tools to JSON file."""
-        output_path = self.root_dir / "web_interface" / output_file
+        """Save indexed tools to JSON file.
+
+        A ``<name>.meta.json`` sidecar records each file's signature, so the next
+        ``index_all_tools`` can skip files that did not change.
+        """
+        output_path = self.index_path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(self.tools, f, indent=2)
+        meta = {"version": INDEX_VERSION, "files": self.file_signatures}
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(self.tools, option=orjson.OPT_INDENT_2))
+            self.meta_path(output_path).write_bytes(orjson.dumps(meta))
+        else:
+            with output_path.open("w", encoding="utf-8") as f:
+                json.dump(self.tools, f, indent=2)
+            self.meta_path(output_path).write_text(json.dumps(meta), encoding="utf-8")
 
         logger.info(f"Index saved to: {output_path}")
         return output_path
@@ -347,11 +494,23 @@ class ToolIndexer:
         return categories
 
 
+def _extract_worker(job: tuple[type[ToolIndexer], Path, Path, str]) -> Optional[dict]:
+    """Process-pool entry point for ``ToolIndexer.index_all_tools``."""
+    indexer_class, root_dir, file_path, category = job
+    return indexer_class(str(root_dir)).extract_tool_info(file_path, category)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index the pyutils tools for the web interface.")
+    parser.add_argument(
+        "--full", action="store_true", help="Re-parse every file instead of reusing unchanged ones."
+    )
+    cli_args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
 
     indexer = ToolIndexer()
-    indexer.index_all_tools()
+    indexer.index_all_tools(full=cli_args.full)
     indexer.save_index()
 
     print(f"\nIndexed {len(indexer.tools)} tools")